@@ -1,7 +1,21 @@
 """Automaton implementation."""
-from typing import Collection
-
-from queue import Queue
+from collections import deque
+from typing import (
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from automata.interfaces import (
     AbstractFiniteAutomaton,
@@ -9,6 +23,11 @@ from automata.interfaces import (
     AbstractTransition,
 )
 
+if TYPE_CHECKING:
+    from automata.compiled_automaton import CompiledAutomaton
+    from automata.search import AutomatonSearcher, _Text
+
+
 class State(AbstractState):
     """State of an automaton."""
 
@@ -23,11 +42,94 @@ class Transition(AbstractTransition[State]):
     # task easier, but you cannot change the constructor interface.
 
 
+class BitsetTables(NamedTuple):
+    """
+    Tables to work with sets of states as bitsets.
+
+    The state with number ``i`` (see
+    :meth:`FiniteAutomaton.get_state_index`) is represented by the bit
+    ``1 << i``.
+
+    Attributes:
+        initial: Lambda closure of the initial state.
+        finals: Set of final states.
+        closures: Lambda closure of each state.
+        successors: For each symbol, the states reachable from each state
+            consuming that symbol, lambda closure included.
+
+    """
+
+    initial: int
+    finals: int
+    closures: Tuple[int, ...]
+    successors: Mapping[str, Tuple[int, ...]]
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """
+    Iterate over the numbers of the bits set in a bitset.
+
+    Args:
+        mask: Bitset, e.g. a set of states.
+
+    Returns:
+        Iterator over the numbers of the set bits, lowest first.
+
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def post(row: Sequence[int], mask: int) -> int:
+    """
+    Return the union of the entries of a row for the bits of a bitset.
+
+    Args:
+        row: Bitset for each bit number, e.g. the successors of each state
+            with a symbol in :class:`BitsetTables`.
+        mask: Bitset, e.g. a set of states.
+
+    Returns:
+        Union of the entries of the set bits, e.g. the states reached from
+        the set of states with the symbol.
+
+    """
+    result = 0
+    while mask:
+        lowest = mask & -mask
+        result |= row[lowest.bit_length() - 1]
+        mask ^= lowest
+    return result
+
+
+class TrimStats(NamedTuple):
+    """
+    What the trim passes that produced an automaton removed.
+
+    Attributes:
+        unreachable: Number of states not reachable from the initial one.
+        dead: Number of reachable states from which no final state can be
+            reached.
+        transitions: Number of transitions removed with those states.
+
+    """
+
+    unreachable: int
+    dead: int
+    transitions: int
+
+
 class FiniteAutomaton(
     AbstractFiniteAutomaton[State, Transition],
 ):
     """Automaton."""
 
+    # Set on the automata returned by trim and by the conversions with
+    # trim=True
+    trim_stats: Optional[TrimStats] = None
+
     def __init__(
         self,
         *,
@@ -45,71 +147,693 @@ class FiniteAutomaton(
 
         # Add here additional initialization code.
         # Do not change the constructor interface
+        self._init_caches()
+
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        initial_state: State,
+        states: Collection[State],
+        symbols: Collection[str],
+        transitions: Collection[Transition],
+    ) -> "FiniteAutomaton":
+        """
+        Create an automaton without validating its arguments.
+
+        Only for producers that already guarantee the invariants checked by
+        the constructor: the initial state and the endpoints of the
+        transitions are in the states, the symbols of the transitions are
+        in the symbols, and there are no repeated states, symbols or
+        transitions.
+
+        Args:
+            initial_state: The initial state of the automaton.
+            states: Collection of states of the automaton.
+            symbols: Collection of symbols of the automaton.
+            transitions: Collection of transitions of the automaton.
+
+        Returns:
+            The automaton.
+
+        """
+        automaton = cls.__new__(cls)
+        automaton.initial_state = initial_state
+        automaton.states = tuple(states)
+        automaton.symbols = tuple(symbols)
+        automaton.transitions = tuple(transitions)
+        automaton._init_caches()
+        return automaton
+
+    def _init_caches(self) -> None:
+        # Lazily built lookup tables (see get_state_index,
+        # get_transition_index and get_lambda_closures)
+        self._state_index: Optional[Dict[State, int]] = None
+        self._transition_index: Optional[
+            Dict[Tuple[State, Optional[str]], Tuple[State, ...]]
+        ] = None
+        self._lambda_closures: Optional[Dict[State, FrozenSet[State]]] = None
+        self._has_lambdas: Optional[bool] = None
+        self._bitset_tables: Optional[BitsetTables] = None
+        self._compiled: Optional["CompiledAutomaton"] = None
+        self._searcher: Optional["AutomatonSearcher"] = None
+
+    def get_state_index(self) -> Mapping[State, int]:
+        """
+        Return the number of each state.
+
+        States are numbered by their position in :attr:`states`.
+
+        Returns:
+            Mapping from each state to its number.
+
+        """
+        if self._state_index is None:
+            self._state_index = {s: i for i, s in enumerate(self.states)}
+
+        return self._state_index
+
+    def get_transition_index(
+        self,
+    ) -> Mapping[Tuple[State, Optional[str]], Tuple[State, ...]]:
+        """
+        Return the transitions indexed by origin state and symbol.
+
+        The index is built on first use and reused afterwards, so that
+        evaluating a symbol only touches the outgoing edges of the active
+        states. Lambda transitions are indexed with ``None`` as symbol.
+
+        Returns:
+            Mapping from ``(state, symbol)`` to the reachable states.
+
+        """
+        if self._transition_index is None:
+            index: Dict[Tuple[State, Optional[str]], List[State]] = {}
+            for t in self.transitions:
+                index.setdefault((t.initial_state, t.symbol), []).append(
+                    t.final_state,
+                )
+
+            self._transition_index = {
+                key: tuple(targets) for key, targets in index.items()
+            }
+
+        return self._transition_index
+
+    def has_lambdas(self) -> bool:
+        """
+        Return if the automaton has lambda transitions.
+
+        Without them, the lambda closures are trivial and the work to
+        compute and apply them is skipped.
+
+        Returns:
+            ``True`` if some transition has ``None`` as symbol.
+
+        """
+        if self._has_lambdas is None:
+            self._has_lambdas = any(
+                t.symbol is None for t in self.transitions
+            )
+
+        return self._has_lambdas
+
+    def get_lambda_closures(self) -> Mapping[State, FrozenSet[State]]:
+        """
+        Return the lambda closure of every state.
+
+        The closures are computed once per automaton with an iterative
+        Tarjan pass over the graph of lambda transitions: all the states of
+        a strongly connected component share the same closure, and the
+        components are completed in reverse topological order so each
+        closure is built from the already finished ones.
+
+        Returns:
+            Mapping from each state to the set of states reachable from it
+            using only lambda transitions (the state included).
+
+        """
+        if self._lambda_closures is not None:
+            return self._lambda_closures
+
+        if not self.has_lambdas():
+            self._lambda_closures = {s: frozenset((s,)) for s in self.states}
+            return self._lambda_closures
+
+        index = self.get_transition_index()
+        closures: Dict[State, FrozenSet[State]] = {}
+        order: Dict[State, int] = {}
+        lowlink: Dict[State, int] = {}
+        stack: List[State] = []
+        on_stack: Set[State] = set()
+
+        for root in self.states:
+            if root in order:
+                continue
+
+            order[root] = lowlink[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            work: List[Tuple[State, Iterator[State]]] = [
+                (root, iter(index.get((root, None), ()))),
+            ]
+
+            while work:
+                state, successors = work[-1]
+                for successor in successors:
+                    if successor not in order:
+                        order[successor] = lowlink[successor] = len(order)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((
+                            successor,
+                            iter(index.get((successor, None), ())),
+                        ))
+                        break
+
+                    if successor in on_stack:
+                        lowlink[state] = min(lowlink[state], order[successor])
+                else:
+                    # Every successor visited
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[state])
+
+                    if lowlink[state] == order[state]:
+                        # State is the root of a component
+                        component: Set[State] = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member is state:
+                                break
+
+                        closure = set(component)
+                        for member in component:
+                            for successor in index.get((member, None), ()):
+                                if successor not in component:
+                                    closure |= closures[successor]
+
+                        frozen_closure = frozenset(closure)
+                        for member in component:
+                            closures[member] = frozen_closure
+
+        self._lambda_closures = closures
+        return closures
+
+    def get_bitset_tables(self) -> BitsetTables:
+        """
+        Return the tables to work with sets of states as bitsets.
+
+        With them, the union of sets, the lambda closure and the test for
+        final states become a few integer operations. The tables are built
+        on first use and reused afterwards.
+
+        Returns:
+            Bitset tables of the automaton.
+
+        """
+        if self._bitset_tables is None:
+            state_index = self.get_state_index()
+            index = self.get_transition_index()
+
+            def mask(states: Collection[State]) -> int:
+                result = 0
+                for s in states:
+                    result |= 1 << state_index[s]
+                return result
+
+            if self.has_lambdas():
+                closures = tuple(
+                    mask(c) for c in (
+                        self.get_lambda_closures()[s] for s in self.states
+                    )
+                )
+            else:
+                closures = tuple(1 << i for i in range(len(self.states)))
+
+            successors: Dict[str, Tuple[int, ...]] = {}
+            for symbol in self.symbols:
+                row = []
+                for s in self.states:
+                    successor = 0
+                    for final_state in index.get((s, symbol), ()):
+                        successor |= closures[state_index[final_state]]
+                    row.append(successor)
+                successors[symbol] = tuple(row)
+
+            self._bitset_tables = BitsetTables(
+                initial=closures[state_index[self.initial_state]],
+                finals=mask([s for s in self.states if s.is_final]),
+                closures=closures,
+                successors=successors,
+            )
+
+        return self._bitset_tables
+
+    def compile(self) -> "CompiledAutomaton":
+        """
+        Compile the automaton to a dense integer transition table.
+
+        The automaton must be deterministic, e.g. the output of
+        :meth:`to_deterministic` or :meth:`to_minimized`. The result is
+        cached.
+
+        Returns:
+            Compiled automaton, that evaluates strings using only integers.
+
+        """
+        if self._compiled is None:
+            from automata.compiled_automaton import CompiledAutomaton
+
+            self._compiled = CompiledAutomaton(self)
+
+        return self._compiled
+
+    def get_searcher(self) -> "AutomatonSearcher":
+        """
+        Return the searcher of the words of the automaton inside texts.
+
+        It is built on first use and reused afterwards.
+
+        Returns:
+            Searcher of the automaton.
+
+        """
+        if self._searcher is None:
+            from automata.search import AutomatonSearcher, _Text
+
+            self._searcher = AutomatonSearcher(self)
+
+        return self._searcher
+
+    def finditer(self, text: "_Text") -> Iterator[Tuple[int, int]]:
+        """
+        Find all the non overlapping substrings accepted by the automaton.
+
+        Matches are leftmost-longest (see :class:`AutomatonSearcher`).
+
+        Args:
+            text: Text to search. Bytes are read as latin-1.
+
+        Returns:
+            Iterator over the ``(start, end)`` offsets of the matches.
+
+        """
+        return self.get_searcher().finditer(text)
+
+    def search(self, text: "_Text") -> Optional[Tuple[int, int]]:
+        """
+        Find the leftmost-longest substring accepted by the automaton.
+
+        Args:
+            text: Text to search. Bytes are read as latin-1.
+
+        Returns:
+            The ``(start, end)`` offsets of the match, or ``None``.
+
+        """
+        return self.get_searcher().search(text)
+
+    def remove_lambdas(self) -> "FiniteAutomaton":
+        """
+        Return an equivalent automaton without lambda transitions.
+
+        A state gets a transition with a symbol to every state reachable
+        consuming that symbol from its lambda closure, and it is final if
+        its closure has a final state. Only the states reachable from the
+        initial one with the new transitions are kept, which removes the
+        states that were only entered through lambda transitions. The
+        names of the states are kept if they are unique; otherwise each
+        state is named after its position, since states that only differ
+        in being final get the same finality here.
+
+        Returns:
+            Equivalent automaton without lambda transitions, or this one if
+            it has none.
+
+        """
+        if not self.has_lambdas():
+            return self
+
+        closures = self.get_lambda_closures()
+        index = self.get_transition_index()
+        state_index = self.get_state_index()
+        unique_names = len({s.name for s in self.states}) == len(self.states)
+
+        def new_state(state: State) -> State:
+            return State(
+                name=(
+                    state.name if unique_names
+                    else f"q{state_index[state]}"
+                ),
+                is_final=any(s.is_final for s in closures[state]),
+            )
+
+        states: Dict[State, State] = {
+            self.initial_state: new_state(self.initial_state),
+        }
+        transitions: List[Transition] = []
+        pending = [self.initial_state]
+        while pending:
+            state = pending.pop()
+            closure = sorted(closures[state], key=state_index.__getitem__)
+            for symbol in self.symbols:
+                targets: Dict[State, None] = {}
+                for member in closure:
+                    targets.update(
+                        dict.fromkeys(index.get((member, symbol), ())),
+                    )
+
+                for target in targets:
+                    if target not in states:
+                        states[target] = new_state(target)
+                        pending.append(target)
+
+                    transitions.append(Transition(
+                        initial_state=states[state],
+                        symbol=symbol,
+                        final_state=states[target],
+                    ))
+
+        return FiniteAutomaton.from_trusted(
+            initial_state=states[self.initial_state],
+            states=states.values(),
+            symbols=self.symbols,
+            transitions=transitions,
+        )
+
+    def trim(self) -> "FiniteAutomaton":
+        """
+        Remove the states that cannot take part in an accepted string.
+
+        Those are the states that are not reachable from the initial state,
+        and the ones from which no final state can be reached. Both are
+        found with a graph search in linear time. The initial state is
+        always kept, and so is the alphabet. The result of a deterministic
+        automaton is deterministic, but may miss transitions (e.g. the ones
+        to the ``'empty'`` sink of :meth:`to_deterministic`).
+
+        Returns:
+            Equivalent automaton with only useful states. Its
+            ``trim_stats`` attribute tells what was removed.
+
+        """
+        state_index = self.get_state_index()
+        n_states = len(self.states)
+        forward: List[List[int]] = [[] for _ in range(n_states)]
+        backward: List[List[int]] = [[] for _ in range(n_states)]
+        for t in self.transitions:
+            origin = state_index[t.initial_state]
+            destination = state_index[t.final_state]
+            forward[origin].append(destination)
+            backward[destination].append(origin)
+
+        def search(starts: List[int], edges: List[List[int]]) -> bytearray:
+            seen = bytearray(n_states)
+            for i in starts:
+                seen[i] = 1
+            pending = list(starts)
+            while pending:
+                for j in edges[pending.pop()]:
+                    if not seen[j]:
+                        seen[j] = 1
+                        pending.append(j)
+            return seen
+
+        initial = state_index[self.initial_state]
+        reachable = search([initial], forward)
+        coreachable = search(
+            [i for i, s in enumerate(self.states) if s.is_final],
+            backward,
+        )
+
+        states = [
+            s for i, s in enumerate(self.states)
+            if i == initial or (reachable[i] and coreachable[i])
+        ]
+        kept = set(states)
+        transitions = [
+            t for t in self.transitions
+            if t.initial_state in kept and t.final_state in kept
+        ]
+
+        trimmed = FiniteAutomaton.from_trusted(
+            initial_state=self.initial_state,
+            states=states,
+            symbols=self.symbols,
+            transitions=transitions,
+        )
+        n_reachable = sum(reachable)
+        trimmed.trim_stats = TrimStats(
+            unreachable=n_states - n_reachable,
+            dead=n_reachable - len(states),
+            transitions=len(self.transitions) - len(transitions),
+        )
+        return trimmed
+
+    def _trim_around(
+        self,
+        convert: Callable[["FiniteAutomaton"], "FiniteAutomaton"],
+    ) -> "FiniteAutomaton":
+        # Trims the input of a conversion and its output, and adds up what
+        # both passes removed. The alphabet is kept, even if the conversion
+        # drops the symbols that are no longer used.
+        trimmed = self.trim()
+        converted = convert(trimmed)
+        result = FiniteAutomaton.from_trusted(
+            initial_state=converted.initial_state,
+            states=converted.states,
+            symbols=self.symbols,
+            transitions=converted.transitions,
+        ).trim()
+        assert trimmed.trim_stats is not None
+        assert result.trim_stats is not None
+        result.trim_stats = TrimStats(*(
+            a + b for a, b in zip(trimmed.trim_stats, result.trim_stats)
+        ))
+        return result
 
     def to_deterministic(
         self,
+        *,
+        trim: bool = False,
     ) -> "FiniteAutomaton":
+        """
+        Return an equivalent deterministic automaton.
+
+        Args:
+            trim: If ``True``, useless states are removed (see
+                :meth:`trim`) from this automaton before the subset
+                construction and from its result, which then has no
+                ``'empty'`` sink.
+
+        Returns:
+            Equivalent deterministic automaton.
+
+        """
+        if trim:
+            return self._trim_around(lambda a: a.to_deterministic())
+
         # AFN-l to AFD
 
-        # Auxiliar function
-        def merge_states(states: Collection[State]) -> State:
-            if len(states) <= 0:
-                return State(name='empty', is_final=False)
+        # Sets of states are bitsets (see get_bitset_tables), used as keys.
+        # They are named by their order in the breadth first search, so the
+        # names are short and do not depend on the iteration order of sets.
+        tables = self.get_bitset_tables()
 
-            name = ''
-            is_final = False
-            for state in states:
-                name += state.name
-                if state.is_final:
-                    is_final = True
-            return State(name=name, is_final=is_final)
+        def merge_states(key: int) -> State:
+            if key == 0:
+                return State(name='empty', is_final=False)
 
-        from automata.automaton_evaluator import FiniteAutomatonEvaluator
+            return State(
+                name=f'q{len(states)}',
+                is_final=bool(key & tables.finals),
+            )
 
         symbols: Collection[str] = self.symbols
-        states: Collection[State] = tuple() # Empty tuple
-        transitions: Collection[Transition] = tuple()
-
-        queue = Queue()
-        evaluator = FiniteAutomatonEvaluator(self)
 
-        # Queue will hold tuples of set of states and correspondant merged state
-        state_tuple = (evaluator.current_states, merge_states(evaluator.current_states),)
-        states += (state_tuple[1], )
-        queue.put(state_tuple)
+        # Each set of states of this automaton is mapped to the merged state
+        # that represents it in the deterministic one
+        initial_key = tables.initial
+        states: Dict[int, State] = {}
+        initial_state = merge_states(initial_key)
+        states[initial_key] = initial_state
+        transitions: List[Transition] = []
 
-        while not queue.empty():
-            state_tuple = queue.get()
+        queue: Deque[int] = deque([initial_key])
+        while queue:
+            current_key = queue.popleft()
+            current_state = states[current_key]
 
             for symbol in symbols:
-                evaluator.current_states = state_tuple[0]
-                evaluator.process_symbol(symbol)
+                new_key = post(tables.successors[symbol], current_key)
+                new_state = states.get(new_key)
+                if new_state is None:
+                    # If state not in states, add it
+                    new_state = merge_states(new_key)
+                    states[new_key] = new_state
+                    queue.append(new_key)
 
-                new_state_tuple = (evaluator.current_states, merge_states(evaluator.current_states), )
+                transitions.append(Transition(
+                    initial_state=current_state,
+                    symbol=symbol,
+                    final_state=new_state,
+                ))
 
-                if new_state_tuple[1] not in states:
-                    # If state not in states, add it
-                    states += (new_state_tuple[1], )
-                    queue.put(new_state_tuple)
-                    # Add transition into new state
-                    transitions += (Transition(initial_state=state_tuple[1], symbol=symbol, final_state=new_state_tuple[1]),)
-                else:
-                    # Add transition into already existing state
-                    # This prevents from creating Transitions into equivalent States which are not the same object in memory
-                    for state in states:
-                        if state == new_state_tuple[1]:
-                            transitions += (Transition(initial_state=state_tuple[1], symbol=symbol, final_state=state), )
-                            break
-
-        return FiniteAutomaton(
-            initial_state = states[0],
-            states = states,
-            symbols = symbols,
-            transitions = transitions
+        return FiniteAutomaton.from_trusted(
+            initial_state=initial_state,
+            states=states.values(),
+            symbols=symbols,
+            transitions=transitions,
         )
 
     def to_minimized(
         self,
+        algorithm: str = "hopcroft",
+        *,
+        trim: bool = False,
+    ) -> "FiniteAutomaton":
+        """
+        Return a equivalent minimal automaton.
+
+        Args:
+            algorithm: Minimization engine, either ``"hopcroft"``
+                (partition refinement, O(n·k·log n)) or ``"moore"``
+                (iterated refinement of the equivalence classes).
+            trim: If ``True``, useless states are removed (see
+                :meth:`trim`) from this automaton before minimizing and
+                from its result, which then has no sink state.
+
+        Returns:
+            Equivalent minimal automaton.
+
+        """
+        if trim:
+            return self._trim_around(lambda a: a.to_minimized(algorithm))
+
+        if algorithm == "hopcroft":
+            return self._to_minimized_hopcroft()
+        if algorithm == "moore":
+            return self._to_minimized_moore()
+
+        raise ValueError(f"Unknown minimization algorithm: {algorithm}")
+
+    def _to_minimized_hopcroft(
+        self,
+    ) -> "FiniteAutomaton":
+        # Minimize AFD with Hopcroft's partition refinement
+
+        # States and symbols are numbered. Missing transitions go to an
+        # extra sink state that is kept in its own class, so the result
+        # is the same as the one of the Moore algorithm.
+        state_index = {s: i for i, s in enumerate(self.states)}
+        used_symbols = list(dict.fromkeys(t.symbol for t in self.transitions))
+        symbol_index = {a: i for i, a in enumerate(used_symbols)}
+        n_states = len(self.states)
+        n_symbols = len(used_symbols)
+        sink = n_states
+
+        delta = [[sink] * n_symbols for _ in range(n_states + 1)]
+        for t in self.transitions:
+            delta[state_index[t.initial_state]][symbol_index[t.symbol]] = (
+                state_index[t.final_state]
+            )
+
+        # Inverse transitions: inverse[symbol][state] -> origins
+        inverse: List[List[List[int]]] = [
+            [[] for _ in range(n_states + 1)] for _ in range(n_symbols)
+        ]
+        for origin, row in enumerate(delta):
+            for symbol_code, target in enumerate(row):
+                inverse[symbol_code][target].append(origin)
+
+        # First partition: non final, final and sink
+        finals = {i for i, s in enumerate(self.states) if s.is_final}
+        non_finals = set(range(n_states)) - finals
+        blocks: List[Set[int]] = [b for b in (non_finals, finals) if b]
+        blocks.append({sink})
+        block_of = [0] * (n_states + 1)
+        for b, block_states in enumerate(blocks):
+            for i in block_states:
+                block_of[i] = b
+
+        # Splitters: every (block, symbol) except the largest block
+        largest = max(range(len(blocks)), key=lambda b: len(blocks[b]))
+        splitters = [
+            (b, a)
+            for b in range(len(blocks)) if b != largest
+            for a in range(n_symbols)
+        ]
+
+        while splitters:
+            splitter_block, symbol_code = splitters.pop()
+
+            # Group the predecessors of the splitter by their class
+            touched: Dict[int, List[int]] = {}
+            inverse_symbol = inverse[symbol_code]
+            for target in blocks[splitter_block]:
+                for origin in inverse_symbol[target]:
+                    touched.setdefault(block_of[origin], []).append(origin)
+
+            for split_block, origins in touched.items():
+                if len(origins) == len(blocks[split_block]):
+                    continue
+
+                # The smaller half becomes the new class
+                moved = set(origins)
+                if 2 * len(moved) > len(blocks[split_block]):
+                    moved = blocks[split_block] - moved
+
+                blocks[split_block] -= moved
+                new_block = len(blocks)
+                blocks.append(moved)
+                for i in moved:
+                    block_of[i] = new_block
+
+                # Whether the split block was pending or not, adding the
+                # smaller half is enough: a pending splitter of the block
+                # now refers to the rest of it
+                for a in range(n_symbols):
+                    splitters.append((new_block, a))
+
+        # The first state of each class represents it
+        representatives: Dict[int, State] = {}
+        for s in self.states:
+            representatives.setdefault(block_of[state_index[s]], s)
+
+        symbols: List[str] = []
+        transitions: List[Transition] = []
+        for s in representatives.values():
+            row = delta[state_index[s]]
+            for a, target in enumerate(row):
+                if target == sink:
+                    continue
+
+                symbol = used_symbols[a]
+                # Deterministic automata have no lambda transitions
+                assert symbol is not None
+                transitions.append(Transition(
+                    initial_state=s,
+                    symbol=symbol,
+                    final_state=representatives[block_of[target]],
+                ))
+                if symbol not in symbols: # this may simplify unused symbols
+                    symbols.append(symbol)
+
+        initial_block = block_of[state_index[self.initial_state]]
+
+        return FiniteAutomaton.from_trusted(
+            initial_state=representatives[initial_block],
+            states=representatives.values(),
+            symbols=symbols,
+            transitions=transitions,
+        )
+
+    def _to_minimized_moore(
+        self,
     ) -> "FiniteAutomaton":
         #Minimize AFD
 
@@ -197,8 +921,8 @@ class FiniteAutomaton(
                             first = s
                             new_eq[s] = next_class
                         else:
-                            # compare with next_class
-                            if class_transitions_table[s] == class_transitions_table[first]:
+                            # compare with next_class, only states of the same previous class
+                            if eq[s] == eq[first] and class_transitions_table[s] == class_transitions_table[first]:
                                 # same class
                                 new_eq[s] = next_class
                             pass
@@ -229,9 +953,205 @@ class FiniteAutomaton(
                     if symbol not in symbols: # this may simplify unused symbols
                         symbols += (symbol, )
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state=initial_state,
             states=states,
             symbols=symbols,
             transitions=transitions
         )
+
+    def _as_deterministic(self) -> "FiniteAutomaton":
+        from automata.utils import is_deterministic
+
+        return self if is_deterministic(self) else self.to_deterministic()
+
+    @staticmethod
+    def _explore(
+        symbols: Tuple[str, ...],
+        initial_key: int,
+        step: Callable[[int, int], int],
+        is_final: Callable[[int], bool],
+        name: Callable[[int], str],
+    ) -> "FiniteAutomaton":
+        # Builds the complete deterministic automaton of the keys reachable
+        # from the initial one
+        initial_state = State(
+            name=name(initial_key),
+            is_final=is_final(initial_key),
+        )
+        states: Dict[int, State] = {initial_key: initial_state}
+        transitions: List[Transition] = []
+
+        queue: Deque[int] = deque([initial_key])
+        while queue:
+            key = queue.popleft()
+            state = states[key]
+            for code, symbol in enumerate(symbols):
+                new_key = step(key, code)
+                new_state = states.get(new_key)
+                if new_state is None:
+                    new_state = State(
+                        name=name(new_key),
+                        is_final=is_final(new_key),
+                    )
+                    states[new_key] = new_state
+                    queue.append(new_key)
+
+                transitions.append(Transition(
+                    initial_state=state,
+                    symbol=symbol,
+                    final_state=new_state,
+                ))
+
+        return FiniteAutomaton.from_trusted(
+            initial_state=initial_state,
+            states=states.values(),
+            symbols=symbols,
+            transitions=transitions,
+        )
+
+    def _product(
+        self,
+        other: "FiniteAutomaton",
+        accepts: Callable[[bool, bool], bool],
+        minimize: bool,
+    ) -> "FiniteAutomaton":
+        # Lazy product construction: only the pairs of states reachable from
+        # the pair of initial states are built. Missing transitions, and the
+        # symbols of only one alphabet, go to a dead state.
+        from automata.utils import _complete_table
+
+        automaton1 = self._as_deterministic()
+        automaton2 = other._as_deterministic()
+        symbols = tuple(dict.fromkeys(
+            (*automaton1.symbols, *automaton2.symbols),
+        ))
+        n_symbols = len(symbols)
+        table1, finals1, initial1 = _complete_table(automaton1, symbols)
+        table2, finals2, initial2 = _complete_table(automaton2, symbols)
+
+        # The pair (state1, state2) is the key state1 * n2 + state2
+        n2 = len(finals2)
+
+        def step(key: int, code: int) -> int:
+            state1, state2 = divmod(key, n2)
+            return (
+                table1[state1 * n_symbols + code] * n2
+                + table2[state2 * n_symbols + code]
+            )
+
+        def is_final(key: int) -> bool:
+            state1, state2 = divmod(key, n2)
+            return accepts(finals1[state1], finals2[state2])
+
+        def name(key: int) -> str:
+            return "q{}_{}".format(*divmod(key, n2))
+
+        product = self._explore(
+            symbols,
+            initial1 * n2 + initial2,
+            step,
+            is_final,
+            name,
+        )
+        return product.to_minimized() if minimize else product
+
+    def intersect(
+        self,
+        other: "FiniteAutomaton",
+        *,
+        minimize: bool = True,
+    ) -> "FiniteAutomaton":
+        """
+        Return an automaton for the strings accepted by both automata.
+
+        Automata that are not deterministic are determinized first.
+
+        Args:
+            other: Second automaton.
+            minimize: If ``True``, the product automaton is minimized.
+
+        Returns:
+            Deterministic automaton of the intersection.
+
+        """
+        return self._product(other, lambda a, b: a and b, minimize)
+
+    def difference(
+        self,
+        other: "FiniteAutomaton",
+        *,
+        minimize: bool = True,
+    ) -> "FiniteAutomaton":
+        """
+        Return an automaton for the strings accepted by this automaton only.
+
+        Automata that are not deterministic are determinized first.
+
+        Args:
+            other: Automaton whose strings are removed.
+            minimize: If ``True``, the product automaton is minimized.
+
+        Returns:
+            Deterministic automaton of the difference.
+
+        """
+        return self._product(other, lambda a, b: a and not b, minimize)
+
+    def symmetric_difference(
+        self,
+        other: "FiniteAutomaton",
+        *,
+        minimize: bool = True,
+    ) -> "FiniteAutomaton":
+        """
+        Return an automaton for the strings accepted by exactly one automaton.
+
+        Automata that are not deterministic are determinized first.
+
+        Args:
+            other: Second automaton.
+            minimize: If ``True``, the product automaton is minimized.
+
+        Returns:
+            Deterministic automaton of the symmetric difference.
+
+        """
+        return self._product(other, lambda a, b: a != b, minimize)
+
+    def complement(
+        self,
+        symbols: Collection[str] = (),
+        *,
+        minimize: bool = True,
+    ) -> "FiniteAutomaton":
+        """
+        Return an automaton for the strings rejected by this automaton.
+
+        The automaton is determinized first if needed, and completed with a
+        dead state.
+
+        Args:
+            symbols: Symbols added to the alphabet of the automaton. The
+                complement is taken with respect to the extended alphabet.
+            minimize: If ``True``, the result is minimized.
+
+        Returns:
+            Deterministic automaton of the complement.
+
+        """
+        from automata.utils import _complete_table
+
+        automaton = self._as_deterministic()
+        alphabet = tuple(dict.fromkeys((*automaton.symbols, *symbols)))
+        n_symbols = len(alphabet)
+        table, finals, initial = _complete_table(automaton, alphabet)
+
+        complement = self._explore(
+            alphabet,
+            initial,
+            lambda key, code: table[key * n_symbols + code],
+            lambda key: not finals[key],
+            lambda key: f"q{key}",
+        )
+        return complement.to_minimized() if minimize else complement
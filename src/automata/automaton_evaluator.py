@@ -1,10 +1,15 @@
 """Evaluation of automata."""
-from typing import Set
+from typing import AbstractSet, Dict, Set
 
-from automata.automaton import FiniteAutomaton, State
+from automata.automaton import (
+    BitsetTables,
+    FiniteAutomaton,
+    State,
+    iter_bits,
+    post,
+)
 from automata.interfaces import AbstractFiniteAutomatonEvaluator
 
-from queue import Queue
 
 class FiniteAutomatonEvaluator(
     AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State],
@@ -16,30 +21,27 @@ class FiniteAutomatonEvaluator(
         new_states: Set[State] = set()
 
         if symbol not in self.automaton.symbols:
-            raise ValueError("Symbol \'"+(symbol)+"\' is not accepted by this automaton. Accepted symbols: "+str(self.automaton.symbols))
+            raise self._symbol_error(symbol)
 
-        for transition in self.automaton.transitions:
-            if transition.initial_state in self.current_states and transition.symbol == symbol and transition.final_state not in new_states:
-                new_states.add(transition.final_state)
+        # Only the outgoing edges of the active states are visited
+        index = self.automaton.get_transition_index()
+        for state in self.current_states:
+            new_states.update(index.get((state, symbol), ()))
 
         self._complete_lambdas(new_states)
         self.current_states = new_states
 
+    def _symbol_error(self, symbol: str) -> ValueError:
+        return ValueError("Symbol \'"+(symbol)+"\' is not accepted by this automaton. Accepted symbols: "+str(self.automaton.symbols))
+
     def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
-        # Breadth-First Search
-        queue = Queue()
-        for item in set_to_complete:
-            queue.put(item)
-
-        while not queue.empty():
-            state = queue.get()
-            # For each state, search for lambda transitions and add them to the queue
-            for transition in self.automaton.transitions:
-                if transition.initial_state == state and transition.symbol == None and transition.final_state not in set_to_complete:
-                    # Add to set completed with lambdas and push to queue
-                    set_to_complete.add(transition.final_state)
-                    queue.put(transition.final_state)
-        return
+        if not self.automaton.has_lambdas():
+            return
+
+        # Lambda closures are precomputed once per automaton
+        closures = self.automaton.get_lambda_closures()
+        for state in tuple(set_to_complete):
+            set_to_complete.update(closures.get(state, ()))
 
     def is_accepting(self) -> bool:
 
@@ -48,3 +50,196 @@ class FiniteAutomatonEvaluator(
                 return True
 
         return False
+
+
+class BitsetFiniteAutomatonEvaluator(FiniteAutomatonEvaluator):
+    """
+    Evaluator of an automaton using bit-parallel NFA simulation.
+
+    The set of current states is kept as an integer where the bit ``i``
+    is set when the state with number ``i`` is active (see
+    :meth:`FiniteAutomaton.get_bitset_tables`). Each step is a union of
+    precomputed successor bitsets, with the lambda closures included.
+
+    Attributes:
+        current_mask: Bitset of the current states.
+
+    """
+
+    current_mask: int
+    _tables: BitsetTables
+
+    def __init__(self, automaton: FiniteAutomaton) -> None:
+        self._tables = automaton.get_bitset_tables()
+        super().__init__(automaton)
+
+    @property  # type: ignore[override]
+    def current_states(self) -> AbstractSet[State]:
+        states = self.automaton.states
+        return {states[i] for i in iter_bits(self.current_mask)}
+
+    @current_states.setter
+    def current_states(self, states: AbstractSet[State]) -> None:
+        state_index = self.automaton.get_state_index()
+        mask = 0
+        for state in states:
+            mask |= 1 << state_index[state]
+        self.current_mask = mask
+
+    def process_symbol(self, symbol: str) -> None:
+        successors = self._tables.successors.get(symbol)
+        if successors is None:
+            raise self._symbol_error(symbol)
+
+        self.current_mask = post(successors, self.current_mask)
+
+    def is_accepting(self) -> bool:
+        return bool(self.current_mask & self._tables.finals)
+
+    def accepts(self, string: str) -> bool:
+        old_mask = self.current_mask
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_mask = old_mask
+
+        return accepted
+
+
+class LazyCachePolicy():
+    """
+    Flush and fallback policy of the caches of lazy deterministic automata.
+
+    A full cache is flushed. The flush is unhealthy if the hit ratio since
+    the previous one was lower than ``min_hit_ratio``, and after
+    ``max_bad_flushes`` consecutive unhealthy flushes the cache is
+    thrashing: the automaton should fall back to plain simulation.
+
+    Attributes:
+        min_hit_ratio: Minimum hit ratio for a flush to be considered
+            healthy.
+        max_bad_flushes: Consecutive unhealthy flushes before falling back
+            to plain simulation.
+        flushes: Times that the cache has been flushed.
+        fallback: Whether the automaton has fallen back to plain
+            simulation.
+
+    """
+
+    min_hit_ratio: float
+    max_bad_flushes: int
+    flushes: int
+    fallback: bool
+
+    def _reset_policy(self) -> None:
+        self._bad_flushes = 0
+        self.flushes = 0
+        self.fallback = False
+
+    def _record_flush(self, hits: int, misses: int) -> None:
+        """Record a flush after some hits and misses since the last one."""
+        if hits < self.min_hit_ratio * (hits + misses):
+            self._bad_flushes += 1
+        else:
+            self._bad_flushes = 0
+
+        self.flushes += 1
+        if self._bad_flushes >= self.max_bad_flushes:
+            self.fallback = True
+
+
+class LazyDFAEvaluator(BitsetFiniteAutomatonEvaluator, LazyCachePolicy):
+    """
+    Evaluator of an automaton that builds its deterministic one on the fly.
+
+    The automaton is simulated with bitsets, but every transition between
+    sets of states is memoized the first time it is computed, so
+    frequently visited sets behave as the states of a deterministic
+    automaton without paying for the full subset construction.
+
+    The cache holds at most ``cache_size`` transitions. When it is full it
+    is flushed, and if it is thrashing the evaluator falls back to plain
+    bitset simulation (see :class:`LazyCachePolicy`).
+
+    Args:
+        automaton: Automaton to evaluate.
+        cache_size: Maximum number of cached transitions.
+        min_hit_ratio: Minimum hit ratio for a flush to be considered
+            healthy.
+        max_bad_flushes: Consecutive unhealthy flushes before falling back
+            to plain simulation.
+
+    Attributes:
+        hits: Transitions found in the cache.
+        misses: Transitions computed and stored in the cache.
+        flushes: Times that the cache has been flushed.
+        fallback: Whether the evaluator has fallen back to plain
+            simulation.
+
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        *,
+        cache_size: int = 10000,
+        min_hit_ratio: float = 0.5,
+        max_bad_flushes: int = 3,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("The cache size must be positive")
+
+        self.cache_size = cache_size
+        self.min_hit_ratio = min_hit_ratio
+        self.max_bad_flushes = max_bad_flushes
+        self.clear_cache()
+        super().__init__(automaton)
+
+    def clear_cache(self) -> None:
+        """Empty the cache, reset the counters and leave fallback mode."""
+        self._cache: Dict[str, Dict[int, int]] = {}
+        self._cached = 0
+        self._hits_since_flush = 0
+        self.hits = 0
+        self.misses = 0
+        self._reset_policy()
+
+    def _flush(self) -> None:
+        self._record_flush(self._hits_since_flush, self._cached)
+        self._cache = {}
+        self._cached = 0
+        self._hits_since_flush = 0
+
+    def process_symbol(self, symbol: str) -> None:
+        if self.fallback:
+            super().process_symbol(symbol)
+            return
+
+        cache = self._cache.get(symbol)
+        if cache is None:
+            if symbol not in self._tables.successors:
+                raise self._symbol_error(symbol)
+            cache = self._cache[symbol] = {}
+
+        current_mask = self.current_mask
+        new_mask = cache.get(current_mask)
+        if new_mask is not None:
+            self.hits += 1
+            self._hits_since_flush += 1
+            self.current_mask = new_mask
+            return
+
+        self.misses += 1
+        super().process_symbol(symbol)
+        if self._cached >= self.cache_size:
+            self._flush()
+            if self.fallback:
+                return
+            cache = self._cache[symbol] = {}
+
+        cache[current_mask] = self.current_mask
+        self._cached += 1
@@ -0,0 +1,418 @@
+"""Compact binary format for automata."""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import automata.automaton as aut
+from automata.utils import FormatParseError
+
+_Path = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"AUTB"
+VERSION = 1
+
+# Header: magic, version, flags, number of states, number of symbols,
+# number of transitions and number of the initial state
+_HEADER = struct.Struct("<4sHHIIII")
+
+# Header flags
+FLAG_DETERMINISTIC = 1
+
+# State flags
+STATE_FINAL = 1
+
+# Label of the lambda transitions
+LAMBDA = 0xFFFFFFFF
+
+
+class _Sections(NamedTuple):
+    flags: int
+    initial: int
+    symbols: Tuple[str, ...]
+    name_offsets: Sequence[int]
+    names: memoryview
+    state_flags: memoryview
+    row_offsets: Sequence[int]
+    labels: Sequence[int]
+    targets: Sequence[int]
+
+
+def _padding(size: int) -> bytes:
+    return bytes(-size % 4)
+
+
+def _u32(values: Sequence[int]) -> bytes:
+    data = array("I", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _string_table(strings: Sequence[str]) -> bytes:
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for s in encoded:
+        offsets.append(offsets[-1] + len(s))
+    blob = b"".join(encoded)
+    return _u32(offsets) + blob + _padding(len(blob))
+
+
+def dumps(automaton: "aut.FiniteAutomaton") -> bytes:
+    """
+    Serialize an automaton to the binary format.
+
+    The file is a little-endian header followed by 4-byte aligned
+    sections: the symbol table, the state names, one flag byte per state,
+    and the transitions in compressed sparse row (CSR) form, grouped by
+    origin state and sorted by symbol number.
+
+    Args:
+        automaton: Automaton to serialize.
+
+    Returns:
+        Binary representation of the automaton.
+
+    """
+    states = automaton.states
+    symbols = automaton.symbols
+    state_index = automaton.get_state_index()
+    symbol_index = {s: i for i, s in enumerate(symbols)}
+
+    rows: List[List[Tuple[int, int]]] = [[] for _ in states]
+    for t in automaton.transitions:
+        label = LAMBDA if t.symbol is None else symbol_index[t.symbol]
+        rows[state_index[t.initial_state]].append(
+            (label, state_index[t.final_state]),
+        )
+
+    # Deterministic if no row has lambdas (the greatest label) or repeats
+    deterministic = True
+    row_offsets = [0]
+    labels: List[int] = []
+    targets: List[int] = []
+    for row in rows:
+        if not row:
+            row_offsets.append(len(labels))
+            continue
+
+        row.sort()
+        row_labels, row_targets = zip(*row)
+        if row_labels[-1] == LAMBDA or len(set(row_labels)) < len(row):
+            deterministic = False
+        labels += row_labels
+        targets += row_targets
+        row_offsets.append(len(labels))
+
+    state_flags = bytes(
+        STATE_FINAL if s.is_final else 0 for s in states
+    )
+
+    return b"".join((
+        _HEADER.pack(
+            MAGIC,
+            VERSION,
+            FLAG_DETERMINISTIC if deterministic else 0,
+            len(states),
+            len(symbols),
+            len(labels),
+            state_index[automaton.initial_state],
+        ),
+        _string_table(symbols),
+        _string_table([s.name for s in states]),
+        state_flags,
+        _padding(len(state_flags)),
+        _u32(row_offsets),
+        _u32(labels),
+        _u32(targets),
+    ))
+
+
+def dump(automaton: "aut.FiniteAutomaton", path: _Path) -> None:
+    """
+    Write an automaton to a file in the binary format.
+
+    Args:
+        automaton: Automaton to serialize.
+        path: Path of the file.
+
+    """
+    with open(path, "wb") as file:
+        file.write(dumps(automaton))
+
+
+def _decode_strings(offsets: Sequence[int], blob: memoryview) -> List[str]:
+    data = bytes(blob)
+    try:
+        return [
+            data[offsets[i]:offsets[i + 1]].decode("utf-8")
+            for i in range(len(offsets) - 1)
+        ]
+    except UnicodeDecodeError as e:
+        raise FormatParseError("Invalid string table") from e
+
+
+def _parse(buffer: memoryview) -> _Sections:
+    if len(buffer) < _HEADER.size:
+        raise FormatParseError("Truncated header")
+
+    magic, version, flags, n_states, n_symbols, n_transitions, initial = (
+        _HEADER.unpack_from(buffer)
+    )
+    if magic != MAGIC:
+        raise FormatParseError("Not an automaton binary file")
+    if version != VERSION:
+        raise FormatParseError(f"Unsupported format version: {version}")
+
+    position = _HEADER.size
+
+    def take(size: int) -> memoryview:
+        nonlocal position
+        if position + size > len(buffer):
+            raise FormatParseError("Truncated file")
+        section = buffer[position:position + size]
+        position += size + (-size % 4)
+        return section
+
+    def u32(count: int) -> Sequence[int]:
+        section = take(4 * count)
+        if sys.byteorder == "little":
+            return section.cast("I")
+        data = array("I", section)
+        data.byteswap()
+        return data
+
+    symbol_offsets = u32(n_symbols + 1)
+    symbols = tuple(_decode_strings(
+        symbol_offsets,
+        take(symbol_offsets[n_symbols]),
+    ))
+    # State names are only needed to rebuild the automaton
+    name_offsets = u32(n_states + 1)
+    names = take(name_offsets[n_states])
+    state_flags = take(n_states)
+    row_offsets = u32(n_states + 1)
+    labels = u32(n_transitions)
+    targets = u32(n_transitions)
+
+    if initial >= n_states or row_offsets[n_states] != n_transitions:
+        raise FormatParseError("Inconsistent automaton")
+
+    return _Sections(
+        flags=flags,
+        initial=initial,
+        symbols=symbols,
+        name_offsets=name_offsets,
+        names=names,
+        state_flags=state_flags,
+        row_offsets=row_offsets,
+        labels=labels,
+        targets=targets,
+    )
+
+
+def loads(data: Union[bytes, bytearray, memoryview]) -> "aut.FiniteAutomaton":
+    """
+    Deserialize an automaton from the binary format.
+
+    Args:
+        data: Binary representation of the automaton.
+
+    Returns:
+        The automaton.
+
+    """
+    sections = _parse(memoryview(data))
+    names = _decode_strings(sections.name_offsets, sections.names)
+    states = [
+        aut.State(name=name, is_final=bool(flags & STATE_FINAL))
+        for name, flags in zip(names, sections.state_flags)
+    ]
+
+    transitions = []
+    labels = sections.labels
+    targets = sections.targets
+    row_offsets = sections.row_offsets
+    try:
+        for i, state in enumerate(states):
+            for j in range(row_offsets[i], row_offsets[i + 1]):
+                label = labels[j]
+                transitions.append(aut.Transition(
+                    initial_state=state,
+                    symbol=None if label == LAMBDA else sections.symbols[label],
+                    final_state=states[targets[j]],
+                ))
+    except IndexError as e:
+        raise FormatParseError("Inconsistent automaton") from e
+
+    return aut.FiniteAutomaton(
+        initial_state=states[sections.initial],
+        states=states,
+        symbols=sections.symbols,
+        transitions=transitions,
+    )
+
+
+def load(path: _Path) -> "aut.FiniteAutomaton":
+    """
+    Read an automaton from a file in the binary format.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The automaton.
+
+    """
+    with open(path, "rb") as file:
+        return loads(file.read())
+
+
+class MappedAutomaton():
+    """
+    Deterministic automaton evaluated straight from a memory-mapped file.
+
+    Only the symbol table is decoded. The transitions are read from the
+    mapped CSR arrays while evaluating, so opening a file takes constant
+    time and memory regardless of the size of the automaton. Rows with a
+    transition for every symbol are indexed directly; the rest are
+    searched with bisection.
+
+    Args:
+        path: Path of a file written by :func:`dump`.
+
+    Attributes:
+        symbols: Symbols of the automaton, indexed by number.
+        initial: Number of the initial state.
+
+    """
+
+    symbols: Tuple[str, ...]
+    initial: int
+
+    def __init__(self, path: _Path) -> None:
+        with open(path, "rb") as file:
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(
+                file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            )
+
+        self._buffer = memoryview(self._mmap)
+        try:
+            sections = _parse(self._buffer)
+            if not sections.flags & FLAG_DETERMINISTIC:
+                raise ValueError("Automaton is not deterministic")
+        except BaseException:
+            # The traceback keeps views of the mapping alive, so it is left
+            # to be closed when they are collected
+            self._mmap = None
+            raise
+
+        self.symbols = sections.symbols
+        self.initial = sections.initial
+        self._symbol_index: Dict[str, int] = {
+            s: i for i, s in enumerate(self.symbols)
+        }
+        self._state_flags = sections.state_flags
+        self._row_offsets = sections.row_offsets
+        self._labels = sections.labels
+        self._targets = sections.targets
+
+    def __enter__(self) -> "MappedAutomaton":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping."""
+        if self._mmap is None:
+            return
+
+        # Views of the mapping must be released before closing it
+        for name in (
+            "_state_flags", "_row_offsets", "_labels", "_targets",
+        ):
+            view = self.__dict__.pop(name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._buffer.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def step(self, state: int, code: int) -> int:
+        """
+        Return the destination of a transition.
+
+        Args:
+            state: Number of the origin state.
+            code: Number of the symbol.
+
+        Returns:
+            Number of the destination state, or ``-1`` if there is none.
+
+        """
+        # The arrays are not checked when mapping, so references out of
+        # them are only found here
+        try:
+            start = self._row_offsets[state]
+            end = self._row_offsets[state + 1]
+            if end - start == len(self.symbols):
+                return self._targets[start + code]
+
+            i = bisect_left(self._labels, code, start, end)
+            if i < end and self._labels[i] == code:
+                return self._targets[i]
+        except IndexError as e:
+            raise FormatParseError("Inconsistent automaton") from e
+        return -1
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            ``True`` if the automaton ends in a final state.
+
+        """
+        symbol_index = self._symbol_index
+        step = self.step
+        state = self.initial
+        for symbol in string:
+            code = symbol_index.get(symbol)
+            if code is None:
+                raise ValueError(
+                    "Symbol \'" + symbol + "\' is not accepted by this "
+                    "automaton. Accepted symbols: " + str(self.symbols),
+                )
+            state = step(state, code)
+            if state < 0:
+                return False
+
+        try:
+            return bool(self._state_flags[state] & STATE_FINAL)
+        except IndexError as e:
+            raise FormatParseError("Inconsistent automaton") from e
+
+
+def load_mapped(path: _Path) -> MappedAutomaton:
+    """
+    Map a file in the binary format for evaluation.
+
+    Args:
+        path: Path of a file written by :func:`dump`, holding a
+            deterministic automaton.
+
+    Returns:
+        Automaton evaluated from the mapped file. It should be closed when
+        no longer needed.
+
+    """
+    return MappedAutomaton(path)
@@ -0,0 +1,138 @@
+"""Cache of the minimal automata of regexes."""
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Optional, Union
+
+from automata.automaton import FiniteAutomaton
+from automata.binary_format import dumps, load
+from automata.re_parser import REParser
+from automata.re_parser_interfaces import _re_to_rpn
+from automata.utils import FormatParseError
+
+
+class CompileCache():
+    """
+    Cache of the minimal deterministic automata of regexes.
+
+    Regexes are normalized to reverse polish notation, so regexes that only
+    differ in redundant parentheses share an entry. The most recently used
+    automata are kept in memory, and if a directory is given every compiled
+    automaton is also stored there in the binary format of
+    :mod:`automata.binary_format`, so that new processes skip the
+    compilation.
+
+    The cached automata are shared between callers and must not be
+    modified.
+
+    Args:
+        maxsize: Maximum number of automata kept in memory.
+        directory: Directory of the on-disk store, created if needed.
+            ``None`` disables it.
+        trim: If ``True``, the automata are trimmed (see
+            :meth:`FiniteAutomaton.trim`), so they have no sink state.
+            Trimmed and complete automata are stored apart. The binary
+            format does not keep ``trim_stats``, so it is ``None`` on every
+            cached automaton, whether it was compiled or loaded.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+        *,
+        trim: bool = False,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.directory = None if directory is None else os.fspath(directory)
+        self.trim = trim
+        self._automata: "OrderedDict[str, FiniteAutomaton]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._automata)
+
+    def get(self, re_string: str) -> FiniteAutomaton:
+        """
+        Return the minimal automaton of a regex, compiling it if needed.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Minimal deterministic automaton equivalent to the regex.
+
+        """
+        key = _re_to_rpn(re_string)
+        automaton = self._automata.get(key)
+        if automaton is not None:
+            self._automata.move_to_end(key)
+            self.hits += 1
+            return automaton
+
+        automaton = self._load(key)
+        if automaton is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            automaton = REParser().create_dfa(re_string).to_minimized(
+                trim=self.trim,
+            )
+            automaton.trim_stats = None
+            self._store(key, automaton)
+
+        self._automata[key] = automaton
+        if len(self._automata) > self.maxsize:
+            self._automata.popitem(last=False)
+
+        return automaton
+
+    def clear(self) -> None:
+        """Empty the in-memory cache. The on-disk store is kept."""
+        self._automata.clear()
+
+    def _path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+
+        if self.trim:
+            key += "\0trim"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.aut")
+
+    def _load(self, key: str) -> Optional[FiniteAutomaton]:
+        path = self._path(key)
+        if path is None:
+            return None
+
+        try:
+            return load(path)
+        except (OSError, FormatParseError, ValueError):
+            # Missing or corrupt entries are compiled again
+            return None
+
+    def _store(self, key: str, automaton: FiniteAutomaton) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+
+        # Written to a temporary file and renamed, so that concurrent
+        # processes never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(dumps(automaton))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
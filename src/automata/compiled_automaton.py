@@ -0,0 +1,185 @@
+"""Execution of deterministic automata over integer tables."""
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import automata.automaton as aut
+
+_Text = Union[str, bytes, bytearray, memoryview]
+
+
+class CompiledAutomaton():
+    """
+    Deterministic automaton compiled to a dense integer transition table.
+
+    States and symbols are numbered following the order of the original
+    automaton. Missing transitions lead to a dead state, represented by
+    ``-1``.
+
+    Args:
+        automaton: Deterministic automaton to compile.
+
+    Attributes:
+        states: States of the original automaton, indexed by number.
+        symbols: Symbols of the original automaton, indexed by number.
+        initial: Number of the initial state.
+        table: Flat transition table. The entry ``state * len(symbols) +
+            symbol`` holds the destination state, or ``-1``.
+        finals: One byte per state, ``1`` for the final ones.
+        dead: One byte per state, ``1`` for the states that cannot reach
+            a final one.
+        symbol_index: Number of each symbol.
+        byte_map: Translation table from bytes to symbol numbers. Bytes
+            that are not symbols are mapped to ``255``.
+
+    """
+
+    states: Tuple["aut.State", ...]
+    symbols: Tuple[str, ...]
+    initial: int
+    table: "array[int]"
+    finals: bytes
+    dead: bytes
+    symbol_index: Dict[str, int]
+    byte_map: bytes
+
+    def __init__(self, automaton: "aut.FiniteAutomaton") -> None:
+        from automata.utils import is_deterministic
+
+        if not is_deterministic(automaton):
+            raise ValueError("Automaton is not deterministic")
+
+        self.states = tuple(automaton.states)
+        self.symbols = tuple(automaton.symbols)
+        self.symbol_index = {s: i for i, s in enumerate(self.symbols)}
+        state_index = {s: i for i, s in enumerate(self.states)}
+
+        n_symbols = len(self.symbols)
+        self.initial = state_index[automaton.initial_state]
+        self.table = array("l", [-1]) * (len(self.states) * n_symbols)
+        for t in automaton.transitions:
+            self.table[
+                state_index[t.initial_state] * n_symbols
+                + self.symbol_index[t.symbol]  # type: ignore[index]
+            ] = state_index[t.final_state]
+
+        self.finals = bytes(s.is_final for s in self.states)
+
+        # States from which no final state can be reached
+        predecessors: List[List[int]] = [[] for _ in self.states]
+        for i, final in enumerate(self.table):
+            if final >= 0:
+                predecessors[final].append(i // max(n_symbols, 1))
+        live = bytearray(self.finals)
+        pending = [i for i, is_final in enumerate(self.finals) if is_final]
+        while pending:
+            for i in predecessors[pending.pop()]:
+                if not live[i]:
+                    live[i] = 1
+                    pending.append(i)
+        self.dead = bytes(1 - x for x in live)
+
+        # Bytes are read as latin-1 characters
+        self._single_byte = n_symbols < 255 and all(
+            len(s) == 1 and ord(s) < 256 for s in self.symbols
+        )
+        byte_map = bytearray([255]) * 256
+        for symbol, i in self.symbol_index.items():
+            if len(symbol) == 1 and ord(symbol) < 256 and i < 255:
+                byte_map[ord(symbol)] = i
+        self.byte_map = bytes(byte_map)
+        self._valid_bytes = bytes(
+            b for b in range(256) if byte_map[b] != 255
+        )
+
+    def _error(self, symbol: str) -> ValueError:
+        return ValueError(
+            "Symbol \'" + symbol + "\' is not accepted by this automaton. "
+            "Accepted symbols: " + str(self.symbols),
+        )
+
+    def _encode_chars(self, string: str, strict: bool) -> List[int]:
+        if strict:
+            try:
+                return [self.symbol_index[c] for c in string]
+            except KeyError as e:
+                raise self._error(e.args[0]) from e
+
+        unknown = len(self.symbols)
+        return [self.symbol_index.get(c, unknown) for c in string]
+
+    def encode(self, string: _Text, *, strict: bool = True) -> Sequence[int]:
+        """
+        Translate a string to the sequence of its symbol numbers.
+
+        Args:
+            string: Text to translate. Bytes are read as latin-1.
+            strict: If ``True``, characters that are not symbols of the
+                automaton raise a ``ValueError``. Otherwise, they are given
+                a number greater or equal than the number of symbols.
+
+        Returns:
+            Symbol numbers of the string.
+
+        """
+        data = None
+        if isinstance(string, str):
+            if self._single_byte:
+                try:
+                    data = string.encode("latin-1")
+                except UnicodeEncodeError as e:
+                    if strict:
+                        raise self._error(string[e.start]) from e
+            if data is None:
+                return self._encode_chars(string, strict)
+        else:
+            data = bytes(string)
+            if not self._single_byte:
+                return self._encode_chars(data.decode("latin-1"), strict)
+
+        if strict:
+            # Deleting the valid bytes leaves only the invalid ones
+            invalid = data.translate(None, self._valid_bytes)
+            if invalid:
+                raise self._error(chr(invalid[0]))
+
+        return data.translate(self.byte_map)
+
+    def run(self, codes: Iterable[int]) -> int:
+        """
+        Run the automaton over a sequence of symbol numbers.
+
+        Args:
+            codes: Symbol numbers to consume. Numbers of unknown symbols,
+                as given by :meth:`encode` when not strict, lead to the
+                dead state.
+
+        Returns:
+            Number of the reached state, or ``-1`` for the dead state.
+
+        """
+        table = self.table
+        n_symbols = len(self.symbols)
+        state = self.initial
+        for code in codes:
+            if code >= n_symbols:
+                return -1
+
+            state = table[state * n_symbols + code]
+            if state < 0:
+                break
+
+        return state
+
+    def accepts(self, string: _Text) -> bool:
+        """
+        Return if a string is accepted.
+
+        Args:
+            string: Text to check. Bytes are read as latin-1.
+
+        Returns:
+            ``True`` if the automaton ends in a final state.
+
+        """
+        state = self.run(self.encode(string))
+        return state >= 0 and self.finals[state] == 1
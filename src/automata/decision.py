@@ -0,0 +1,246 @@
+"""Decision procedures on automata with lambda transitions."""
+from typing import Collection, Dict, List, Optional, Tuple
+
+import automata.automaton as aut
+
+
+def _rebuild(origins: List[Tuple[int, str]], node: int) -> str:
+    # Each explored node records its parent (-1 for roots) and symbol
+    string = []
+    parent, symbol = origins[node]
+    while parent >= 0:
+        string.append(symbol)
+        parent, symbol = origins[parent]
+    return "".join(reversed(string))
+
+
+class _Antichain():
+    """
+    Minimal sets of states found so far, grouped by a key.
+
+    Every added set is a new explored node, numbered in order. A set is
+    subsumed if a subset of it with the same key is already known; adding
+    a set discards its known supersets, whose nodes are then skipped.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: Dict[int, List[int]] = {}
+        self.masks: List[int] = []
+        self.alive: List[bool] = []
+
+    def add(self, key: int, mask: int) -> Optional[int]:
+        nodes = self._nodes.setdefault(key, [])
+        masks = self.masks
+        for node in nodes:
+            if masks[node] & ~mask == 0:
+                return None
+
+        kept = []
+        for node in nodes:
+            if mask & ~masks[node] == 0:
+                self.alive[node] = False
+            else:
+                kept.append(node)
+
+        node = len(masks)
+        masks.append(mask)
+        self.alive.append(True)
+        kept.append(node)
+        self._nodes[key] = kept
+        return node
+
+
+def accepted_string(automaton: "aut.FiniteAutomaton") -> Optional[str]:
+    """
+    Find a string accepted by an automaton.
+
+    Args:
+        automaton: Automaton to check. It can have lambda transitions.
+
+    Returns:
+        A shortest accepted string, or ``None`` if the language is empty.
+
+    """
+    tables = automaton.get_bitset_tables()
+    symbols = automaton.symbols
+
+    # Breadth first search over single states
+    nodes = list(aut.iter_bits(tables.initial))
+    origins: List[Tuple[int, str]] = [(-1, "")] * len(nodes)
+    seen = tables.initial
+    i = 0
+    while i < len(nodes):
+        state = nodes[i]
+        if tables.finals >> state & 1:
+            return _rebuild(origins, i)
+
+        for symbol in symbols:
+            new = tables.successors[symbol][state] & ~seen
+            seen |= new
+            for new_state in aut.iter_bits(new):
+                nodes.append(new_state)
+                origins.append((i, symbol))
+        i += 1
+
+    return None
+
+
+def is_empty(automaton: "aut.FiniteAutomaton") -> bool:
+    """
+    Check if an automaton accepts no string.
+
+    Args:
+        automaton: Automaton to check.
+
+    Returns:
+        ``True`` if the language of the automaton is empty.
+        ``False`` otherwise.
+
+    """
+    return accepted_string(automaton) is None
+
+
+def rejected_string(
+    automaton: "aut.FiniteAutomaton",
+    symbols: Collection[str] = (),
+) -> Optional[str]:
+    """
+    Find a string rejected by an automaton, with antichains.
+
+    The sets of states reached by the strings are explored breadth first,
+    as in the subset construction, but a set is discarded if a subset of it
+    was already reached: every string rejected from the set is also
+    rejected from the subset. Far fewer sets than in the deterministic
+    automaton are usually built.
+
+    Args:
+        automaton: Automaton to check. It can have lambda transitions.
+        symbols: Symbols added to the alphabet of the automaton.
+
+    Returns:
+        A string rejected by the automaton, or ``None`` if it accepts every
+        string over its alphabet.
+
+    """
+    tables = automaton.get_bitset_tables()
+    alphabet = tuple(dict.fromkeys((*automaton.symbols, *symbols)))
+    empty_row = (0,) * len(automaton.states)
+    rows = [tables.successors.get(s, empty_row) for s in alphabet]
+
+    antichain = _Antichain()
+    antichain.add(0, tables.initial)
+    origins: List[Tuple[int, str]] = [(-1, "")]
+    i = 0
+    while i < len(antichain.masks):
+        mask = antichain.masks[i]
+        if not mask & tables.finals:
+            return _rebuild(origins, i)
+
+        if antichain.alive[i]:
+            for symbol, row in zip(alphabet, rows):
+                node = antichain.add(0, aut.post(row, mask))
+                if node is not None:
+                    origins.append((i, symbol))
+        i += 1
+
+    return None
+
+
+def is_universal(
+    automaton: "aut.FiniteAutomaton",
+    symbols: Collection[str] = (),
+) -> bool:
+    """
+    Check if an automaton accepts every string over its alphabet.
+
+    Args:
+        automaton: Automaton to check.
+        symbols: Symbols added to the alphabet of the automaton.
+
+    Returns:
+        ``True`` if the automaton is universal.
+        ``False`` otherwise.
+
+    """
+    return rejected_string(automaton, symbols) is None
+
+
+def inclusion_counterexample(
+    automaton1: "aut.FiniteAutomaton",
+    automaton2: "aut.FiniteAutomaton",
+) -> Optional[str]:
+    """
+    Find a string accepted by the first automaton but not by the second.
+
+    Pairs of a state of the first automaton and a set of states of the
+    second one are explored breadth first, and a pair is discarded if a
+    pair with the same state and a subset of its set was already reached.
+    Neither automaton is determinized.
+
+    Args:
+        automaton1: Automaton whose language should be included.
+        automaton2: Automaton whose language should include the other.
+
+    Returns:
+        A string accepted by ``automaton1`` and rejected by
+        ``automaton2``, or ``None`` if the language of ``automaton1`` is
+        included in the language of ``automaton2``.
+
+    """
+    tables1 = automaton1.get_bitset_tables()
+    tables2 = automaton2.get_bitset_tables()
+    empty_row = (0,) * len(automaton2.states)
+    alphabet = [
+        (symbol, row1, tables2.successors.get(symbol, empty_row))
+        for symbol, row1 in tables1.successors.items()
+    ]
+
+    antichain = _Antichain()
+    states: List[int] = []
+    origins: List[Tuple[int, str]] = []
+    for state in aut.iter_bits(tables1.initial):
+        if antichain.add(state, tables2.initial) is not None:
+            states.append(state)
+            origins.append((-1, ""))
+
+    i = 0
+    while i < len(states):
+        state = states[i]
+        mask = antichain.masks[i]
+        if tables1.finals >> state & 1 and not mask & tables2.finals:
+            return _rebuild(origins, i)
+
+        if antichain.alive[i]:
+            for symbol, row1, row2 in alphabet:
+                successors = row1[state]
+                if not successors:
+                    continue
+
+                new_mask = aut.post(row2, mask)
+                for new_state in aut.iter_bits(successors):
+                    if antichain.add(new_state, new_mask) is not None:
+                        states.append(new_state)
+                        origins.append((i, symbol))
+        i += 1
+
+    return None
+
+
+def is_included(
+    automaton1: "aut.FiniteAutomaton",
+    automaton2: "aut.FiniteAutomaton",
+) -> bool:
+    """
+    Check if every string accepted by an automaton is accepted by another.
+
+    Args:
+        automaton1: Automaton whose language should be included.
+        automaton2: Automaton whose language should include the other.
+
+    Returns:
+        ``True`` if the language of ``automaton1`` is included in the
+        language of ``automaton2``.
+        ``False`` otherwise.
+
+    """
+    return inclusion_counterexample(automaton1, automaton2) is None
@@ -1,9 +1,13 @@
 """General interfaces for automatas."""
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
     AbstractSet,
+    Any,
     Collection,
     Generic,
+    Iterable,
+    List,
     Optional,
     Sequence,
     Set,
@@ -137,7 +141,15 @@ class AbstractFiniteAutomaton(
         symbols: Collection[str],
         transitions: Collection[_Transition],
     ) -> None:
-        if initial_state not in states:
+        states = tuple(states)
+        symbols = tuple(symbols)
+        transitions = tuple(transitions)
+
+        # Sets are built once, so every check below is O(1)
+        state_set = set(states)
+        symbol_set = set(symbols)
+
+        if initial_state not in state_set:
             raise ValueError(
                 f"Initial state {initial_state.name} "
                 f"is not in the set of states",
@@ -145,24 +157,24 @@ class AbstractFiniteAutomaton(
 
         for t in transitions:
             for s in (t.initial_state, t.final_state):
-                if s not in states:
+                if s not in state_set:
                     raise ValueError(
                         f"State {s} from transition {t}"
                         f"is not in the set of states",
                     )
 
-            if t.symbol is not None and t.symbol not in symbols:
+            if t.symbol is not None and t.symbol not in symbol_set:
                 raise ValueError(
                     f"Symbol {t.symbol} from transition {t}"
                     f"is not in the set of symbols",
                 )
 
-        if len(set(states)) != len(states):
+        if len(state_set) != len(states):
             raise ValueError(
                 "There are repeated states",
             )
 
-        if len(set(symbols)) != len(symbols):
+        if len(symbol_set) != len(symbols):
             raise ValueError(
                 "There are repeated symbols",
             )
@@ -173,9 +185,9 @@ class AbstractFiniteAutomaton(
             )
 
         self.initial_state = initial_state
-        self.states = tuple(states)
-        self.symbols = tuple(symbols)
-        self.transitions = tuple(transitions)
+        self.states = states
+        self.symbols = symbols
+        self.transitions = transitions
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -312,3 +324,67 @@ class AbstractFiniteAutomatonEvaluator(
             self.current_states = old_states
 
         return accepted
+
+    def accepts_many(
+        self,
+        strings: Iterable[str],
+        *,
+        processes: Optional[int] = None,
+        chunk_size: int = 10000,
+    ) -> List[bool]:
+        """
+        Return if each string is accepted without changing state.
+
+        Repeated strings are evaluated only once. When ``processes`` is
+        given and there are more than ``chunk_size`` different strings,
+        they are evaluated in chunks by a pool of processes, each one with
+        a copy of this evaluator.
+
+        Note: This function is NOT thread-safe.
+
+        Args:
+            strings: Strings to check.
+            processes: Number of worker processes, or ``None`` to evaluate
+                everything in the current process.
+            chunk_size: Number of strings sent to a worker at a time.
+
+        Returns:
+            Whether each string is accepted, in the same order.
+
+        """
+        strings = list(strings)
+        unique = list(dict.fromkeys(strings))
+
+        if processes is not None and len(unique) > chunk_size:
+            chunks = [
+                unique[i:i + chunk_size]
+                for i in range(0, len(unique), chunk_size)
+            ]
+            with ProcessPoolExecutor(
+                processes,
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as executor:
+                results = [
+                    accepted
+                    for chunk_results in executor.map(_accepts_chunk, chunks)
+                    for accepted in chunk_results
+                ]
+        else:
+            results = [self.accepts(string) for string in unique]
+
+        accepted_by_string = dict(zip(unique, results))
+        return [accepted_by_string[string] for string in strings]
+
+
+# Evaluator of each worker process of accepts_many
+_worker_evaluator: Any = None
+
+
+def _init_worker(evaluator: Any) -> None:
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+
+def _accepts_chunk(strings: Sequence[str]) -> List[bool]:
+    return [_worker_evaluator.accepts(string) for string in strings]
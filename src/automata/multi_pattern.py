@@ -0,0 +1,259 @@
+"""Matching of many regular expressions in a single pass."""
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+from automata.automaton import iter_bits, post
+from automata.automaton_evaluator import LazyCachePolicy
+from automata.re_parser import REParser
+
+# Transition not computed yet
+_UNKNOWN = -1
+
+
+class _LazyDFA(LazyCachePolicy):
+    """
+    Deterministic automaton over bitsets, built on demand.
+
+    At most ``cache_size`` states are kept: when the table is full it is
+    flushed, and if it is thrashing (see :class:`LazyCachePolicy`) the
+    transitions are no longer stored, which is plain bitset simulation. The initial state is always number 0, and the
+    number returned by :meth:`step` is valid until the next step.
+    """
+
+    def __init__(
+        self,
+        successors: List[Tuple[int, ...]],
+        finals: Dict[int, int],
+        initial: int,
+        restart: int,
+        *,
+        cache_size: int,
+        min_hit_ratio: float,
+        max_bad_flushes: int,
+    ) -> None:
+        self.successors = successors
+        self.finals = finals
+        self.final_mask = sum(1 << bit for bit in finals)
+        self.restart = restart
+        self.initial_mask = initial | restart
+        self.cache_size = cache_size
+        self.min_hit_ratio = min_hit_ratio
+        self.max_bad_flushes = max_bad_flushes
+        self.hits = 0
+        self.misses = 0
+        self._reset_policy()
+        self._hits_since_flush = 0
+        self._misses_since_flush = 0
+        self._reset()
+        self.initial = 0
+
+    def _reset(self) -> None:
+        self.masks: List[int] = []
+        self.ids: Dict[int, int] = {}
+        self.next: List[List[int]] = []
+        self.tags: List[FrozenSet[int]] = []
+        self.add(self.initial_mask)
+
+    def _flush(self) -> None:
+        self._record_flush(self._hits_since_flush, self._misses_since_flush)
+        self._hits_since_flush = 0
+        self._misses_since_flush = 0
+        self._reset()
+
+    def add(self, mask: int) -> int:
+        """Return the number of the state for a bitset, adding it if new."""
+        state = self.ids.get(mask)
+        if state is None:
+            state = len(self.masks)
+            self.ids[mask] = state
+            self.masks.append(mask)
+            self.next.append([_UNKNOWN] * len(self.successors))
+
+            self.tags.append(frozenset(
+                self.finals[bit] for bit in iter_bits(mask & self.final_mask)
+            ))
+
+        return state
+
+    def step(self, state: int, symbol: int) -> int:
+        """Return the state reached from another consuming a symbol."""
+        new_state = self.next[state][symbol]
+        if new_state != _UNKNOWN:
+            self.hits += 1
+            self._hits_since_flush += 1
+            return new_state
+
+        self.misses += 1
+        self._misses_since_flush += 1
+        new_mask = self.restart | post(
+            self.successors[symbol],
+            self.masks[state],
+        )
+
+        if self.fallback:
+            # Only the initial state and the current one are kept
+            if len(self.masks) > 1:
+                self._reset()
+            return self.add(new_mask)
+
+        if new_mask not in self.ids and len(self.masks) >= self.cache_size:
+            self._flush()
+            return self.add(new_mask)
+
+        new_state = self.add(new_mask)
+        self.next[state][symbol] = new_state
+        return new_state
+
+
+class MultiPatternMatcher():
+    """
+    Matcher of many regular expressions at once.
+
+    The automata of all the patterns are joined in a single one, where each
+    final state is tagged with the pattern that it accepts. Its
+    deterministic automaton is built on the fly, as the input requires it,
+    so each state knows which patterns accept at that point and one pass
+    over the input is enough to report all of them.
+
+    Patterns are identified by their position. As in
+    :class:`LazyDFAEvaluator`, the number of cached states is bounded, and
+    the matcher falls back to plain bitset simulation if the cache keeps
+    thrashing.
+
+    Args:
+        patterns: Regular expressions in Kleene's syntax.
+        cache_size: Maximum number of cached states of each deterministic
+            automaton.
+        min_hit_ratio: Minimum hit ratio for a flush to be considered
+            healthy.
+        max_bad_flushes: Consecutive unhealthy flushes before falling back
+            to plain simulation.
+
+    Attributes:
+        patterns: Regular expressions of the matcher.
+        symbols: Symbols of all the patterns.
+
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        *,
+        cache_size: int = 10000,
+        min_hit_ratio: float = 0.5,
+        max_bad_flushes: int = 3,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("The cache size must be positive")
+
+        self.patterns = tuple(patterns)
+
+        automata = [REParser().create_automaton(p) for p in self.patterns]
+        self.symbols = tuple(dict.fromkeys(
+            symbol for automaton in automata for symbol in automaton.symbols
+        ))
+        self._symbol_index = {s: i for i, s in enumerate(self.symbols)}
+
+        # Every automaton is shifted to its own range of bits
+        successors: List[List[int]] = [[] for _ in self.symbols]
+        finals: Dict[int, int] = {}
+        initial = 0
+        offset = 0
+        for pattern_id, automaton in enumerate(automata):
+            tables = automaton.get_bitset_tables()
+            n_states = len(automaton.states)
+            empty = (0,) * n_states
+            for symbol, row in zip(self.symbols, successors):
+                row.extend(
+                    mask << offset
+                    for mask in tables.successors.get(symbol, empty)
+                )
+
+            for i, state in enumerate(automaton.states):
+                if state.is_final:
+                    finals[offset + i] = pattern_id
+
+            initial |= tables.initial << offset
+            offset += n_states
+
+        rows = [tuple(row) for row in successors]
+        self._anchored, self._unanchored = (
+            _LazyDFA(
+                rows,
+                finals,
+                initial,
+                restart,
+                cache_size=cache_size,
+                min_hit_ratio=min_hit_ratio,
+                max_bad_flushes=max_bad_flushes,
+            )
+            for restart in (0, initial)
+        )
+
+    def match(self, string: str) -> FrozenSet[int]:
+        """
+        Return the patterns that accept a whole string.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            Identifiers of the patterns that accept the string.
+
+        """
+        dfa = self._anchored
+        state = dfa.initial
+        for char in string:
+            symbol = self._symbol_index.get(char)
+            if symbol is None:
+                return frozenset()
+
+            state = dfa.step(state, symbol)
+            if not dfa.masks[state]:
+                return frozenset()
+
+        return dfa.tags[state]
+
+    def scan(self, text: str) -> Iterator[Tuple[int, FrozenSet[int]]]:
+        """
+        Find the ends of the substrings accepted by some pattern.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Iterator over each offset where at least one match ends, with
+            the identifiers of the patterns matched there.
+
+        """
+        dfa = self._unanchored
+        state = dfa.initial
+        if dfa.tags[state]:
+            yield 0, dfa.tags[state]
+
+        for offset, char in enumerate(text, 1):
+            symbol = self._symbol_index.get(char)
+            if symbol is None:
+                # No match goes through an unknown symbol
+                state = dfa.initial
+            else:
+                state = dfa.step(state, symbol)
+
+            if dfa.tags[state]:
+                yield offset, dfa.tags[state]
+
+    def search(self, text: str) -> FrozenSet[int]:
+        """
+        Return the patterns that accept some substring of a text.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Identifiers of the patterns found in the text.
+
+        """
+        found: FrozenSet[int] = frozenset()
+        for _, patterns in self.scan(text):
+            found |= patterns
+
+        return found
@@ -0,0 +1,340 @@
+"""Construction of deterministic automata with Brzozowski derivatives."""
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser_interfaces import _re_to_rpn
+
+_EMPTY = "empty"
+_LAMBDA = "lambda"
+_SYMBOL = "symbol"
+_STAR = "star"
+_CONCAT = "concat"
+_UNION = "union"
+
+
+class _Regex():
+    """
+    Node of a normalized regex.
+
+    Nodes are hash-consed by their factory, so structurally equal regexes
+    are the same object and can be compared and hashed by identity.
+    """
+
+    __slots__ = ("kind", "symbol", "children", "nullable", "uid")
+
+    def __init__(
+        self,
+        kind: str,
+        symbol: Optional[str],
+        children: Tuple["_Regex", ...],
+        nullable: bool,
+        uid: int,
+    ) -> None:
+        self.kind = kind
+        self.symbol = symbol
+        self.children = children
+        self.nullable = nullable
+        self.uid = uid
+
+
+class _RegexFactory():
+    """
+    Smart constructors and derivatives of regexes.
+
+    The constructors normalize concatenations (associativity, identity
+    and annihilator) and unions (associativity, commutativity,
+    idempotence and identity), which is enough for the set of derivatives
+    of a regex to be finite. Concatenations are nested to the right, as a
+    factor and the concatenation of the rest, so the tails of a long
+    concatenation are shared instead of copied.
+    """
+
+    def __init__(self) -> None:
+        self._table: Dict[Tuple[object, ...], _Regex] = {}
+        self._derivatives: Dict[Tuple[_Regex, str], _Regex] = {}
+        self.empty = self._intern(_EMPTY, None, (), False)
+        self.lambda_ = self._intern(_LAMBDA, None, (), True)
+
+    def _intern(
+        self,
+        kind: str,
+        symbol: Optional[str],
+        children: Tuple[_Regex, ...],
+        nullable: bool,
+    ) -> _Regex:
+        key = (kind, symbol, children)
+        node = self._table.get(key)
+        if node is None:
+            node = _Regex(kind, symbol, children, nullable, len(self._table))
+            self._table[key] = node
+        return node
+
+    def symbol(self, symbol: str) -> _Regex:
+        return self._intern(_SYMBOL, symbol, (), False)
+
+    def star(self, regex: _Regex) -> _Regex:
+        if regex.kind in (_EMPTY, _LAMBDA):
+            return self.lambda_
+        if regex.kind == _STAR:
+            return regex
+        if regex.kind == _UNION and regex.nullable:
+            # (λ + r)* = r*
+            regex = self.union(
+                r for r in regex.children if r is not self.lambda_
+            )
+        return self._intern(_STAR, None, (regex,), True)
+
+    def concat(self, regexes: Iterable[_Regex]) -> _Regex:
+        factors: List[_Regex] = []
+        for regex in regexes:
+            if regex.kind == _EMPTY:
+                return self.empty
+            if regex.kind != _LAMBDA:
+                factors.append(regex)
+
+        result = self.lambda_
+        for regex in reversed(factors):
+            result = self._prepend(regex, result)
+        return result
+
+    def _prepend(self, head: _Regex, tail: _Regex) -> _Regex:
+        """Concatenation of a regex and a normalized tail, which can be λ."""
+        if tail is self.lambda_:
+            return head
+
+        # (r1 r2) r3 = r1 (r2 r3)
+        heads = []
+        while head.kind == _CONCAT:
+            heads.append(head.children[0])
+            head = head.children[1]
+        heads.append(head)
+
+        for factor in reversed(heads):
+            tail = self._intern(
+                _CONCAT,
+                None,
+                (factor, tail),
+                factor.nullable and tail.nullable,
+            )
+        return tail
+
+    def union(self, regexes: Iterable[_Regex]) -> _Regex:
+        members: Dict[_Regex, None] = {}
+        for regex in regexes:
+            if regex.kind == _UNION:
+                members.update(dict.fromkeys(regex.children))
+            elif regex.kind != _EMPTY:
+                members[regex] = None
+
+        if len(members) > 1 and self.lambda_ in members:
+            # λ is redundant next to any other nullable member
+            if any(r.nullable for r in members if r is not self.lambda_):
+                del members[self.lambda_]
+
+        if not members:
+            return self.empty
+        if len(members) == 1:
+            return next(iter(members))
+        alternatives = tuple(sorted(members, key=lambda r: r.uid))
+        return self._intern(
+            _UNION,
+            None,
+            alternatives,
+            any(r.nullable for r in alternatives),
+        )
+
+    def derivative(self, regex: _Regex, symbol: str) -> _Regex:
+        """
+        Derivative of a regex with respect to a symbol.
+
+        The derivatives of the subexpressions are computed first, with an
+        explicit stack, so deeply nested regexes do not exhaust the
+        recursion limit.
+
+        Args:
+            regex: Regex to derive.
+            symbol: Symbol to remove from the front of the words.
+
+        Returns:
+            Regex for the words w such that symbol·w is in regex.
+
+        """
+        derivatives = self._derivatives
+        result = derivatives.get((regex, symbol))
+        if result is not None:
+            return result
+
+        stack = [regex]
+        while stack:
+            node = stack[-1]
+            if (node, symbol) in derivatives:
+                stack.pop()
+                continue
+
+            missing = [
+                r for r in self._derived_parts(node)
+                if (r, symbol) not in derivatives
+            ]
+            if missing:
+                stack.extend(missing)
+                continue
+
+            stack.pop()
+            derivatives[(node, symbol)] = self._combine(node, symbol)
+
+        return derivatives[(regex, symbol)]
+
+    def _derived_parts(self, regex: _Regex) -> List[_Regex]:
+        """Subexpressions whose derivatives make up the one of a regex."""
+        if regex.kind == _STAR:
+            return [regex.children[0]]
+        if regex.kind == _UNION:
+            return list(regex.children)
+        if regex.kind == _CONCAT:
+            # The factors up to the first one that is not nullable, and the
+            # last one if all of them are
+            parts = []
+            rest = regex
+            while rest.kind == _CONCAT:
+                factor, rest = rest.children
+                parts.append(factor)
+                if not factor.nullable:
+                    break
+            else:
+                parts.append(rest)
+            return parts
+        return []
+
+    def _combine(self, regex: _Regex, symbol: str) -> _Regex:
+        """Derivative of a regex whose parts are already derived."""
+        derivatives = self._derivatives
+        if regex.kind == _SYMBOL:
+            return self.lambda_ if regex.symbol == symbol else self.empty
+        if regex.kind == _STAR:
+            return self.concat(
+                (derivatives[(regex.children[0], symbol)], regex),
+            )
+        if regex.kind == _UNION:
+            return self.union(
+                derivatives[(r, symbol)] for r in regex.children
+            )
+        if regex.kind == _CONCAT:
+            # d(r1 r2 ... rk) = d(r1) r2 ... rk + d(r2) r3 ... rk + ...
+            # while the prefixes r1 ... ri are nullable
+            alternatives = []
+            rest = regex
+            while rest.kind == _CONCAT:
+                factor, rest = rest.children
+                alternatives.append(self.concat(
+                    (derivatives[(factor, symbol)], rest),
+                ))
+                if not factor.nullable:
+                    break
+            else:
+                alternatives.append(derivatives[(rest, symbol)])
+            return self.union(alternatives)
+        return self.empty
+
+
+class _Pending():
+    """Concatenation or union still collecting operands in the parser."""
+
+    __slots__ = ("operator", "operands")
+
+    def __init__(self, operator: str, operands: List[_Regex]) -> None:
+        self.operator = operator
+        self.operands = operands
+
+
+def _parse(
+    factory: _RegexFactory,
+    re_string: str,
+) -> Tuple[_Regex, Tuple[str, ...]]:
+    """Parse a regex into normalized nodes and its symbols in order."""
+    if not re_string:
+        return factory.lambda_, ()
+
+    def finish(item: Union[_Regex, _Pending]) -> _Regex:
+        if isinstance(item, _Regex):
+            return item
+        if item.operator == ".":
+            return factory.concat(item.operands)
+        return factory.union(item.operands)
+
+    # Chains of the same binary operator are collected in a single list
+    # before normalizing them, so long regexes are parsed in linear time
+    symbols: Dict[str, None] = {}
+    stack: List[Union[_Regex, _Pending]] = []
+    for x in _re_to_rpn(re_string):
+        if x == "*":
+            stack.append(factory.star(finish(stack.pop())))
+        elif x in "+.":
+            right = finish(stack.pop())
+            left = stack.pop()
+            if isinstance(left, _Pending) and left.operator == x:
+                left.operands.append(right)
+                stack.append(left)
+            else:
+                stack.append(_Pending(x, [finish(left), right]))
+        elif x == "λ":
+            stack.append(factory.lambda_)
+        else:
+            symbols[x] = None
+            stack.append(factory.symbol(x))
+
+    return finish(stack.pop()), tuple(symbols)
+
+
+def create_dfa(re_string: str) -> FiniteAutomaton:
+    """
+    Create a deterministic automaton from a regex with derivatives.
+
+    Each state is a normalized derivative of the regex, and it is final
+    if the derivative accepts the empty string. The automaton is complete
+    and has no unreachable states. It is not always minimal, but it is
+    usually much smaller than the subset construction of the Thompson
+    automaton.
+
+    Args:
+        re_string: String with the regular expression in Kleene notation.
+
+    Returns:
+        Deterministic automaton equivalent to the regex.
+
+    """
+    factory = _RegexFactory()
+    root, symbols = _parse(factory, re_string)
+
+    def new_state(regex: _Regex) -> State:
+        if regex is factory.empty:
+            return State(name="empty", is_final=False)
+        return State(name=f"q{len(states)}", is_final=regex.nullable)
+
+    states: Dict[_Regex, State] = {}
+    states[root] = new_state(root)
+    transitions: List[Transition] = []
+
+    queue: Deque[_Regex] = deque([root])
+    while queue:
+        regex = queue.popleft()
+        for symbol in symbols:
+            target = factory.derivative(regex, symbol)
+            target_state = states.get(target)
+            if target_state is None:
+                target_state = new_state(target)
+                states[target] = target_state
+                queue.append(target)
+
+            transitions.append(Transition(
+                initial_state=states[regex],
+                symbol=symbol,
+                final_state=target_state,
+            ))
+
+    return FiniteAutomaton.from_trusted(
+        initial_state=states[root],
+        states=states.values(),
+        symbols=symbols,
+        transitions=transitions,
+    )
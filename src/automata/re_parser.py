@@ -1,7 +1,182 @@
 """Conversion from regex to automata."""
-from automata.automaton import FiniteAutomaton, State, Transition
-from automata.re_parser_interfaces import AbstractREParser
-from typing import Collection
+from automata.automaton import FiniteAutomaton, State, Transition, iter_bits
+from automata.re_derivatives import create_dfa
+from automata.re_parser_interfaces import AbstractREParser, _re_to_rpn
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+# Initial and final state of a partial automaton
+_Fragment = Tuple[State, State]
+
+# Nullability, first positions and last positions of a subexpression
+_PositionFragment = Tuple[bool, int, int]
+
+
+class _ThompsonBuilder():
+    """
+    Thompson construction over shared mutable lists.
+
+    Partial automata (fragments) are just their initial and final states,
+    while all their states and transitions are appended to the lists of the
+    builder, so each operation takes constant time and the automaton is
+    only built (and validated) once at the end.
+    """
+
+    def __init__(self, add_state: Callable[[], str]) -> None:
+        self._add_state = add_state
+        self.states: List[State] = []
+        self.symbols: Dict[str, None] = {}
+        self.transitions: List[Transition] = []
+
+    def _new_state(self) -> State:
+        state = State(name=self._add_state(), is_final=False)
+        self.states.append(state)
+        return state
+
+    def _connect(
+        self,
+        state1: State,
+        symbol: Optional[str],
+        state2: State,
+    ) -> None:
+        self.transitions.append(Transition(
+            initial_state=state1,
+            symbol=symbol,
+            final_state=state2,
+        ))
+
+    def symbol(self, symbol: Optional[str]) -> _Fragment:
+        state1 = self._new_state()
+        state2 = self._new_state()
+        if symbol is not None:
+            self.symbols[symbol] = None
+        self._connect(state1, symbol, state2)
+        return state1, state2
+
+    def star(self, fragment: _Fragment) -> _Fragment:
+        inner_initial, inner_final = fragment
+        initial_state = self._new_state()
+        final_state = self._new_state()
+        self._connect(inner_final, None, final_state)
+        self._connect(inner_final, None, inner_initial)
+        self._connect(initial_state, None, inner_initial)
+        self._connect(initial_state, None, final_state)
+        return initial_state, final_state
+
+    def union(self, fragment1: _Fragment, fragment2: _Fragment) -> _Fragment:
+        new_initial = self._new_state()
+        new_final = self._new_state()
+        self._connect(new_initial, None, fragment1[0])
+        self._connect(new_initial, None, fragment2[0])
+        self._connect(fragment1[1], None, new_final)
+        self._connect(fragment2[1], None, new_final)
+        return new_initial, new_final
+
+    def concat(self, fragment1: _Fragment, fragment2: _Fragment) -> _Fragment:
+        self._connect(fragment1[1], None, fragment2[0])
+        return fragment1[0], fragment2[1]
+
+    def build(self, fragment: _Fragment) -> FiniteAutomaton:
+        fragment[1].is_final = True
+        return FiniteAutomaton.from_trusted(
+            initial_state=fragment[0],
+            states=self.states,
+            symbols=tuple(self.symbols),
+            transitions=self.transitions,
+        )
+
+
+class _GlushkovBuilder():
+    """
+    Glushkov (position automaton) construction.
+
+    Each occurrence of a symbol in the regex is a position, and a state of
+    the automaton. Subexpressions are summarized by whether they accept the
+    empty string and by the bitsets of their first and last positions, while
+    the follow sets of the positions are accumulated in the builder. The
+    result has one state per symbol plus the initial one and no lambda
+    transitions.
+    """
+
+    def __init__(self) -> None:
+        # Position 0 is the initial state, it is never followed
+        self.position_symbols: List[str] = [""]
+        self.follow: List[Dict[int, None]] = [{}]
+
+    def symbol(self, symbol: str) -> _PositionFragment:
+        position = len(self.position_symbols)
+        self.position_symbols.append(symbol)
+        self.follow.append({})
+        return False, 1 << position, 1 << position
+
+    def lambda_(self) -> _PositionFragment:
+        return True, 0, 0
+
+    def _link(self, last: int, first: int) -> None:
+        targets = dict.fromkeys(iter_bits(first))
+        for position in iter_bits(last):
+            self.follow[position].update(targets)
+
+    def star(self, fragment: _PositionFragment) -> _PositionFragment:
+        _, first, last = fragment
+        self._link(last, first)
+        return True, first, last
+
+    def union(
+        self,
+        fragment1: _PositionFragment,
+        fragment2: _PositionFragment,
+    ) -> _PositionFragment:
+        return (
+            fragment1[0] or fragment2[0],
+            fragment1[1] | fragment2[1],
+            fragment1[2] | fragment2[2],
+        )
+
+    def concat(
+        self,
+        fragment1: _PositionFragment,
+        fragment2: _PositionFragment,
+    ) -> _PositionFragment:
+        nullable1, first1, last1 = fragment1
+        nullable2, first2, last2 = fragment2
+        self._link(last1, first2)
+        return (
+            nullable1 and nullable2,
+            first1 | first2 if nullable1 else first1,
+            last1 | last2 if nullable2 else last2,
+        )
+
+    def build(
+        self,
+        fragment: _PositionFragment,
+        add_state: Callable[[], str],
+    ) -> FiniteAutomaton:
+        nullable, first, last = fragment
+        self.follow[0] = dict.fromkeys(iter_bits(first))
+        final_positions = set(iter_bits(last))
+        if nullable:
+            final_positions.add(0)
+
+        states = [
+            State(name=add_state(), is_final=position in final_positions)
+            for position in range(len(self.position_symbols))
+        ]
+        transitions = [
+            Transition(
+                initial_state=states[position],
+                symbol=self.position_symbols[target],
+                final_state=states[target],
+            )
+            for position, targets in enumerate(self.follow)
+            for target in targets
+        ]
+        return FiniteAutomaton.from_trusted(
+            initial_state=states[0],
+            states=states,
+            symbols=tuple(dict.fromkeys(self.position_symbols[1:])),
+            transitions=transitions,
+        )
+
 
 class REParser(AbstractREParser):
     """Class for processing regular expressions in Kleene's syntax."""
@@ -12,16 +187,127 @@ class REParser(AbstractREParser):
         self.state_counter+=1
         return 's'+str(self.state_counter-1)
 
+    def create_automaton(
+        self,
+        re_string: str,
+        *,
+        backend: str = "thompson",
+    ) -> FiniteAutomaton:
+        """
+        Create an automaton from a regex.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+            backend: Construction, either ``"thompson"`` (about two states
+                per symbol and operator, joined by lambda transitions) or
+                ``"glushkov"`` (one state per symbol plus the initial one,
+                without lambda transitions).
+
+        Returns:
+            Automaton equivalent to the regex.
+
+        """
+        if backend == "thompson":
+            return self._create_automaton_thompson(re_string)
+        if backend == "glushkov":
+            return self._create_automaton_glushkov(re_string)
+
+        raise ValueError(f"Unknown regex parser backend: {backend}")
+
+    def create_dfa(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        """
+        Create a deterministic automaton from a regex.
+
+        The states are the Brzozowski derivatives of the regex, so no
+        intermediate automaton is built.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Deterministic automaton equivalent to the regex.
+
+        """
+        return create_dfa(re_string)
+
+    def _create_automaton_thompson(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        # Same construction as the _create_automaton_* methods, but the
+        # intermediate automata are fragments of a single builder, so the
+        # cost is linear in the length of the regex
+        self.state_counter = 0
+        if not re_string:
+            return self._create_automaton_empty()
+
+        rpn_string = _re_to_rpn(re_string)
+
+        builder = _ThompsonBuilder(self._add_state)
+        stack: List[_Fragment] = []
+        for x in rpn_string:
+            if x == "*":
+                fragment = stack.pop()
+                stack.append(builder.star(fragment))
+            elif x == "+":
+                fragment2 = stack.pop()
+                fragment1 = stack.pop()
+                stack.append(builder.union(fragment1, fragment2))
+            elif x == ".":
+                fragment2 = stack.pop()
+                fragment1 = stack.pop()
+                stack.append(builder.concat(fragment1, fragment2))
+            elif x == "λ":
+                stack.append(builder.symbol(None))
+            else:
+                stack.append(builder.symbol(x))
+
+        return builder.build(stack.pop())
+
+    def _create_automaton_glushkov(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        self.state_counter = 0
+        if not re_string:
+            return self._create_automaton_empty()
+
+        rpn_string = _re_to_rpn(re_string)
+
+        builder = _GlushkovBuilder()
+        stack: List[_PositionFragment] = []
+        for x in rpn_string:
+            if x == "*":
+                fragment = stack.pop()
+                stack.append(builder.star(fragment))
+            elif x == "+":
+                fragment2 = stack.pop()
+                fragment1 = stack.pop()
+                stack.append(builder.union(fragment1, fragment2))
+            elif x == ".":
+                fragment2 = stack.pop()
+                fragment1 = stack.pop()
+                stack.append(builder.concat(fragment1, fragment2))
+            elif x == "λ":
+                stack.append(builder.lambda_())
+            else:
+                stack.append(builder.symbol(x))
+
+        return builder.build(stack.pop(), self._add_state)
+
     def _create_automaton_empty(
         self,
     ) -> FiniteAutomaton:
 
         initial_state = State(name=self._add_state(), is_final=True)
-        states: Collection[State] = {initial_state} # Contains only one state
-        symbols: Collection[str] = {} # is empty
-        transitions: Collection[Transition] = {} # is empty
+        states: Collection[State] = (initial_state,) # Contains only one state
+        symbols: Collection[str] = () # is empty
+        transitions: Collection[Transition] = () # is empty
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state = initial_state,
             states = states,
             symbols = symbols,
@@ -37,11 +323,11 @@ class REParser(AbstractREParser):
         transition1 = Transition(initial_state=state1, symbol=None, final_state=state2)
 
         initial_state = state1
-        states: Collection[State] = {state1, state2}
-        symbols: Collection[str] = {} # is empty
-        transitions: Collection[Transition] = {transition1}
+        states: Collection[State] = (state1, state2)
+        symbols: Collection[str] = () # is empty
+        transitions: Collection[Transition] = (transition1,)
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state = initial_state,
             states = states,
             symbols = symbols,
@@ -58,11 +344,11 @@ class REParser(AbstractREParser):
         transition1 = Transition(initial_state=state1, symbol=symbol, final_state=state2)
 
         initial_state = state1
-        states: Collection[State] = {state1, state2}
-        symbols: Collection[str] = {symbol}
-        transitions: Collection[Transition] = {transition1}
+        states: Collection[State] = (state1, state2)
+        symbols: Collection[str] = (symbol,)
+        transitions: Collection[Transition] = (transition1,)
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state = initial_state,
             states = states,
             symbols = symbols,
@@ -100,7 +386,7 @@ class REParser(AbstractREParser):
         # Add transition from new initial state to final
         transitions += (Transition(initial_state=initial_state, symbol=None, final_state=final_state), )
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state = initial_state,
             states = states,
             symbols = symbols,
@@ -137,7 +423,7 @@ class REParser(AbstractREParser):
                 state.is_final = False
                 transitions += (Transition(initial_state=state, symbol=None, final_state=new_final), )
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state = new_initial,
             states = states,
             symbols = symbols,
@@ -167,7 +453,7 @@ class REParser(AbstractREParser):
                 state.is_final = False
                 transitions += (Transition(initial_state=state, symbol=None, final_state=automaton2.initial_state), )
 
-        return FiniteAutomaton(
+        return FiniteAutomaton.from_trusted(
             initial_state = initial_state,
             states = states,
             symbols = symbols,
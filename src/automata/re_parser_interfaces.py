@@ -19,29 +19,29 @@ def _re_to_rpn(re_string: str) -> str:
 
     """
     stack: List[str] = []
-    rpn_string = ""
+    rpn: List[str] = []
     for x in re_string:
         if x == "+":
             while len(stack) > 0 and stack[-1] != "(":
-                rpn_string += stack.pop()
+                rpn.append(stack.pop())
             stack.append(x)
         elif x == ".":
             while len(stack) > 0 and stack[-1] == ".":
-                rpn_string += stack.pop()
+                rpn.append(stack.pop())
             stack.append(x)
         elif x == "(":
             stack.append(x)
         elif x == ")":
             while stack[-1] != "(":
-                rpn_string += stack.pop()
+                rpn.append(stack.pop())
             stack.pop()
         else:
-            rpn_string += x
+            rpn.append(x)
 
     while len(stack) > 0:
-        rpn_string += stack.pop()
+        rpn.append(stack.pop())
 
-    return rpn_string
+    return "".join(rpn)
 
 
 class AbstractREParser(ABC):
@@ -0,0 +1,191 @@
+"""Search of the substrings of a text accepted by an automaton."""
+from typing import Dict, Final, Iterator, List, Optional, Sequence, Tuple, Union
+
+import automata.automaton as aut
+from automata.compiled_automaton import CompiledAutomaton
+
+_Text = Union[str, bytes, bytearray, memoryview]
+
+# Steps of a forward run before it starts recording the states it reaches
+_UNRECORDED_STEPS: Final = 64
+
+
+def _unanchored_reverse(
+    automaton: "aut.FiniteAutomaton",
+) -> "aut.FiniteAutomaton":
+    """Automaton for any string followed by the reverse of a word."""
+    # Fresh names: states may share a name and only differ in finality
+    start = aut.State(name="start", is_final=False)
+    copies = {
+        s: aut.State(name=f"r{i}", is_final=s == automaton.initial_state)
+        for i, s in enumerate(automaton.states)
+    }
+
+    transitions: List[aut.Transition] = [
+        aut.Transition(start, symbol, start) for symbol in automaton.symbols
+    ]
+    transitions += [
+        aut.Transition(start, None, copies[s])
+        for s in automaton.states if s.is_final
+    ]
+    transitions += [
+        aut.Transition(
+            copies[t.final_state],
+            t.symbol,
+            copies[t.initial_state],
+        )
+        for t in automaton.transitions
+    ]
+
+    return aut.FiniteAutomaton.from_trusted(
+        initial_state=start,
+        states=[start, *copies.values()],
+        symbols=automaton.symbols,
+        transitions=transitions,
+    )
+
+
+class AutomatonSearcher():
+    """
+    Search of the substrings of a text accepted by an automaton.
+
+    Matches are reported leftmost-longest and without overlaps, in the
+    manner of POSIX regular expressions. Two deterministic automata are
+    built once: the unanchored reverse automaton (any string followed by
+    the reverse of a word), and the anchored automaton. A single backward
+    pass with the first one marks every position where a match starts.
+    Then, from each start, the second one is run forward until it dies to
+    find the longest match. A forward run stops as soon as it reaches a
+    position and state already reached by a previous run, since the rest
+    of the run would be the same, so the whole search takes time linear
+    in the text times the number of states of the anchored automaton.
+    Symbols that are not in the automaton can only
+    be matched by empty matches.
+
+    Args:
+        automaton: Automaton whose words are searched.
+
+    """
+
+    def __init__(self, automaton: "aut.FiniteAutomaton") -> None:
+        self.forward = automaton.to_deterministic().compile()
+        self.reverse = (
+            _unanchored_reverse(automaton).to_deterministic().compile()
+        )
+
+    def _starts(self, codes: Sequence[int]) -> bytearray:
+        """Mark the positions where some match starts."""
+        reverse = self.reverse
+        table = reverse.table
+        finals = reverse.finals
+        n_symbols = len(reverse.symbols)
+
+        state = reverse.initial
+        starts = bytearray(len(codes) + 1)
+        starts[len(codes)] = finals[state]
+        for i in range(len(codes) - 1, -1, -1):
+            code = codes[i]
+            if code >= n_symbols:
+                # No match goes through an unknown symbol
+                state = reverse.initial
+            else:
+                state = table[state * n_symbols + code]
+            starts[i] = finals[state]
+
+        return starts
+
+    def _longest_end(
+        self,
+        codes: Sequence[int],
+        start: int,
+        known: Dict[int, int],
+    ) -> int:
+        """
+        Return the end of the longest match from a start.
+
+        Past its first steps, a run records in ``known`` each (position,
+        state) pair it reaches, with the greatest final position after it
+        (-1 if there is none), and stops at a pair recorded by a previous
+        run, since the rest would be the same.
+        """
+        forward = self.forward
+        table = forward.table
+        finals = forward.finals
+        dead = forward.dead
+        n_symbols = len(forward.symbols)
+        n_states = len(finals)
+
+        state = forward.initial
+        end = start
+        visited = []
+        # Short runs are cheaper without the bookkeeping
+        memo_start = min(start + _UNRECORDED_STEPS, len(codes))
+        for i in range(start, memo_start):
+            code = codes[i]
+            if code >= n_symbols:
+                return end
+
+            state = table[state * n_symbols + code]
+            if state < 0 or dead[state]:
+                return end
+
+            if finals[state]:
+                end = i + 1
+
+        for i in range(memo_start, len(codes)):
+            code = codes[i]
+            if code >= n_symbols:
+                break
+
+            state = table[state * n_symbols + code]
+            if state < 0 or dead[state]:
+                break
+
+            key = i * n_states + state
+            rest = known.get(key)
+            if rest is not None:
+                end = max(end, rest)
+                break
+
+            visited.append(key)
+            if finals[state]:
+                end = i + 1
+
+        for key in visited:
+            known[key] = end if end > key // n_states else -1
+
+        return end
+
+    def finditer(self, text: _Text) -> Iterator[Tuple[int, int]]:
+        """
+        Find all the non overlapping matches in a text.
+
+        Args:
+            text: Text to search. Bytes are read as latin-1.
+
+        Returns:
+            Iterator over the ``(start, end)`` offsets of the matches.
+
+        """
+        codes = self.forward.encode(text, strict=False)
+        starts = self._starts(codes)
+        known: Dict[int, int] = {}
+
+        position = starts.find(1)
+        while position >= 0:
+            end = self._longest_end(codes, position, known)
+            yield position, end
+            position = starts.find(1, end if end > position else end + 1)
+
+    def search(self, text: _Text) -> Optional[Tuple[int, int]]:
+        """
+        Find the leftmost-longest match in a text.
+
+        Args:
+            text: Text to search. Bytes are read as latin-1.
+
+        Returns:
+            The ``(start, end)`` offsets of the match, or ``None``.
+
+        """
+        return next(self.finditer(text), None)
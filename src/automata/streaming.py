@@ -0,0 +1,236 @@
+"""Evaluation of automata over streams of text."""
+import codecs
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Union,
+)
+
+from automata.interfaces import AbstractFiniteAutomatonEvaluator
+
+_Chunk = Union[str, bytes, bytearray, memoryview]
+
+# A text, a bytes-like object, an object with a read method (files, mmap)
+# or an iterable of chunks
+Source = Union[_Chunk, Any, Iterable[_Chunk]]
+
+_Evaluator = AbstractFiniteAutomatonEvaluator[Any, Any]
+
+
+def iter_text_chunks(
+    source: Source,
+    *,
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> Iterator[str]:
+    """
+    Split a source of text in chunks.
+
+    Bytes are decoded incrementally, so characters split between two chunks
+    are decoded correctly.
+
+    Args:
+        source: A string, a bytes-like object, an object with a ``read``
+            method (such as a file or a ``mmap``) or an iterable of strings
+            or bytes.
+        chunk_size: Size of the chunks read from files and bytes-like
+            objects.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        Iterator over the chunks of text.
+
+    """
+    if isinstance(source, str):
+        yield source
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    chunks: Iterable[_Chunk]
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        chunks = (
+            view[i:i + chunk_size] for i in range(0, len(view), chunk_size)
+        )
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk
+        else:
+            yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", True)
+
+
+async def aiter_text_chunks(
+    source: AsyncIterable[_Chunk],
+    *,
+    encoding: str = "utf-8",
+) -> AsyncIterator[str]:
+    """
+    Decode the chunks of an asynchronous source of text.
+
+    Args:
+        source: Asynchronous iterable of strings or bytes.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        Asynchronous iterator over the chunks of text.
+
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    async for chunk in source:
+        if isinstance(chunk, str):
+            yield chunk
+        else:
+            yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", True)
+
+
+def process_stream(
+    evaluator: _Evaluator,
+    source: Source,
+    *,
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Process a stream of symbols, keeping the state between chunks.
+
+    Args:
+        evaluator: Evaluator that consumes the symbols.
+        source: Source of text (see :func:`iter_text_chunks`).
+        chunk_size: Size of the chunks read from the source.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        Number of symbols processed.
+
+    """
+    n_symbols = 0
+    for chunk in iter_text_chunks(
+        source,
+        chunk_size=chunk_size,
+        encoding=encoding,
+    ):
+        evaluator.process_string(chunk)
+        n_symbols += len(chunk)
+
+    return n_symbols
+
+
+def accepts_stream(
+    evaluator: _Evaluator,
+    source: Source,
+    *,
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> bool:
+    """
+    Return if a stream of symbols is accepted without changing state.
+
+    Note: This function is NOT thread-safe.
+
+    Args:
+        evaluator: Evaluator that consumes the symbols.
+        source: Source of text (see :func:`iter_text_chunks`).
+        chunk_size: Size of the chunks read from the source.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        ``True`` if the whole stream is accepted.
+
+    """
+    old_states = evaluator.current_states
+    try:
+        process_stream(
+            evaluator,
+            source,
+            chunk_size=chunk_size,
+            encoding=encoding,
+        )
+        accepted = evaluator.is_accepting()
+    finally:
+        evaluator.current_states = old_states
+
+    return accepted
+
+
+async def accepts_async_stream(
+    evaluator: _Evaluator,
+    source: AsyncIterable[_Chunk],
+    *,
+    encoding: str = "utf-8",
+) -> bool:
+    """
+    Return if an asynchronous stream is accepted without changing state.
+
+    Note: This function is NOT thread-safe.
+
+    Args:
+        evaluator: Evaluator that consumes the symbols.
+        source: Asynchronous iterable of strings or bytes.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        ``True`` if the whole stream is accepted.
+
+    """
+    old_states = evaluator.current_states
+    try:
+        async for chunk in aiter_text_chunks(source, encoding=encoding):
+            evaluator.process_string(chunk)
+        accepted = evaluator.is_accepting()
+    finally:
+        evaluator.current_states = old_states
+
+    return accepted
+
+
+def iter_accepting_offsets(
+    evaluator: _Evaluator,
+    source: Source,
+    *,
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> Iterator[int]:
+    """
+    Process a stream and report where the automaton is in a final state.
+
+    The evaluator keeps the state reached at the end of the stream.
+
+    Args:
+        evaluator: Evaluator that consumes the symbols.
+        source: Source of text (see :func:`iter_text_chunks`).
+        chunk_size: Size of the chunks read from the source.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        Iterator over the number of symbols consumed each time that the
+        evaluator reaches an accepting state, ``0`` included if the
+        initial state is accepting.
+
+    """
+    offset = 0
+    if evaluator.is_accepting():
+        yield offset
+
+    for chunk in iter_text_chunks(
+        source,
+        chunk_size=chunk_size,
+        encoding=encoding,
+    ):
+        for symbol in chunk:
+            evaluator.process_symbol(symbol)
+            offset += 1
+            if evaluator.is_accepting():
+                yield offset
@@ -0,0 +1,51 @@
+"""Helpers shared by the tests that compare recognized languages."""
+import itertools
+import unittest
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+
+
+def check_same_language(
+    test: unittest.TestCase,
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+    max_length: int = 5,
+) -> None:
+    """
+    Check that two automata accept the same strings up to a given length.
+
+    Args:
+        test: Test case used to report the failures.
+        automaton1: First automaton.
+        automaton2: Second automaton, over the same alphabet.
+        max_length: Length of the longest string to compare.
+
+    """
+    test.assertEqual(automaton1.symbols, automaton2.symbols)
+    for n in range(max_length + 1):
+        for letters in itertools.product(automaton1.symbols, repeat=n):
+            string = "".join(letters)
+            with test.subTest(string=string):
+                test.assertEqual(
+                    FiniteAutomatonEvaluator(automaton1).accepts(string),
+                    FiniteAutomatonEvaluator(automaton2).accepts(string),
+                )
+
+
+def accepts(automaton: FiniteAutomaton, string: str) -> bool:
+    """
+    Check whether an automaton accepts a string.
+
+    Args:
+        automaton: Automaton to evaluate.
+        string: String to check, possibly with symbols outside the alphabet.
+
+    Returns:
+        ``False`` if the string has foreign symbols, otherwise whether the
+        automaton accepts it.
+
+    """
+    if not set(string) <= set(automaton.symbols):
+        return False
+    return FiniteAutomatonEvaluator(automaton).accepts(string)
@@ -0,0 +1,70 @@
+"""Test construction of automata."""
+import unittest
+from typing import Any, Dict
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+
+class TestConstruction(unittest.TestCase):
+    """Tests for the validation of automata."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.q0 = State("q0")
+        self.q1 = State("q1", is_final=True)
+        self.transitions = [
+            Transition(self.q0, "a", self.q1),
+            Transition(self.q1, None, self.q0),
+        ]
+
+    def test_valid(self) -> None:
+        """Test that both constructors build the same automaton."""
+        automaton = FiniteAutomaton(
+            initial_state=self.q0,
+            states=[self.q0, self.q1],
+            symbols="ab",
+            transitions=self.transitions,
+        )
+        trusted = FiniteAutomaton.from_trusted(
+            initial_state=self.q0,
+            states=[self.q0, self.q1],
+            symbols="ab",
+            transitions=self.transitions,
+        )
+
+        self.assertEqual(automaton, trusted)
+        self.assertEqual(automaton.states, (self.q0, self.q1))
+        self.assertEqual(trusted.symbols, ("a", "b"))
+        self.assertEqual(
+            trusted.get_transition_index()[(self.q0, "a")],
+            (self.q1,),
+        )
+
+    def test_invalid(self) -> None:
+        """Test that the constructor rejects inconsistent automata."""
+        q2 = State("q2")
+        cases: Dict[str, Dict[str, Any]] = {
+            "initial": dict(initial_state=q2),
+            "state": dict(transitions=[Transition(self.q0, "a", q2)]),
+            "symbol": dict(transitions=[Transition(self.q0, "c", self.q1)]),
+            "repeated state": dict(states=[self.q0, self.q1, State("q0")]),
+            "repeated symbol": dict(symbols="aba"),
+            "repeated transition": dict(
+                transitions=self.transitions + self.transitions[:1],
+            ),
+        }
+
+        for name, arguments in cases.items():
+            with self.subTest(case=name):
+                with self.assertRaises(ValueError):
+                    FiniteAutomaton(**{
+                        "initial_state": self.q0,
+                        "states": [self.q0, self.q1],
+                        "symbols": "ab",
+                        "transitions": self.transitions,
+                        **arguments,
+                    })
+
+
+if __name__ == "__main__":
+    unittest.main()
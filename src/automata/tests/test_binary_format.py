@@ -0,0 +1,112 @@
+"""Test the binary format of automata."""
+import os
+import struct
+import tempfile
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.binary_format import dump, dumps, load, load_mapped, loads
+from automata.re_parser import REParser
+from automata.utils import FormatParseError
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Tests for the binary format."""
+
+    def _assert_same(
+        self,
+        automaton: FiniteAutomaton,
+        loaded: FiniteAutomaton,
+    ) -> None:
+        self.assertEqual(loaded.initial_state, automaton.initial_state)
+        self.assertEqual(loaded.states, automaton.states)
+        self.assertEqual(loaded.symbols, automaton.symbols)
+        self.assertEqual(
+            set(loaded.transitions),
+            set(automaton.transitions),
+        )
+
+    def test_round_trip(self) -> None:
+        """Test that automata are read back unchanged."""
+        q0 = State("q0")
+        q1 = State("q1", is_final=True)
+        automaton = FiniteAutomaton(
+            initial_state=q0,
+            states=(q0, q1),
+            symbols=("a", "ñ", "ab"),
+            transitions=(
+                Transition(q0, "ñ", q1),
+                Transition(q0, None, q1),
+                Transition(q0, "a", q0),
+                Transition(q0, "a", q1),
+                Transition(q1, "ab", q0),
+            ),
+        )
+        self._assert_same(automaton, loads(dumps(automaton)))
+
+        regex = REParser().create_automaton("(a+b)*.a.(a+b)")
+        self._assert_same(regex, loads(dumps(regex)))
+
+    def test_mapped(self) -> None:
+        """Test evaluation from the mapped file."""
+        automaton = REParser().create_dfa("(a+b)*.a.(a+b)")
+        # a.b* without the dead state
+        q0 = State("q0")
+        q1 = State("q1", is_final=True)
+        partial = FiniteAutomaton(
+            initial_state=q0,
+            states=(q0, q1),
+            symbols=("a", "b"),
+            transitions=(Transition(q0, "a", q1), Transition(q1, "b", q1)),
+        )
+        strings = ["", "a", "ab", "aa", "bab", "abba", "abbb", "ba"]
+        with tempfile.TemporaryDirectory() as directory:
+            for dfa in (automaton, partial):
+                path = os.path.join(directory, "dfa.aut")
+                dump(dfa, path)
+                self._assert_same(dfa, load(path))
+
+                evaluator = dfa.compile()
+                with load_mapped(path) as mapped:
+                    for string in strings:
+                        with self.subTest(string=string):
+                            self.assertEqual(
+                                mapped.accepts(string),
+                                evaluator.accepts(string),
+                            )
+                    with self.assertRaises(ValueError):
+                        mapped.accepts("c")
+
+            dump(REParser().create_automaton("a*"), path)
+            with self.assertRaises(ValueError):
+                load_mapped(path)
+
+    def test_invalid(self) -> None:
+        """Test that invalid data is rejected."""
+        data = dumps(REParser().create_dfa("a.b"))
+        for invalid in (b"", b"XXXX" + data[4:], data[:-4]):
+            with self.assertRaises(FormatParseError):
+                loads(invalid)
+
+    def test_mapped_invalid(self) -> None:
+        """Test that transitions out of the mapped arrays are rejected."""
+        data = bytearray(dumps(REParser().create_dfa("a.b")))
+        # The targets are the last section
+        n_transitions = struct.unpack_from("<I", data, 16)[0]
+        for i in range(n_transitions):
+            struct.pack_into("<I", data, len(data) - 4 * (i + 1), 1000)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dfa.aut")
+            with open(path, "wb") as file:
+                file.write(data)
+
+            with load_mapped(path) as mapped:
+                for string in ("a", "ab", "b"):
+                    with self.subTest(string=string):
+                        with self.assertRaises(FormatParseError):
+                            mapped.accepts(string)
+
+
+if __name__ == "__main__":
+    unittest.main()
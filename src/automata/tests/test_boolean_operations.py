@@ -0,0 +1,90 @@
+"""Test the boolean operations on automata."""
+import itertools
+import unittest
+from typing import Callable
+
+from automata.automaton import FiniteAutomaton
+from automata.re_parser import REParser
+from automata.tests.language import accepts
+from automata.utils import is_deterministic
+
+
+class TestBooleanOperations(unittest.TestCase):
+    """Tests for intersect, difference, symmetric_difference and complement."""
+
+    regexes = (
+        ("(a+b)*.a.(a+b)*", "(a+b)*.b.(a+b)*"),
+        ("(a.b)*", "a*.b*"),
+        ("a.(a+b)*", "(a+c)*"),
+        ("", "a*"),
+    )
+
+    def _check(
+        self,
+        result: FiniteAutomaton,
+        expected: Callable[[str], bool],
+        alphabet: str = "abc",
+    ) -> None:
+        self.assertTrue(is_deterministic(result))
+        for n in range(6):
+            for letters in itertools.product(alphabet, repeat=n):
+                string = "".join(letters)
+                with self.subTest(string=string):
+                    self.assertEqual(
+                        accepts(result, string),
+                        expected(string),
+                    )
+
+    def test_binary_operations(self) -> None:
+        """Test the products against evaluating both automata."""
+        for regex1, regex2 in self.regexes:
+            automaton1 = REParser().create_automaton(regex1)
+            automaton2 = REParser().create_automaton(regex2)
+            for minimize in (True, False):
+                with self.subTest(regex1=regex1, regex2=regex2):
+                    self._check(
+                        automaton1.intersect(automaton2, minimize=minimize),
+                        lambda s: accepts(automaton1, s)
+                        and accepts(automaton2, s),
+                    )
+                    self._check(
+                        automaton1.difference(automaton2, minimize=minimize),
+                        lambda s: accepts(automaton1, s)
+                        and not accepts(automaton2, s),
+                    )
+                    self._check(
+                        automaton1.symmetric_difference(
+                            automaton2,
+                            minimize=minimize,
+                        ),
+                        lambda s: accepts(automaton1, s)
+                        != accepts(automaton2, s),
+                    )
+
+    def test_complement(self) -> None:
+        """Test the complement, with and without extra symbols."""
+        for regex, _ in self.regexes:
+            automaton = REParser().create_automaton(regex)
+            with self.subTest(regex=regex):
+                complement = automaton.complement(minimize=False)
+                self._check(
+                    complement,
+                    lambda s: not accepts(automaton, s),
+                    alphabet="".join(complement.symbols),
+                )
+                self._check(
+                    automaton.complement("abc"),
+                    lambda s: not accepts(automaton, s),
+                )
+
+    def test_minimal(self) -> None:
+        """Test that the results are minimized."""
+        automaton1 = REParser().create_automaton("(a+b)*.a.(a+b)*")
+        automaton2 = REParser().create_automaton("(a+b)*.b.(a+b)*")
+
+        self.assertEqual(len(automaton1.intersect(automaton2).states), 4)
+        self.assertEqual(len(automaton1.complement().states), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Test the cache of compiled regexes."""
+import os
+import tempfile
+import unittest
+
+from automata.compile_cache import CompileCache
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism
+
+
+class TestCompileCache(unittest.TestCase):
+    """Tests for the compile cache."""
+
+    def test_memory(self) -> None:
+        """Test hits, normalization and the LRU bound."""
+        cache = CompileCache(maxsize=2)
+
+        automaton = cache.get("(a+b)*.a")
+        self.assertIs(cache.get("((a+b)*).a"), automaton)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNotNone(deterministic_automata_isomorphism(
+            automaton,
+            REParser().create_automaton("(a+b)*.a").to_deterministic()
+            .to_minimized(),
+        ))
+
+        cache.get("a")
+        cache.get("(a+b)*.a")
+        cache.get("b")
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get("(a+b)*.a"), automaton)
+        self.assertEqual(cache.misses, 3)
+
+    def test_disk(self) -> None:
+        """Test that a new cache reads the automata of a previous one."""
+        with tempfile.TemporaryDirectory() as directory:
+            automaton = CompileCache(directory=directory).get("a*.b.(a+b)")
+
+            cache = CompileCache(directory=directory)
+            loaded = cache.get("a*.b.(a+b)")
+            self.assertEqual((cache.disk_hits, cache.misses), (1, 0))
+            self.assertIsNotNone(
+                deterministic_automata_isomorphism(automaton, loaded),
+            )
+
+    def test_trim(self) -> None:
+        """Test that trimmed automata are stored apart, without trim stats."""
+        with tempfile.TemporaryDirectory() as directory:
+            complete = CompileCache(directory=directory).get("a.b")
+            trimmed_cache = CompileCache(directory=directory, trim=True)
+            trimmed = trimmed_cache.get("a.b")
+
+            self.assertEqual(trimmed_cache.misses, 1)
+            self.assertEqual(len(trimmed.states), len(complete.states) - 1)
+
+            loaded = CompileCache(directory=directory, trim=True).get("a.b")
+            self.assertEqual(len(loaded.states), len(trimmed.states))
+            self.assertIsNone(trimmed.trim_stats)
+            self.assertIsNone(loaded.trim_stats)
+
+    def test_corrupt_entry(self) -> None:
+        """Test that unreadable entries are compiled again."""
+        with tempfile.TemporaryDirectory() as directory:
+            CompileCache(directory=directory).get("a.b")
+            for name in os.listdir(directory):
+                with open(os.path.join(directory, name), "w") as file:
+                    file.write("garbage")
+
+            cache = CompileCache(directory=directory)
+            self.assertTrue(cache.get("a.b").initial_state is not None)
+            self.assertEqual((cache.disk_hits, cache.misses), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Test compiled evaluation of deterministic automata."""
+import itertools
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestCompiled(unittest.TestCase):
+    """Tests for the compiled automata."""
+
+    def _check_same_as_evaluator(self, regex: str, symbols: str) -> None:
+        automaton = REParser().create_automaton(regex).to_deterministic()
+        compiled = automaton.compile()
+        evaluator = FiniteAutomatonEvaluator(automaton)
+
+        for length in range(6):
+            for chars in itertools.product(symbols, repeat=length):
+                string = "".join(chars)
+                with self.subTest(regex=regex, string=string):
+                    self.assertEqual(
+                        compiled.accepts(string),
+                        evaluator.accepts(string),
+                    )
+
+    def test_same_as_evaluator(self) -> None:
+        """Test that the compiled automaton accepts the same strings."""
+        self._check_same_as_evaluator("a*.b*", "ab")
+        self._check_same_as_evaluator("(a+b)*.a.(a+b)", "ab")
+        self._check_same_as_evaluator("(0+1.(0+1)*)+λ", "01")
+
+    def test_incomplete(self) -> None:
+        """Test a deterministic automaton with missing transitions."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: Helo
+
+            Empty
+            H
+            He
+            Hel
+            Hell
+            Hello final
+
+            --> Empty
+            Empty -H-> H
+            H -e-> He
+            He -l-> Hel
+            Hel -l-> Hell
+            Hell -o-> Hello
+        """)
+        compiled = automaton.compile()
+
+        self.assertIs(automaton.compile(), compiled)
+        self.assertTrue(compiled.accepts("Hello"))
+        self.assertTrue(compiled.accepts(b"Hello"))
+        self.assertTrue(compiled.accepts(memoryview(b"Hello")))
+        self.assertFalse(compiled.accepts("Hell"))
+        self.assertFalse(compiled.accepts("oHell"))
+        self.assertFalse(compiled.accepts(""))
+
+        with self.assertRaises(ValueError):
+            compiled.accepts("Hella")
+
+        with self.assertRaises(ValueError):
+            compiled.accepts(b"Hello\xff")
+
+        with self.assertRaises(ValueError):
+            compiled.accepts("Hellö")
+
+    def test_unknown_codes(self) -> None:
+        """Test that codes of unknown symbols lead to the dead state."""
+        for symbols, unknown in (("ab", "x"), ("a€", "b")):
+            q0 = State("q0")
+            q1 = State("q1", is_final=True)
+            automaton = FiniteAutomaton(
+                initial_state=q0,
+                states=(q0, q1),
+                symbols=tuple(symbols),
+                transitions=(
+                    Transition(q0, symbols[0], q1),
+                    Transition(q1, symbols[1], q0),
+                    Transition(q1, symbols[0], q1),
+                ),
+            )
+            compiled = automaton.compile()
+            with self.subTest(symbols=symbols):
+                codes = compiled.encode(symbols[0] + unknown, strict=False)
+                self.assertEqual(compiled.run(codes), -1)
+                codes = compiled.encode(unknown + symbols[0], strict=False)
+                self.assertEqual(compiled.run(codes), -1)
+
+    def test_not_deterministic(self) -> None:
+        """Test that only deterministic automata are compiled."""
+        automaton = REParser().create_automaton("a*")
+
+        with self.assertRaises(ValueError):
+            automaton.compile()
+
+
+if __name__ == "__main__":
+    unittest.main()
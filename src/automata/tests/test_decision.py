@@ -0,0 +1,87 @@
+"""Test the antichain decision procedures."""
+import unittest
+
+from automata.decision import (
+    accepted_string,
+    inclusion_counterexample,
+    is_empty,
+    is_included,
+    is_universal,
+    rejected_string,
+)
+from automata.re_parser import REParser
+from automata.tests.language import accepts
+
+
+class TestDecision(unittest.TestCase):
+    """Tests for emptiness, universality and inclusion."""
+
+    regexes = (
+        "",
+        "a",
+        "(a+b)*",
+        "(a*.b*)*",
+        "(a+b)*.a",
+        "(b*.a)*.a",
+        "(a+b)*.a.(a+b)",
+        "a.(a+b)*",
+        "(a.b)*",
+        "a*.b*",
+        "(a+b)*.a.(a+b).(a+b)",
+    )
+
+    def test_emptiness(self) -> None:
+        """Test automata with and without accepted strings."""
+        for regex in self.regexes:
+            automaton = REParser().create_automaton(regex)
+            with self.subTest(regex=regex):
+                string = accepted_string(automaton)
+                self.assertIsNotNone(string)
+                assert string is not None
+                self.assertTrue(accepts(automaton, string))
+
+        empty = REParser().create_automaton("a").intersect(
+            REParser().create_automaton("b"),
+        )
+        self.assertTrue(is_empty(empty))
+        self.assertEqual(accepted_string(REParser().create_automaton("a*")), "")
+
+    def test_universality(self) -> None:
+        """Test against the complement of the automaton."""
+        for regex in self.regexes:
+            automaton = REParser().create_automaton(regex)
+            with self.subTest(regex=regex):
+                string = rejected_string(automaton)
+                self.assertEqual(
+                    string is None,
+                    is_empty(automaton.complement()),
+                )
+                if string is not None:
+                    self.assertFalse(accepts(automaton, string))
+
+        universal = REParser().create_automaton("(a+b)*")
+        self.assertTrue(is_universal(universal))
+        self.assertEqual(rejected_string(universal, "c"), "c")
+
+    def test_inclusion(self) -> None:
+        """Test against the difference of the automata."""
+        automata = [REParser().create_automaton(r) for r in self.regexes]
+        for regex1, automaton1 in zip(self.regexes, automata):
+            for regex2, automaton2 in zip(self.regexes, automata):
+                with self.subTest(regex1=regex1, regex2=regex2):
+                    string = inclusion_counterexample(automaton1, automaton2)
+                    self.assertEqual(
+                        string is None,
+                        is_empty(automaton1.difference(automaton2)),
+                    )
+                    self.assertEqual(
+                        is_included(automaton1, automaton2),
+                        string is None,
+                    )
+                    if string is not None:
+                        self.assertTrue(accepts(automaton1, string))
+                        self.assertFalse(accepts(automaton2, string))
+
+
+if __name__ == "__main__":
+    unittest.main()
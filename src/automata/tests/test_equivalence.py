@@ -0,0 +1,87 @@
+"""Test the equivalence check of deterministic automata."""
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import (
+    deterministic_automata_equivalence,
+    distinguishing_string,
+)
+
+
+class TestEquivalence(unittest.TestCase):
+    """Tests for the Hopcroft-Karp equivalence check."""
+
+    def _dfa(self, regex: str) -> FiniteAutomaton:
+        return REParser().create_automaton(regex).to_deterministic()
+
+    def test_equivalent(self) -> None:
+        """Test pairs of regexes with the same language."""
+        for regex1, regex2 in (
+            ("(a+b)*", "(a*.b*)*"),
+            ("a.(b.a)*", "(a.b)*.a"),
+            ("(a+b)*.a.(a+b)", "(a+b)*.a.(a+b)"),
+            ("", "λ"),
+        ):
+            with self.subTest(regex1=regex1, regex2=regex2):
+                automaton1 = self._dfa(regex1)
+                automaton2 = self._dfa(regex2)
+                self.assertIsNone(distinguishing_string(automaton1, automaton2))
+                self.assertTrue(deterministic_automata_equivalence(
+                    automaton1.to_minimized(),
+                    automaton2,
+                ))
+
+    def test_counterexample(self) -> None:
+        """Test that the string tells the automata apart."""
+        for regex1, regex2 in (
+            ("(a+b)*.a", "(b*.a)*.a"),
+            ("(a+b)*.a", "(a+b)*.a.(a+b)"),
+            ("a*", "(a+b)*"),
+            ("a.b.c", "a.b"),
+            ("a", "λ"),
+        ):
+            with self.subTest(regex1=regex1, regex2=regex2):
+                automaton1 = self._dfa(regex1)
+                automaton2 = self._dfa(regex2)
+                string = distinguishing_string(automaton1, automaton2)
+                self.assertIsNotNone(string)
+                assert string is not None
+
+                accepted = []
+                for automaton in (automaton1, automaton2):
+                    evaluator = FiniteAutomatonEvaluator(automaton)
+                    accepted.append(
+                        set(string) <= set(automaton.symbols)
+                        and evaluator.accepts(string),
+                    )
+                self.assertNotEqual(accepted[0], accepted[1])
+                self.assertFalse(
+                    deterministic_automata_equivalence(automaton1, automaton2),
+                )
+
+    def test_partial(self) -> None:
+        """Test that missing transitions behave as a dead state."""
+        q0 = State("q0")
+        q1 = State("q1", is_final=True)
+        partial = FiniteAutomaton(
+            initial_state=q0,
+            states=(q0, q1),
+            symbols=("a", "b"),
+            transitions=(Transition(q0, "a", q1),),
+        )
+        self.assertIsNone(distinguishing_string(partial, self._dfa("a")))
+        self.assertEqual(distinguishing_string(partial, self._dfa("a.b*")), "ab")
+
+    def test_not_deterministic(self) -> None:
+        """Test that nondeterministic automata are rejected."""
+        with self.assertRaises(ValueError):
+            distinguishing_string(
+                REParser().create_automaton("a*"),
+                self._dfa("a*"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
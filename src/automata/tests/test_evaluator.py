@@ -4,7 +4,11 @@ from abc import ABC, abstractmethod
 from typing import Optional, Type
 
 from automata.automaton import FiniteAutomaton
-from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.automaton_evaluator import (
+    BitsetFiniteAutomatonEvaluator,
+    FiniteAutomatonEvaluator,
+    LazyDFAEvaluator,
+)
 from automata.utils import AutomataFormat
 
 
@@ -14,6 +18,8 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     # automaton: FiniteAutomaton
     # evaluator: FiniteAutomatonEvaluator
 
+    evaluator_class: Type[FiniteAutomatonEvaluator] = FiniteAutomatonEvaluator
+
     @abstractmethod
     def _create_automata(self) -> FiniteAutomaton:
         pass
@@ -21,7 +27,7 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     def setUp(self) -> None:
         """Set up the tests."""
         self.automaton = self._create_automata()
-        self.evaluator = FiniteAutomatonEvaluator(self.automaton)
+        self.evaluator = self.evaluator_class(self.automaton)
 
     def _check_accept_body(
         self,
@@ -111,6 +117,57 @@ class TestEvaluatorLambdas(TestEvaluatorBase):
         self._check_accept("a", exception=ValueError)
 
 
+class TestEvaluatorLambdaCycles(TestEvaluatorBase):
+    """Test for lambda transitions forming cycles."""
+
+    def _create_automata(self) -> FiniteAutomaton:
+
+        description = """
+        Automaton:
+            Symbols: ab
+
+            1
+            2
+            3
+            4
+            5 final
+
+            --> 1
+            1 --> 2
+            2 --> 3
+            3 --> 1
+            3 -a-> 4
+            4 --> 5
+            5 --> 4
+            4 -b-> 1
+        """
+
+        return AutomataFormat.read(description)
+
+    def test_closures(self) -> None:
+        """Test the precomputed lambda closures."""
+        closures = self.automaton.get_lambda_closures()
+        states = {s.name: s for s in self.automaton.states}
+
+        self.assertEqual(closures[states["1"]], closures[states["3"]])
+        self.assertEqual(
+            {s.name for s in closures[states["2"]]},
+            {"1", "2", "3"},
+        )
+        self.assertEqual(
+            {s.name for s in closures[states["5"]]},
+            {"4", "5"},
+        )
+
+    def test_lambda_cycles(self) -> None:
+        """Test acceptance through lambda cycles."""
+        self._check_accept("", should_accept=False)
+        self._check_accept("a", should_accept=True)
+        self._check_accept("ab", should_accept=False)
+        self._check_accept("aba", should_accept=True)
+        self._check_accept("aa", should_accept=False)
+
+
 class TestEvaluatorNumber(TestEvaluatorBase):
     """Test for a fixed string."""
 
@@ -158,6 +215,110 @@ class TestEvaluatorNumber(TestEvaluatorBase):
         self._check_accept("0.0.0", should_accept=False)
         self._check_accept("0-0.0", should_accept=False)
 
+    def test_accepts_many(self) -> None:
+        """Test the evaluation of a batch of strings."""
+        strings = ["0", "0.", "-1.0", "0", "0.0.0", "-1.0", ""]
+        expected = [True, False, True, True, False, True, False]
+        current_states = self.evaluator.current_states
+
+        self.assertEqual(self.evaluator.accepts_many(strings), expected)
+        self.assertEqual(
+            self.evaluator.accepts_many(
+                iter(strings),
+                processes=2,
+                chunk_size=2,
+            ),
+            expected,
+        )
+        self.assertEqual(self.evaluator.current_states, current_states)
+
+        with self.assertRaises(ValueError):
+            self.evaluator.accepts_many(["0", "a"])
+
+
+class TestBitsetEvaluatorFixed(TestEvaluatorFixed):
+    """Test for a fixed string with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorLambdas(TestEvaluatorLambdas):
+    """Test for lambdas with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorLambdaCycles(TestEvaluatorLambdaCycles):
+    """Test for lambda cycles with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+    evaluator: BitsetFiniteAutomatonEvaluator
+
+    def test_current_states(self) -> None:
+        """Test the conversion between bitsets and sets of states."""
+        self.assertEqual(
+            {s.name for s in self.evaluator.current_states},
+            {"1", "2", "3"},
+        )
+
+        self.evaluator.process_symbol("a")
+        self.assertEqual(
+            {s.name for s in self.evaluator.current_states},
+            {"4", "5"},
+        )
+        self.assertTrue(self.evaluator.is_accepting())
+
+        self.evaluator.current_states = {self.automaton.states[0]}
+        self.assertEqual(self.evaluator.current_mask, 1)
+
+
+class TestBitsetEvaluatorNumber(TestEvaluatorNumber):
+    """Test for numbers with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestLazyDFAEvaluatorFixed(TestEvaluatorFixed):
+    """Test for a fixed string with the lazy DFA evaluator."""
+
+    evaluator_class = LazyDFAEvaluator
+
+
+class TestLazyDFAEvaluatorNumber(TestEvaluatorNumber):
+    """Test for numbers with the lazy DFA evaluator."""
+
+    evaluator_class = LazyDFAEvaluator
+    evaluator: LazyDFAEvaluator
+
+    def test_counters(self) -> None:
+        """Test the hit and miss counters."""
+        self._check_accept("-101.010", should_accept=True)
+        misses = self.evaluator.misses
+        self.assertEqual(self.evaluator.hits + misses, 8)
+
+        self._check_accept("-101.010", should_accept=True)
+        self.assertEqual(self.evaluator.misses, misses)
+        self.assertEqual(self.evaluator.hits, 16 - misses)
+
+    def test_thrashing(self) -> None:
+        """Test the fallback to plain simulation."""
+        evaluator = LazyDFAEvaluator(
+            self.automaton,
+            cache_size=1,
+            min_hit_ratio=0.9,
+            max_bad_flushes=2,
+        )
+
+        self.assertTrue(evaluator.accepts("-101.010"))
+        self.assertTrue(evaluator.fallback)
+        self.assertEqual(evaluator.flushes, 2)
+        self.assertTrue(evaluator.accepts("-101.010"))
+        self.assertFalse(evaluator.accepts("0.0.0"))
+
+        evaluator.clear_cache()
+        self.assertFalse(evaluator.fallback)
+        self.assertEqual(evaluator.misses, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
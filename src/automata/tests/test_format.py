@@ -0,0 +1,138 @@
+"""Test the text format of automata."""
+import io
+import os
+import tempfile
+import unittest
+
+from automata.re_parser import REParser
+from automata.utils import (
+    AutomataFormat,
+    FormatParseError,
+    write_dot,
+    write_dot_file,
+)
+
+
+class TestAutomataFormat(unittest.TestCase):
+    """Tests for the text format."""
+
+    description = """
+    Automaton:
+        Symbols: ab
+
+        q0
+        q1 final
+        #...
+
+        --> q0
+        q0 -a-> q1
+        q0 --> q1
+        q1 -b-> q0
+        q1 -b-> q0
+    """
+
+    def test_read(self) -> None:
+        """Test reading a description."""
+        automaton = AutomataFormat.read(self.description)
+
+        self.assertEqual(automaton.initial_state.name, "q0")
+        self.assertEqual(
+            [(s.name, s.is_final) for s in automaton.states],
+            [("q0", False), ("q1", True)],
+        )
+        self.assertEqual(automaton.symbols, ("a", "b"))
+        self.assertEqual(
+            [
+                (t.initial_state.name, t.symbol, t.final_state.name)
+                for t in automaton.transitions
+            ],
+            [("q0", "a", "q1"), ("q0", None, "q1"), ("q1", "b", "q0")],
+        )
+
+    def test_read_file(self) -> None:
+        """Test reading from files and round trips."""
+        automaton = REParser().create_automaton("(a+b)*.a.(λ+b)")
+        description = AutomataFormat.write(automaton)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "automaton.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(description)
+            with open(path, encoding="utf-8") as file:
+                loaded = AutomataFormat.read_file(file)
+
+        self.assertEqual(loaded.states, automaton.states)
+        self.assertEqual(loaded.transitions, automaton.transitions)
+        self.assertEqual(
+            AutomataFormat.write(
+                AutomataFormat.read_file(io.StringIO(description)),
+            ),
+            description,
+        )
+
+    def test_invalid(self) -> None:
+        """Test that invalid descriptions are rejected."""
+        for description in (
+            "q0\n",
+            "Automaton:\n Symbols: a\n q0\n",
+            "Automaton:\n Symbols: a\n q0\n --> q1\n",
+            "Automaton:\n Symbols: a\n q0\n --> q0\n q0 -b-> q0\n",
+            "Automaton:\n Symbols: aa\n q0\n --> q0\n",
+            "Automaton:\n Symbols: a\n q0\n --> q0\n q0 -a-> q1\n",
+            "Automaton:\n Symbols: a\n q0 q1\n --> q0\n",
+        ):
+            with self.subTest(description=description):
+                with self.assertRaises(FormatParseError):
+                    AutomataFormat.read(description)
+
+
+class TestWriters(unittest.TestCase):
+    """Tests for the streaming writers."""
+
+    def test_same_as_string(self) -> None:
+        """Test that the file writers produce the same text."""
+        automaton = REParser().create_automaton("(a+b)*.a.(λ+b)")
+        for chunk_size in (1, 100, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                file = io.StringIO()
+                AutomataFormat.write_file(
+                    automaton,
+                    file,
+                    chunk_size=chunk_size,
+                )
+                self.assertEqual(
+                    file.getvalue(),
+                    AutomataFormat.write(automaton),
+                )
+
+                file = io.StringIO()
+                write_dot_file(automaton, file, chunk_size=chunk_size)
+                self.assertEqual(file.getvalue(), write_dot(automaton))
+
+    def test_collapse_parallel(self) -> None:
+        """Test that parallel edges are merged into one."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: abc
+
+            q0
+            q1 final
+
+            --> q0
+            q0 -a-> q1
+            q0 -b-> q0
+            q0 -c-> q1
+            q0 --> q1
+        """)
+        dot = write_dot(automaton, collapse_parallel=True)
+
+        self.assertIn('q0 -> q1[label="a,c,λ"]', dot)
+        self.assertIn('q0 -> q0[label="b"]', dot)
+        self.assertEqual(dot.count("label="), 2)
+
+        file = io.StringIO()
+        write_dot_file(automaton, file, collapse_parallel=True)
+        self.assertEqual(file.getvalue(), dot)
+
+
+if __name__ == "__main__":
+    unittest.main()
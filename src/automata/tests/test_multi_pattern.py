@@ -0,0 +1,96 @@
+"""Test matching of many patterns at once."""
+import random
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.multi_pattern import MultiPatternMatcher
+from automata.re_parser import REParser
+
+
+class TestMultiPattern(unittest.TestCase):
+    """Tests for the multi-pattern matcher."""
+
+    patterns = ("a.b", "a*", "(a+b)*.c", "b.c", "")
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.matcher = MultiPatternMatcher(self.patterns)
+
+    def test_match(self) -> None:
+        """Test matching of whole strings."""
+        self.assertEqual(self.matcher.match(""), {1, 4})
+        self.assertEqual(self.matcher.match("ab"), {0})
+        self.assertEqual(self.matcher.match("aa"), {1})
+        self.assertEqual(self.matcher.match("bc"), {2, 3})
+        self.assertEqual(self.matcher.match("ca"), set())
+        self.assertEqual(self.matcher.match("ax"), set())
+
+    def test_same_as_evaluators(self) -> None:
+        """Test against evaluating each pattern on its own."""
+        evaluators = [
+            FiniteAutomatonEvaluator(REParser().create_automaton(p))
+            for p in self.patterns
+        ]
+
+        def accepts(evaluator: FiniteAutomatonEvaluator, string: str) -> bool:
+            try:
+                return evaluator.accepts(string)
+            except ValueError:
+                return False
+
+        rng = random.Random(0)
+        for _ in range(200):
+            string = "".join(
+                rng.choice("abc") for _ in range(rng.randint(0, 6))
+            )
+            with self.subTest(string=string):
+                self.assertEqual(
+                    self.matcher.match(string),
+                    {
+                        i for i, evaluator in enumerate(evaluators)
+                        if accepts(evaluator, string)
+                    },
+                )
+
+    def test_scan(self) -> None:
+        """Test the search of substrings."""
+        matcher = MultiPatternMatcher(["a.b", "b.c", "c"])
+
+        self.assertEqual(
+            list(matcher.scan("xabcxc")),
+            [(3, {0}), (4, {1, 2}), (6, {2})],
+        )
+        self.assertEqual(matcher.search("xxbc"), {1, 2})
+        self.assertEqual(matcher.search("axb"), set())
+
+    def test_bounded_cache(self) -> None:
+        """Test that flushes and the fallback keep the results."""
+        patterns = ["a" + ".(a+b)" * k for k in range(2, 6)]
+        rng = random.Random(0)
+        text = "".join(rng.choice("ab") for _ in range(500))
+        expected = list(MultiPatternMatcher(patterns).scan(text))
+
+        flushing = MultiPatternMatcher(
+            patterns,
+            cache_size=8,
+            max_bad_flushes=1000,
+        )
+        self.assertEqual(list(flushing.scan(text)), expected)
+        self.assertGreater(flushing._unanchored.flushes, 0)
+        self.assertFalse(flushing._unanchored.fallback)
+        self.assertLessEqual(len(flushing._unanchored.masks), 8)
+
+        thrashing = MultiPatternMatcher(patterns, cache_size=8)
+        self.assertEqual(list(thrashing.scan(text)), expected)
+        self.assertTrue(thrashing._unanchored.fallback)
+        self.assertEqual(
+            thrashing.match("a" * 6),
+            MultiPatternMatcher(patterns).match("a" * 6),
+        )
+
+        with self.assertRaises(ValueError):
+            MultiPatternMatcher(patterns, cache_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
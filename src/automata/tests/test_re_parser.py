@@ -1,8 +1,12 @@
 """Test evaluation of regex parser."""
 import unittest
+from typing import Callable, Dict
 
+from automata.automaton import FiniteAutomaton
 from automata.automaton_evaluator import FiniteAutomatonEvaluator
 from automata.re_parser import REParser
+from automata.re_parser_interfaces import AbstractREParser
+from automata.utils import deterministic_automata_isomorphism, is_deterministic
 
 
 class TestREParser(unittest.TestCase):
@@ -92,5 +96,147 @@ class TestREParser(unittest.TestCase):
         evaluator=self._create_evaluator("")
 
         self._check_accept(evaluator, "", should_accept=True) 
+
+    def test_same_as_step_by_step(self) -> None:
+        """Test the builder against the _create_automaton_* methods."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex in (
+            "H.e.l.l.o",
+            "a*.b*",
+            "(a+b)*.a.(a+b)",
+            "λ+a.b*",
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ):
+            with self.subTest(regex=regex):
+                built = REParser().create_automaton(regex)
+                step_by_step = AbstractREParser.create_automaton(
+                    REParser(),
+                    regex,
+                )
+
+                self.assertEqual(len(built.states), len(step_by_step.states))
+                self.assertIsNotNone(deterministic_automata_isomorphism(
+                    built.to_deterministic().to_minimized(),
+                    step_by_step.to_deterministic().to_minimized(),
+                ))
+
+    def _builders(self) -> Dict[str, Callable[[str], FiniteAutomaton]]:
+        return {
+            "thompson": REParser().create_automaton,
+            "glushkov": lambda regex: REParser().create_automaton(
+                regex,
+                backend="glushkov",
+            ),
+            "derivatives": REParser().create_dfa,
+        }
+
+    def test_long_regex(self) -> None:
+        """Test a regex with thousands of operators with every builder."""
+        regex = ".".join(["(a+b)"] * 5000)
+        for name, build in self._builders().items():
+            with self.subTest(builder=name):
+                evaluator = FiniteAutomatonEvaluator(build(regex))
+                self._check_accept(evaluator, "ab" * 2500, should_accept=True)
+                self._check_accept(evaluator, "ab" * 2499, should_accept=False)
+
+    def test_deep_nesting(self) -> None:
+        """Test a regex with hundreds of nested stars with every builder."""
+        regex = "c.c"
+        for i in range(300):
+            regex = "(" + regex + "+" + "ab"[i % 2] + ")*"
+
+        for name, build in self._builders().items():
+            with self.subTest(builder=name):
+                evaluator = FiniteAutomatonEvaluator(build(regex))
+                self._check_accept(evaluator, "", should_accept=True)
+                self._check_accept(evaluator, "abccba", should_accept=True)
+                self._check_accept(evaluator, "abcba", should_accept=False)
+
+
+class TestGlushkovBackend(unittest.TestCase):
+    """Tests for the Glushkov backend of the regex parser."""
+
+    def test_same_language_as_thompson(self) -> None:
+        """Test that both backends build equivalent automata."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex in (
+            "",
+            "a",
+            "λ",
+            "H.e.l.l.o",
+            "a*.b*",
+            "(a*)*",
+            "(λ+a)*.b",
+            "(a+b)*.a.(a+b)",
+            "λ+a.b*",
+            "(a.b*+b)*.(λ+a)",
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ):
+            with self.subTest(regex=regex):
+                glushkov = REParser().create_automaton(
+                    regex,
+                    backend="glushkov",
+                )
+                thompson = REParser().create_automaton(regex)
+
+                self.assertFalse(any(
+                    t.symbol is None for t in glushkov.transitions
+                ))
+                self.assertIsNotNone(deterministic_automata_isomorphism(
+                    glushkov.to_deterministic().to_minimized(),
+                    thompson.to_deterministic().to_minimized(),
+                ))
+
+    def test_one_state_per_symbol(self) -> None:
+        """Test the number of states of the position automaton."""
+        automaton = REParser().create_automaton(
+            "(a+b)*.a.(a+b)",
+            backend="glushkov",
+        )
+        self.assertEqual(len(automaton.states), 6)
+
+    def test_unknown_backend(self) -> None:
+        """Test that unknown backends are rejected."""
+        with self.assertRaises(ValueError):
+            REParser().create_automaton("a", backend="brzozowski")
+
+
+class TestCreateDFA(unittest.TestCase):
+    """Tests for the derivative construction of deterministic automata."""
+
+    def test_same_language_as_pipeline(self) -> None:
+        """Test against determinizing and minimizing the Thompson automaton."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex in (
+            "",
+            "a",
+            "λ",
+            "H.e.l.l.o",
+            "a*.b*",
+            "(a*)*",
+            "(λ+a)*.b",
+            "(a+b)*.a.(a+b)",
+            "λ+a.b*",
+            "(a.b*+b)*.(λ+a)",
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ):
+            with self.subTest(regex=regex):
+                dfa = REParser().create_dfa(regex)
+                pipeline = REParser().create_automaton(regex)
+                pipeline = pipeline.to_deterministic()
+
+                self.assertTrue(is_deterministic(dfa))
+                self.assertLessEqual(len(dfa.states), len(pipeline.states))
+                self.assertIsNotNone(deterministic_automata_isomorphism(
+                    dfa.to_minimized(),
+                    pipeline.to_minimized(),
+                ))
+
+    def test_minimal(self) -> None:
+        """Test a regex whose derivatives are all distinct."""
+        dfa = REParser().create_dfa("(a+b)*.a" + ".(a+b)" * 5)
+        self.assertEqual(len(dfa.states), 2 ** 6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+"""Test the removal of lambda transitions."""
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.tests.language import check_same_language
+
+
+class TestRemoveLambdas(unittest.TestCase):
+    """Tests for remove_lambdas."""
+
+    def test_remove_lambdas(self) -> None:
+        """Test the transitions and final states of a small automaton."""
+        q0 = State("q0")
+        q1 = State("q1")
+        q2 = State("q2", is_final=True)
+        automaton = FiniteAutomaton(
+            initial_state=q0,
+            states=(q0, q1, q2),
+            symbols=("a", "b"),
+            transitions=(
+                Transition(q0, None, q1),
+                Transition(q1, "a", q1),
+                Transition(q1, None, q2),
+                Transition(q2, "b", q0),
+            ),
+        )
+        result = automaton.remove_lambdas()
+
+        p0 = State("q0", is_final=True)
+        p1 = State("q1", is_final=True)
+        self.assertFalse(result.has_lambdas())
+        self.assertEqual(result.symbols, ("a", "b"))
+        self.assertEqual(set(result.states), {p0, p1})
+        self.assertEqual(result.initial_state, p0)
+        self.assertEqual(
+            set(result.transitions),
+            {
+                Transition(p0, "a", p1),
+                Transition(p0, "b", p0),
+                Transition(p1, "a", p1),
+                Transition(p1, "b", p0),
+            },
+        )
+
+    def test_repeated_names(self) -> None:
+        """Test states with the same name that only differ in finality."""
+        s0 = State("s0")
+        x = State("x")
+        x_final = State("x", is_final=True)
+        automaton = FiniteAutomaton(
+            initial_state=s0,
+            states=(s0, x, x_final),
+            symbols=("a", "b"),
+            transitions=(
+                Transition(s0, "a", x),
+                Transition(x, None, x_final),
+                Transition(x_final, "b", s0),
+                Transition(s0, "b", x_final),
+                Transition(x, "b", x),
+            ),
+        )
+        result = automaton.remove_lambdas()
+
+        self.assertFalse(FiniteAutomatonEvaluator(result).accepts("bb"))
+        FiniteAutomaton(
+            initial_state=result.initial_state,
+            states=result.states,
+            symbols=result.symbols,
+            transitions=result.transitions,
+        )
+        check_same_language(self, automaton, result)
+
+    def test_without_lambdas(self) -> None:
+        """Test that automata without lambdas are returned unchanged."""
+        automaton = REParser().create_dfa("(a+b)*.a")
+
+        self.assertFalse(automaton.has_lambdas())
+        self.assertIs(automaton.remove_lambdas(), automaton)
+
+    def test_regexes(self) -> None:
+        """Test that the language of Thompson automata is kept."""
+        for regex in (
+            "λ",
+            "a*",
+            "(a+b)*.a.b",
+            "a.b*+b.a",
+            "(a.b)*+(λ+b)*",
+            "((a*)*.(b+λ)*)*",
+        ):
+            automaton = REParser().create_automaton(regex)
+            result = automaton.remove_lambdas()
+            with self.subTest(regex=regex):
+                self.assertTrue(automaton.has_lambdas())
+                self.assertFalse(result.has_lambdas())
+                self.assertLessEqual(len(result.states), len(automaton.states))
+                check_same_language(self, automaton, result)
+                check_same_language(
+                    self,
+                    automaton.to_deterministic(),
+                    result.to_deterministic(),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
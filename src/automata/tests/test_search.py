@@ -0,0 +1,116 @@
+"""Test search of substrings accepted by automata."""
+import random
+import unittest
+from typing import List, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+
+
+class TestSearch(unittest.TestCase):
+    """Tests for the substring search."""
+
+    def _brute_force(
+        self,
+        evaluator: FiniteAutomatonEvaluator,
+        text: str,
+    ) -> List[Tuple[int, int]]:
+        """Leftmost-longest matches trying every substring."""
+        def accepts(string: str) -> bool:
+            try:
+                return evaluator.accepts(string)
+            except ValueError:
+                return False
+
+        matches = []
+        position = 0
+        while position <= len(text):
+            ends = [
+                end for end in range(position, len(text) + 1)
+                if accepts(text[position:end])
+            ]
+            if ends:
+                matches.append((position, ends[-1]))
+                position = ends[-1] if ends[-1] > position else position + 1
+            else:
+                position += 1
+
+        return matches
+
+    def test_fixed(self) -> None:
+        """Test a fixed word."""
+        automaton = REParser().create_automaton("a.b")
+
+        self.assertEqual(
+            list(automaton.finditer("xabyabab")),
+            [(1, 3), (4, 6), (6, 8)],
+        )
+        self.assertEqual(automaton.search("xxab"), (2, 4))
+        self.assertIsNone(automaton.search("xaxb"))
+        self.assertEqual(list(automaton.finditer(b"ab")), [(0, 2)])
+
+    def test_leftmost_longest(self) -> None:
+        """Test that the leftmost match wins, even if it ends later."""
+        automaton = REParser().create_automaton("(a.b.c)+b")
+
+        self.assertEqual(list(automaton.finditer("xabc")), [(1, 4)])
+
+        automaton = REParser().create_automaton("a.a*")
+        self.assertEqual(list(automaton.finditer("baaab")), [(1, 4)])
+
+    def test_empty_matches(self) -> None:
+        """Test automata that accept the empty string."""
+        automaton = REParser().create_automaton("a*")
+
+        self.assertEqual(
+            list(automaton.finditer("baa")),
+            [(0, 0), (1, 3), (3, 3)],
+        )
+
+    def test_random(self) -> None:
+        """Test against a brute force search."""
+        rng = random.Random(0)
+        for regex in ("a.b*", "(a+b.c)*.c", "b.(a+c)*.b", "(a.b)*"):
+            automaton = REParser().create_automaton(regex)
+            evaluator = FiniteAutomatonEvaluator(automaton)
+            for _ in range(20):
+                text = "".join(rng.choice("abcx") for _ in range(15))
+                with self.subTest(regex=regex, text=text):
+                    self.assertEqual(
+                        list(automaton.finditer(text)),
+                        self._brute_force(evaluator, text),
+                    )
+
+    def test_long_runs(self) -> None:
+        """Test matches whose forward runs reach the end of the text."""
+        automaton = REParser().create_automaton("a+a*.b")
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        for text in ("a" * 80, "a" * 80 + "b", "a" * 70 + "x" + "a" * 70):
+            with self.subTest(text=text):
+                self.assertEqual(
+                    list(automaton.finditer(text)),
+                    self._brute_force(evaluator, text),
+                )
+
+    def test_repeated_names(self) -> None:
+        """Test states with the same name that only differ in finality."""
+        s0 = State("s0")
+        x = State("x")
+        x_final = State("x", is_final=True)
+        automaton = FiniteAutomaton(
+            initial_state=s0,
+            states=(s0, x, x_final),
+            symbols=("a", "b"),
+            transitions=(
+                Transition(s0, "a", x),
+                Transition(x, "b", x_final),
+            ),
+        )
+
+        self.assertEqual(list(automaton.finditer("aaa")), [])
+        self.assertEqual(list(automaton.finditer("abab")), [(0, 2), (2, 4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Test evaluation of automata over streams."""
+import asyncio
+import io
+import mmap
+import tempfile
+import unittest
+from typing import AsyncIterator, List
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.streaming import (
+    accepts_async_stream,
+    accepts_stream,
+    iter_accepting_offsets,
+    iter_text_chunks,
+    process_stream,
+)
+
+
+class TestStreaming(unittest.TestCase):
+    """Tests for the streaming evaluation."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        automaton = REParser().create_automaton("(a.ñ)*")
+        self.evaluator = FiniteAutomatonEvaluator(automaton)
+
+    def test_chunks(self) -> None:
+        """Test that characters split between chunks are decoded."""
+        data = "aña".encode("utf-8")
+
+        self.assertEqual(
+            "".join(iter_text_chunks(data, chunk_size=1)),
+            "aña",
+        )
+        self.assertEqual(
+            "".join(iter_text_chunks(io.BytesIO(data), chunk_size=2)),
+            "aña",
+        )
+        self.assertEqual(
+            "".join(iter_text_chunks([data[:2], "", data[2:]])),
+            "aña",
+        )
+
+    def test_accepts(self) -> None:
+        """Test acceptance of streams of different kinds."""
+        text = "añ" * 1000
+        data = text.encode("utf-8")
+
+        self.assertTrue(accepts_stream(self.evaluator, text))
+        self.assertTrue(accepts_stream(self.evaluator, data, chunk_size=7))
+        self.assertTrue(
+            accepts_stream(self.evaluator, io.StringIO(text), chunk_size=7),
+        )
+        self.assertTrue(
+            accepts_stream(self.evaluator, io.BytesIO(data), chunk_size=7),
+        )
+        self.assertFalse(
+            accepts_stream(self.evaluator, io.BytesIO(data + b"a")),
+        )
+
+        with tempfile.TemporaryFile() as file:
+            file.write(data)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertTrue(
+                    accepts_stream(self.evaluator, m, chunk_size=5),
+                )
+
+        with self.assertRaises(ValueError):
+            accepts_stream(self.evaluator, io.StringIO("ab"))
+
+    def test_state_is_kept(self) -> None:
+        """Test that the state is kept between streams."""
+        self.assertEqual(process_stream(self.evaluator, ["a", "ña"]), 3)
+        self.assertFalse(self.evaluator.is_accepting())
+        self.assertEqual(process_stream(self.evaluator, io.StringIO("ñ")), 1)
+        self.assertTrue(self.evaluator.is_accepting())
+
+    def test_offsets(self) -> None:
+        """Test the offsets where the automaton accepts."""
+        offsets = iter_accepting_offsets(
+            self.evaluator,
+            io.BytesIO("añañaa".encode("utf-8")),
+            chunk_size=3,
+        )
+
+        self.assertEqual(list(offsets), [0, 2, 4])
+
+    def test_async(self) -> None:
+        """Test acceptance of asynchronous streams."""
+        async def chunks(data: List[bytes]) -> AsyncIterator[bytes]:
+            for chunk in data:
+                await asyncio.sleep(0)
+                yield chunk
+
+        data = ("añ" * 10).encode("utf-8")
+        split = [data[i:i + 3] for i in range(0, len(data), 3)]
+
+        self.assertTrue(asyncio.run(
+            accepts_async_stream(self.evaluator, chunks(split)),
+        ))
+        self.assertFalse(asyncio.run(
+            accepts_async_stream(self.evaluator, chunks(split + [b"a"])),
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -384,5 +384,74 @@ class TestTransform(ABC, unittest.TestCase):
 
         self._check_transform(automaton, expected)
 
+    def test_colliding_names(self) -> None:
+        """Test sets whose concatenated names would be the same."""
+        automaton_str = """
+        Automaton:
+            Symbols: ab
+
+            q0
+            q1
+            2q3 final
+            q12
+            q3 final
+
+            --> q0
+            q0 -a-> q1
+            q0 -a-> 2q3
+            q0 -b-> q12
+            q0 -b-> q3
+        """
+
+        expected_str = """
+        Automaton:
+            Symbols: ab
+
+            q0
+            A final
+            B final
+            empty
+
+            --> q0
+            q0 -a-> A
+            q0 -b-> B
+            A -a-> empty
+            A -b-> empty
+            B -a-> empty
+            B -b-> empty
+            empty -a-> empty
+            empty -b-> empty
+        """
+
+        automaton = AutomataFormat.read(automaton_str)
+        expected = AutomataFormat.read(expected_str)
+
+        self._check_transform(automaton, expected)
+
+    def test_canonical_names(self) -> None:
+        """Test that the names only depend on the sets of states."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: 01
+
+            q0
+            q1
+            qf final
+
+            --> q0
+            q0 -0-> q0
+            q0 -1-> q0
+            q0 -1-> q1
+            q1 -1-> qf
+        """)
+
+        transformed = automaton.to_deterministic()
+
+        self.assertEqual(transformed, automaton.to_deterministic())
+        self.assertEqual(
+            {s.name for s in transformed.states},
+            {"q0", "q1", "q2"},
+        )
+
 if __name__ == '__main__':
     unittest.main()
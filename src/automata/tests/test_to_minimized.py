@@ -2,10 +2,11 @@
 import unittest
 from abc import ABC
 
-from automata.automaton import FiniteAutomaton
+from automata.automaton import FiniteAutomaton, State, Transition
 from automata.utils import AutomataFormat, deterministic_automata_isomorphism, write_dot
 import inspect
 import os
+import random
 import sys
 
 class TestMinimize(ABC, unittest.TestCase):
@@ -42,16 +43,18 @@ class TestMinimize(ABC, unittest.TestCase):
     ) -> None:
         """Test that the minimized automaton is as expected."""
 
-        transformed = automaton.to_minimized()
+        for algorithm in ("hopcroft", "moore"):
+            with self.subTest(algorithm=algorithm):
+                transformed = automaton.to_minimized(algorithm)
 
-        equiv_map = deterministic_automata_isomorphism(
-            expected,
-            transformed,
-        )
+                equiv_map = deterministic_automata_isomorphism(
+                    expected,
+                    transformed,
+                )
 
-        # self._dot(automaton, transformed) # Enable to generate images
+                # self._dot(automaton, transformed) # Enable to generate images
 
-        self.assertTrue(equiv_map is not None)
+                self.assertTrue(equiv_map is not None)
 
     def test_case1(self) -> None:
         """Test Case 1."""
@@ -286,5 +289,51 @@ class TestMinimize(ABC, unittest.TestCase):
 
         self._check_transform(automaton, expected)
 
+    def test_random_hopcroft_moore(self) -> None:
+        """Test that both algorithms agree on random automata."""
+        rng = random.Random(0)
+
+        for case in range(50):
+            n_states = rng.randint(1, 30)
+            states = [
+                State(f"q{i}", is_final=rng.random() < 0.3)
+                for i in range(n_states)
+            ]
+            transitions = []
+            for state in states:
+                for symbol in rng.sample("abc", rng.randint(1, 3)):
+                    transitions.append(
+                        Transition(state, symbol, rng.choice(states)),
+                    )
+
+            automaton = FiniteAutomaton(
+                initial_state=states[0],
+                states=states,
+                symbols="abc",
+                transitions=transitions,
+            )
+
+            with self.subTest(case=case):
+                equiv_map = deterministic_automata_isomorphism(
+                    automaton.to_minimized("moore"),
+                    automaton.to_minimized("hopcroft"),
+                )
+                self.assertTrue(equiv_map is not None)
+
+    def test_unknown_algorithm(self) -> None:
+        """Test that unknown algorithms are rejected."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: a
+
+            q0 final
+
+            --> q0
+            q0 -a-> q0
+        """)
+
+        with self.assertRaises(ValueError):
+            automaton.to_minimized("brzozowski")
+
 if __name__ == '__main__':
     unittest.main()
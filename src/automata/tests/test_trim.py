@@ -0,0 +1,76 @@
+"""Test the removal of useless states."""
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition, TrimStats
+from automata.re_parser import REParser
+from automata.tests.language import check_same_language
+from automata.utils import is_deterministic
+
+
+class TestTrim(unittest.TestCase):
+    """Tests for trim and the trim option of the conversions."""
+
+    def test_trim(self) -> None:
+        """Test the removed states and transitions."""
+        q0 = State("q0")
+        q1 = State("q1", is_final=True)
+        dead = State("dead")
+        unreachable = State("unreachable", is_final=True)
+        automaton = FiniteAutomaton(
+            initial_state=q0,
+            states=(q0, q1, dead, unreachable),
+            symbols=("a", "b"),
+            transitions=(
+                Transition(q0, "a", q1),
+                Transition(q0, "b", dead),
+                Transition(dead, None, dead),
+                Transition(unreachable, "a", q0),
+            ),
+        )
+        trimmed = automaton.trim()
+
+        self.assertEqual(trimmed.states, (q0, q1))
+        self.assertEqual(trimmed.transitions, (Transition(q0, "a", q1),))
+        self.assertEqual(trimmed.symbols, ("a", "b"))
+        self.assertEqual(
+            trimmed.trim_stats,
+            TrimStats(unreachable=1, dead=1, transitions=3),
+        )
+        self.assertIsNone(automaton.trim_stats)
+
+    def test_empty_language(self) -> None:
+        """Test that the initial state is always kept."""
+        automaton = REParser().create_dfa("a").intersect(
+            REParser().create_dfa("b"),
+            minimize=False,
+        )
+        trimmed = automaton.trim()
+
+        self.assertEqual(trimmed.states, (automaton.initial_state,))
+        self.assertEqual(trimmed.transitions, ())
+
+    def test_conversions(self) -> None:
+        """Test the trim option of the conversions."""
+        for regex in ("(a+b)*.a.b", "a.b*+b.a", "(a.b)*", "λ"):
+            automaton = REParser().create_automaton(regex)
+            with self.subTest(regex=regex):
+                deterministic = automaton.to_deterministic(trim=True)
+                minimal = automaton.to_deterministic().to_minimized(trim=True)
+                for converted in (deterministic, minimal):
+                    self.assertTrue(is_deterministic(converted))
+                    self.assertIsNotNone(converted.trim_stats)
+                    self.assertNotIn(
+                        "empty",
+                        [s.name for s in converted.states],
+                    )
+                    check_same_language(self, automaton, converted)
+
+                self.assertEqual(
+                    len(minimal.states),
+                    len(automaton.to_deterministic().to_minimized().states)
+                    - (minimal.trim_stats.dead > 0),  # type: ignore[union-attr]
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
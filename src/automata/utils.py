@@ -1,13 +1,29 @@
 """General utilities to work with automatas."""
+import io
 import re
 from collections import defaultdict, deque
-from typing import DefaultDict, Dict, Mapping, Optional, Set
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
 from typing_extensions import Final
 
 import automata.automaton as aut
 
 
+# Characters written at once by the file writers
+DEFAULT_CHUNK_SIZE: Final = 1 << 16
+
+
 class FormatParseError(Exception):
     """Exception for parsing problems."""
 
@@ -26,131 +42,274 @@ class AutomataFormat():
     @classmethod
     def read(cls, description: str) -> aut.FiniteAutomaton:
         """Read the automaton description in our custom format."""
-        splitted_lines = description.splitlines()
-        prelude_read = False
+        return cls.read_file(io.StringIO(description))
 
-        initial_state: Optional[aut.State] = None
-        states: Dict[str, aut.State] = {}
-        transitions: Set[aut.Transition] = set()
-
-        for line in splitted_lines:
-            if cls.re_comment.fullmatch(line) or cls.re_empty.fullmatch(line):
-                continue
-
-            if prelude_read:
-                match = cls.re_symbols.fullmatch(line)
-                if match:
-                    symbols_str = match.groups()[0]
-                    symbols = tuple(symbols_str)
-                    continue
+    @classmethod
+    def read_file(cls, file: Iterable[str]) -> aut.FiniteAutomaton:
+        """
+        Read the automaton description in our custom format, line by line.
 
-                match = cls.re_state.fullmatch(line)
-                if match:
-                    state_name, final_text = match.groups()
-                    states[state_name] = aut.State(
-                        name=state_name,
-                        is_final=bool(final_text),
-                    )
-                    continue
+        Args:
+            file: Text file, or any iterable of lines.
 
-                match = cls.re_initial.fullmatch(line)
-                if match:
-                    state_name = match.groups()[0]
-                    initial_state = states[state_name]
-                    continue
+        Returns:
+            The automaton.
 
-                match = cls.re_transition.fullmatch(line)
-                if match:
-                    state1_name, symbol, state2_name = match.groups()
-
-                    state1 = states[state1_name]
-                    state2 = states[state2_name]
+        """
+        prelude_read = False
 
-                    transitions.add(aut.Transition(
-                        initial_state=state1,
-                        symbol=symbol,
-                        final_state=state2,
-                    ))
+        symbols: Tuple[str, ...] = ()
+        initial_index: Optional[int] = None
+        # States are numbered in order of definition, and transitions are
+        # kept as numbers (the dict drops repeated ones)
+        state_index: Dict[str, int] = {}
+        names: List[str] = []
+        finals: List[bool] = []
+        transitions: Dict[Tuple[int, Optional[str], int], None] = {}
+
+        # Each line is dispatched on its first characters and checked with
+        # a single regex
+        try:
+            for line in file:
+                line = line.strip()
+                if not line:
                     continue
 
-            elif cls.re_automaton.fullmatch(line):
-                prelude_read = True
-                continue
-
-            raise FormatParseError(f"Invalid line: {line}")
-
-        if initial_state is None:
+                if "-" in line and not line.startswith("Symbols:"):
+                    if line.startswith("-->"):
+                        match = cls.re_initial.fullmatch(line)
+                        if match:
+                            initial_index = state_index[match.group(1)]
+                            continue
+
+                    elif prelude_read:
+                        match = cls.re_transition.fullmatch(line)
+                        if match:
+                            state1_name, symbol, state2_name = match.groups()
+                            transitions[(
+                                state_index[state1_name],
+                                symbol,
+                                state_index[state2_name],
+                            )] = None
+                            continue
+
+                elif line[0] == "#":
+                    if cls.re_comment.fullmatch(line):
+                        continue
+
+                elif not prelude_read:
+                    if cls.re_automaton.fullmatch(line):
+                        prelude_read = True
+                        continue
+
+                elif line.startswith("Symbols:"):
+                    match = cls.re_symbols.fullmatch(line)
+                    if match:
+                        symbols = tuple(match.group(1))
+                        continue
+
+                else:
+                    match = cls.re_state.fullmatch(line)
+                    if match:
+                        state_name, final_text = match.groups()
+                        index = state_index.setdefault(state_name, len(names))
+                        if index == len(names):
+                            names.append(state_name)
+                            finals.append(bool(final_text))
+                        else:
+                            finals[index] = bool(final_text)
+                        continue
+
+                raise FormatParseError(f"Invalid line: {line}")
+
+        except KeyError as e:
+            raise FormatParseError(f"Undefined state: {e.args[0]}") from None
+
+        if initial_index is None:
             raise FormatParseError("No initial state defined")
 
-        return aut.FiniteAutomaton(
-            initial_state=initial_state,
+        symbol_set = set(symbols)
+        if len(symbol_set) != len(symbols):
+            raise FormatParseError("There are repeated symbols")
+        for _, symbol, _ in transitions:
+            if symbol is not None and symbol not in symbol_set:
+                raise FormatParseError(f"Undefined symbol: {symbol}")
+
+        # Everything has been checked, so validation is skipped
+        states = [
+            aut.State(name=name, is_final=is_final)
+            for name, is_final in zip(names, finals)
+        ]
+        return aut.FiniteAutomaton.from_trusted(
+            initial_state=states[initial_index],
             symbols=symbols,
-            states=states.values(),
-            transitions=transitions,
+            states=states,
+            transitions=[
+                aut.Transition(
+                    initial_state=states[state1],
+                    symbol=symbol,
+                    final_state=states[state2],
+                )
+                for state1, symbol, state2 in transitions
+            ],
         )
 
     @classmethod
     def write(cls, automaton: aut.FiniteAutomaton) -> str:
         """Write the automaton description in our custom format."""
-        return (
-            "Automaton:\n"
-            + "\tSymbols: "
-            + "".join(
-                f"{s}"
-                for s in automaton.symbols
-            )
-            + "\n\n"
-            + "".join(
-                f"\t{s.name}{' final' if s.is_final else ''}\n"
-                for s in automaton.states
-            )
-            + "\n"
-            + f"\t--> {automaton.initial_state.name}\n"
-            + "".join(
+        return "".join(cls._iter_lines(automaton))
+
+    @classmethod
+    def write_file(
+        cls,
+        automaton: aut.FiniteAutomaton,
+        file: TextIO,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Write the automaton description in our custom format to a file.
+
+        The description is written in chunks, so it is never held in
+        memory as a whole.
+
+        Args:
+            automaton: Automaton to write.
+            file: Text file to write to.
+            chunk_size: Approximate number of characters of each write.
+
+        """
+        _write_chunked(cls._iter_lines(automaton), file, chunk_size)
+
+    @classmethod
+    def _iter_lines(cls, automaton: aut.FiniteAutomaton) -> Iterator[str]:
+        yield "Automaton:\n"
+        yield "\tSymbols: " + "".join(automaton.symbols) + "\n\n"
+        for s in automaton.states:
+            yield f"\t{s.name}{' final' if s.is_final else ''}\n"
+        yield "\n"
+        yield f"\t--> {automaton.initial_state.name}\n"
+        for t in automaton.transitions:
+            yield (
                 f"\t{t.initial_state.name} "
                 f"-{t.symbol if t.symbol is not None else ''}->"
                 f" {t.final_state.name}\n"
-                for t in automaton.transitions
             )
-        )
 
 
-def write_dot(automaton: aut.FiniteAutomaton) -> str:
+def _write_chunked(lines: Iterable[str], file: TextIO, chunk_size: int) -> None:
+    buffer: List[str] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            file.write("".join(buffer))
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        file.write("".join(buffer))
+
+
+def _iter_dot_lines(
+    automaton: aut.FiniteAutomaton,
+    collapse_parallel: bool,
+) -> Iterator[str]:
+    shape_dict = {
+        True: "doublecircle",
+        False: "circle",
+    }
+
+    def symbol_repr(symbol: Optional[str]) -> str:
+        return "λ" if symbol is None else symbol
+
+    yield "digraph {\n"
+    yield "  rankdir=LR;\n"
+    yield "\n"
+    yield "  node [shape = point]; __start_point__\n"
+    for s in automaton.states:
+        yield f"  {s.name}[shape={shape_dict[s.is_final]}]\n"
+    yield "\n"
+    yield f"  __start_point__ -> {automaton.initial_state.name}\n"
+
+    if collapse_parallel:
+        # Transitions are grouped by origin, so only the edges of one state
+        # are merged at a time
+        state_index = automaton.get_state_index()
+        by_origin: List[List[aut.Transition]] = [[] for _ in automaton.states]
+        for t in automaton.transitions:
+            by_origin[state_index[t.initial_state]].append(t)
+
+        for state, transitions in zip(automaton.states, by_origin):
+            labels: Dict[aut.State, List[str]] = {}
+            for t in transitions:
+                labels.setdefault(t.final_state, []).append(
+                    symbol_repr(t.symbol),
+                )
+
+            for final_state, edge_labels in labels.items():
+                yield (
+                    f"  {state.name} -> {final_state.name}"
+                    f"[label=\"{','.join(edge_labels)}\"]\n"
+                )
+    else:
+        for t in automaton.transitions:
+            yield (
+                f"  {t.initial_state.name} -> {t.final_state.name}"
+                f"[label=\"{symbol_repr(t.symbol)}\"]\n"
+            )
+
+    yield "}\n"
+
+
+def write_dot(
+    automaton: aut.FiniteAutomaton,
+    *,
+    collapse_parallel: bool = False,
+) -> str:
     """
     Write a dot representation of the automaton.
 
     Args:
         automaton: Automaton to print.
+        collapse_parallel: If ``True``, transitions between the same pair
+            of states are drawn as a single edge labeled with all their
+            symbols, separated by commas.
 
     Returns:
         Representation of the automaton in dot (Graphviz) language.
 
     """
-    shape_dict = {
-        True: "doublecircle",
-        False: "circle",
-    }
+    return "".join(_iter_dot_lines(automaton, collapse_parallel))
 
-    def symbol_repr(symbol: Optional[str]) -> str:
-        return "λ" if symbol is None else symbol
 
-    return (
-        "digraph {\n"
-        "  rankdir=LR;\n"
-        "\n"
-        + "  node [shape = point]; __start_point__\n"
-        + "".join(
-            f"  {s.name}[shape={shape_dict[s.is_final]}]\n"
-            for s in automaton.states
-        )
-        + "\n"
-        + f"  __start_point__ -> {automaton.initial_state.name}\n"
-        + "".join(
-            f"  {t.initial_state.name} -> {t.final_state.name}"
-            f"[label=\"{symbol_repr(t.symbol)}\"]\n"
-            for t in automaton.transitions
-        )
-        + "}\n"
+def write_dot_file(
+    automaton: aut.FiniteAutomaton,
+    file: TextIO,
+    *,
+    collapse_parallel: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    Write a dot representation of the automaton to a file.
+
+    The representation is written in chunks, so it is never held in
+    memory as a whole.
+
+    Args:
+        automaton: Automaton to print.
+        file: Text file to write to.
+        collapse_parallel: If ``True``, transitions between the same pair
+            of states are drawn as a single edge labeled with all their
+            symbols, separated by commas.
+        chunk_size: Approximate number of characters of each write.
+
+    """
+    _write_chunked(
+        _iter_dot_lines(automaton, collapse_parallel),
+        file,
+        chunk_size,
     )
 
 
@@ -241,3 +400,127 @@ def deterministic_automata_isomorphism(
                 pending.appendleft((final1, final2))
 
     return equiv_map
+
+
+def _complete_table(
+    automaton: aut.FiniteAutomaton,
+    symbols: Sequence[str],
+) -> Tuple[List[int], List[bool], int]:
+    """
+    Flat transition table of a deterministic automaton.
+
+    The table is completed with a dead state, numbered after the states of
+    the automaton, for the missing transitions and the symbols that are not
+    in its alphabet.
+    """
+    state_index = automaton.get_state_index()
+    symbol_index = {s: i for i, s in enumerate(symbols)}
+    n_symbols = len(symbols)
+    dead = len(automaton.states)
+
+    table = [dead] * ((dead + 1) * n_symbols)
+    filled = bytearray(len(table))
+    for t in automaton.transitions:
+        if t.symbol is None:
+            raise ValueError("Automata are not deterministic")
+
+        i = state_index[t.initial_state] * n_symbols + symbol_index[t.symbol]
+        if filled[i]:
+            raise ValueError("Automata are not deterministic")
+
+        filled[i] = 1
+        table[i] = state_index[t.final_state]
+
+    finals = [s.is_final for s in automaton.states] + [False]
+    return table, finals, state_index[automaton.initial_state]
+
+
+def distinguishing_string(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> Optional[str]:
+    """
+    Find a string accepted by only one of two deterministic automata.
+
+    Uses the Hopcroft–Karp algorithm: pairs of states reached by the same
+    string are merged in a union-find structure over the states of both
+    automata, and each pair is only explored if its states were not
+    already known to be equivalent. It runs in almost linear time in the
+    number of transitions and never builds the product automaton. Missing
+    transitions, and symbols of only one alphabet, lead to a dead state.
+
+    Args:
+        automaton1: First deterministic automaton.
+        automaton2: Second deterministic automaton.
+
+    Returns:
+        ``None`` if both automata accept the same language. Otherwise, a
+        string accepted by only one of them. Pairs are explored breadth
+        first, so the string is usually short.
+
+    """
+    symbols = tuple(dict.fromkeys((*automaton1.symbols, *automaton2.symbols)))
+    n_symbols = len(symbols)
+    table1, finals1, initial1 = _complete_table(automaton1, symbols)
+    table2, finals2, initial2 = _complete_table(automaton2, symbols)
+
+    # States of the second automaton are numbered after the first one
+    offset = len(finals1)
+    parent = list(range(offset + len(finals2)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    parent[initial2 + offset] = initial1
+
+    # Explored pairs with the pair and symbol that led to them, so that
+    # the string of each pair can be rebuilt
+    pairs: List[Tuple[int, int]] = [(initial1, initial2)]
+    origins: List[Tuple[int, int]] = [(-1, -1)]
+    i = 0
+    while i < len(pairs):
+        state1, state2 = pairs[i]
+        if finals1[state1] != finals2[state2]:
+            string = []
+            while i > 0:
+                i, code = origins[i]
+                string.append(symbols[code])
+            return "".join(reversed(string))
+
+        row1 = state1 * n_symbols
+        row2 = state2 * n_symbols
+        for code in range(n_symbols):
+            next1 = table1[row1 + code]
+            next2 = table2[row2 + code]
+            root1 = find(next1)
+            root2 = find(next2 + offset)
+            if root1 != root2:
+                parent[root2] = root1
+                pairs.append((next1, next2))
+                origins.append((i, code))
+
+        i += 1
+
+    return None
+
+
+def deterministic_automata_equivalence(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> bool:
+    """
+    Check if two deterministic automata accept the same language.
+
+    Args:
+        automaton1: First deterministic automaton.
+        automaton2: Second deterministic automaton.
+
+    Returns:
+        ``True`` if the automata are equivalent.
+        ``False`` otherwise.
+
+    """
+    return distinguishing_string(automaton1, automaton2) is None
@@ -0,0 +1,5 @@
+"""Benchmarks for the automata package.
+
+Each module can be run on its own from the ``src`` directory, e.g.
+``python -m benchmarks.bench_evaluator``.
+"""
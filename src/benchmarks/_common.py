@@ -0,0 +1,39 @@
+"""Shared helpers for the benchmarks."""
+import time
+from typing import Callable, Sequence
+
+
+def best_time(function: Callable[[], object], *, repeat: int = 3) -> float:
+    """
+    Time a function several times and keep the best run.
+
+    Args:
+        function: Function to time. It is called without arguments.
+        repeat: Number of runs.
+
+    Returns:
+        Best wall-clock time, in seconds.
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def print_table(header: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """
+    Print a simple aligned table.
+
+    Args:
+        header: Column names.
+        rows: Rows of values, printed with ``str``.
+
+    """
+    table = [list(header)] + [[str(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(header))]
+    for row in table:
+        print("  ".join(v.rjust(w) for v, w in zip(row, widths)))
@@ -0,0 +1,54 @@
+"""Batch evaluation of many strings against one automaton."""
+import os
+import random
+
+from automata.automaton_evaluator import BitsetFiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    digit = "(0+1+2+3+4+5+6+7+8+9)"
+    automaton = REParser().create_automaton(
+        f"({digit}.{digit}*.,.{digit}*)+{digit}*",
+    )
+    evaluator = BitsetFiniteAutomatonEvaluator(automaton)
+
+    rng = random.Random(0)
+    rows = []
+    for n_unique in (100, 10000, 100000):
+        vocabulary = [
+            "".join(rng.choice("0123456789,") for _ in range(12))
+            for _ in range(n_unique)
+        ]
+        strings = [rng.choice(vocabulary) for _ in range(200000)]
+
+        loop = best_time(
+            lambda: [evaluator.accepts(s) for s in strings],
+            repeat=1,
+        )
+        batch = best_time(lambda: evaluator.accepts_many(strings), repeat=1)
+        pool = best_time(
+            lambda: evaluator.accepts_many(
+                strings,
+                processes=os.cpu_count(),
+            ),
+            repeat=1,
+        )
+        rows.append((
+            len(strings),
+            n_unique,
+            f"{loop * 1e3:.0f}",
+            f"{batch * 1e3:.0f}",
+            f"{pool * 1e3:.0f}",
+        ))
+
+    print_table(
+        ("strings", "unique", "loop ms", "batch ms", "pool ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
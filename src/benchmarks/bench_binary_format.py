@@ -0,0 +1,65 @@
+"""Text format against binary format for large automata."""
+import os
+import random
+import tempfile
+
+from automata.binary_format import dump, load, load_mapped
+from automata.utils import AutomataFormat
+from benchmarks._common import best_time, print_table
+from benchmarks.bench_minimization import random_dfa
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = random.Random(0)
+    string = "".join(rng.choice("ab") for _ in range(10000))
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dfa.aut")
+        for n_states in (1000, 10000, 100000):
+            automaton = random_dfa(n_states, "ab")
+
+            text = AutomataFormat.write(automaton)
+            write_text = best_time(lambda: AutomataFormat.write(automaton))
+            read_text = best_time(lambda: AutomataFormat.read(text), repeat=1)
+
+            write_binary = best_time(lambda: dump(automaton, path))
+            read_binary = best_time(lambda: load(path), repeat=1)
+
+            def open_mapped() -> None:
+                with load_mapped(path):
+                    pass
+
+            with load_mapped(path) as mapped:
+                evaluate = best_time(lambda: mapped.accepts(string))
+
+            rows.append((
+                n_states,
+                f"{len(text.encode()) / 1e3:.0f}",
+                f"{os.path.getsize(path) / 1e3:.0f}",
+                f"{write_text * 1e3:.1f}",
+                f"{write_binary * 1e3:.1f}",
+                f"{read_text * 1e3:.1f}",
+                f"{read_binary * 1e3:.1f}",
+                f"{best_time(open_mapped) * 1e3:.2f}",
+                f"{evaluate / len(string) * 1e9:.0f}",
+            ))
+
+    print_table(
+        (
+            "states",
+            "text kB",
+            "binary kB",
+            "write text ms",
+            "dump ms",
+            "read text ms",
+            "load ms",
+            "map ms",
+            "mapped ns/symbol",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""One combined automaton against evaluating several per input."""
+import random
+
+from automata.automaton import FiniteAutomaton
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = REParser()
+    # Contains "abc", ends in "c", and does not contain "bb"
+    contains = parser.create_dfa("(a+b+c)*.a.b.c.(a+b+c)*").to_minimized()
+    ends = parser.create_dfa("(a+b+c)*.c").to_minimized()
+    forbidden = parser.create_dfa("(a+b+c)*.b.b.(a+b+c)*").to_minimized()
+
+    def combine() -> FiniteAutomaton:
+        return contains.intersect(ends).difference(forbidden)
+
+    combined = combine()
+    build = best_time(combine)
+
+    rng = random.Random(0)
+    strings = [
+        "".join(rng.choice("abc") for _ in range(rng.randrange(5, 40)))
+        for _ in range(20000)
+    ]
+    compiled = [a.compile() for a in (contains, ends, forbidden)]
+    compiled_combined = combined.compile()
+
+    def separately() -> int:
+        return sum(
+            compiled[0].accepts(s)
+            and compiled[1].accepts(s)
+            and not compiled[2].accepts(s)
+            for s in strings
+        )
+
+    def together() -> int:
+        return sum(compiled_combined.accepts(s) for s in strings)
+
+    assert separately() == together()
+    print_table(
+        ("query", "states", "build ms", "ms for 20000 strings"),
+        [
+            (
+                "3 automata",
+                len(contains.states) + len(ends.states)
+                + len(forbidden.states),
+                "-",
+                f"{best_time(separately) * 1e3:.0f}",
+            ),
+            (
+                "combined",
+                len(combined.states),
+                f"{build * 1e3:.1f}",
+                f"{best_time(together) * 1e3:.0f}",
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Cold, warm on-disk and warm in-memory compilation of regexes."""
+import tempfile
+
+from automata.compile_cache import CompileCache
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    num = "(0+1+2+3+4+5+6+7+8+9)"
+    regexes = [
+        f"({num}.{num}*.,.{num}*)+{num}*",
+        "(a+b)*.a" + ".(a+b)" * 8,
+        ".".join("abcdefghij" * 20),
+    ] + [f"(a+b)*.{c}.(a+b)*" for c in "cdefghijklmnopq"]
+
+    def pipeline() -> None:
+        for regex in regexes:
+            REParser().create_automaton(regex).to_deterministic() \
+                .to_minimized()
+
+    with tempfile.TemporaryDirectory() as directory:
+        populate = CompileCache(directory=directory)
+        cold = best_time(
+            lambda: [populate.get(r) for r in regexes],
+            repeat=1,
+        )
+        disk = best_time(
+            lambda: [CompileCache(directory=directory).get(r) for r in regexes],
+        )
+        memory_cache = CompileCache()
+        for regex in regexes:
+            memory_cache.get(regex)
+        memory = best_time(lambda: [memory_cache.get(r) for r in regexes])
+
+    print_table(
+        ("path", "ms for all regexes"),
+        [
+            ("pipeline", f"{best_time(pipeline, repeat=1) * 1e3:.1f}"),
+            ("cache, cold", f"{cold * 1e3:.1f}"),
+            ("cache, warm disk", f"{disk * 1e3:.1f}"),
+            ("cache, warm memory", f"{memory * 1e3:.3f}"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
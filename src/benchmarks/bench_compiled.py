@@ -0,0 +1,41 @@
+"""Compiled DFA execution against FiniteAutomatonEvaluator."""
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    automaton = REParser().create_automaton(
+        "(a+b)*.a.(a+b).(a+b)",
+    ).to_deterministic()
+    evaluator = FiniteAutomatonEvaluator(automaton)
+    compiled = automaton.compile()
+
+    rows = []
+    for length in (10**3, 10**4, 10**5, 10**6):
+        string = ("abbab" * length)[:length]
+        data = string.encode("latin-1")
+        repeat = 1 if length >= 10**6 else 3
+        evaluator_time = best_time(
+            lambda: evaluator.accepts(string),
+            repeat=repeat,
+        )
+        compiled_time = best_time(lambda: compiled.accepts(string))
+        bytes_time = best_time(lambda: compiled.accepts(data))
+        rows.append((
+            length,
+            f"{evaluator_time * 1e3:.2f}",
+            f"{compiled_time * 1e3:.2f}",
+            f"{bytes_time * 1e3:.2f}",
+            f"{evaluator_time / compiled_time:.1f}x",
+        ))
+
+    print_table(
+        ("length", "evaluator ms", "compiled ms", "bytes ms", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
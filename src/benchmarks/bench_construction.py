@@ -0,0 +1,33 @@
+"""Cost of the validated and the trusted automaton constructors."""
+from typing import Any, Dict
+
+from automata.automaton import FiniteAutomaton
+from benchmarks._common import best_time, print_table
+from benchmarks.bench_minimization import random_dfa
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    for n_states in (10**3, 10**4, 10**5):
+        automaton = random_dfa(n_states, "ab")
+        arguments: Dict[str, Any] = dict(
+            initial_state=automaton.initial_state,
+            states=automaton.states,
+            symbols=automaton.symbols,
+            transitions=automaton.transitions,
+        )
+        validated = best_time(lambda: FiniteAutomaton(**arguments))
+        trusted = best_time(lambda: FiniteAutomaton.from_trusted(**arguments))
+        rows.append((
+            n_states,
+            len(automaton.transitions),
+            f"{validated * 1e3:.1f}",
+            f"{trusted * 1e3:.2f}",
+        ))
+
+    print_table(("states", "transitions", "validated ms", "trusted ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
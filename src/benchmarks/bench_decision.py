@@ -0,0 +1,69 @@
+"""Antichain inclusion and universality against determinizing."""
+from typing import Callable, Dict, Tuple
+
+from automata.decision import is_empty, is_included, is_universal
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def checks(n: int) -> Dict[str, Tuple[Callable[[], bool], Callable[[], bool]]]:
+    """Return each check done with antichains and by determinizing."""
+    # The (n+1)-th symbol from the end is an a: its DFA has 2^(n+1) states
+    tail = ".(a+b)" * n
+    nth = f"(a+b)*.a{tail}"
+
+    # The previous symbol is also an a
+    sub = REParser().create_automaton(f"(a+b)*.a.a{tail}")
+    sup = REParser().create_automaton(nth)
+    # Broad rules next to the nth-from-end one
+    universal = REParser().create_automaton(f"λ+(a+b)*.a+(a+b)*.b+{nth}")
+    not_universal = REParser().create_automaton(
+        f"λ+(a+b)*.b+a.(a+b)*+{nth}",
+    )
+
+    return {
+        "inclusion": (
+            lambda: is_included(sub, sup),
+            lambda: is_empty(sub.to_deterministic().difference(
+                sup.to_deterministic(),
+                minimize=False,
+            )),
+        ),
+        "universal": (
+            lambda: is_universal(universal),
+            lambda: is_empty(universal.to_deterministic().complement(
+                minimize=False,
+            )),
+        ),
+        "not universal": (
+            lambda: is_universal(not_universal),
+            lambda: is_empty(not_universal.to_deterministic().complement(
+                minimize=False,
+            )),
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    for n in (4, 8, 12):
+        for name, (antichains, determinized) in checks(n).items():
+            result = antichains()
+            assert result == determinized()
+            rows.append((
+                name,
+                n,
+                result,
+                f"{best_time(antichains) * 1e3:.1f}",
+                f"{best_time(determinized, repeat=1) * 1e3:.1f}",
+            ))
+
+    print_table(
+        ("check", "n", "result", "antichains ms", "determinize ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Derivative construction against Thompson, subset and minimization."""
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def pipeline(regex: str) -> None:
+    """Build the minimal automaton in three stages."""
+    REParser().create_automaton(regex).to_deterministic().to_minimized()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    num = "(0+1+2+3+4+5+6+7+8+9)"
+    regexes = {
+        "number": f"({num}.{num}*.,.{num}*)+{num}*",
+        "nth from end 8": "(a+b)*.a" + ".(a+b)" * 8,
+        "nth from end 11": "(a+b)*.a" + ".(a+b)" * 11,
+        "star chain": ".".join(["(a+b.c)*"] * 100),
+        "fixed": ".".join("abcdefghij" * 50),
+    }
+
+    rows = []
+    for name, regex in regexes.items():
+        deterministic = REParser().create_automaton(regex).to_deterministic()
+        derivatives = REParser().create_dfa(regex)
+        rows.append((
+            name,
+            len(deterministic.states),
+            len(deterministic.to_minimized().states),
+            len(derivatives.states),
+            f"{best_time(lambda: pipeline(regex), repeat=1) * 1e3:.1f}",
+            f"{best_time(lambda: REParser().create_dfa(regex)) * 1e3:.1f}",
+        ))
+
+    print_table(
+        (
+            "regex",
+            "subset states",
+            "minimal states",
+            "derivative states",
+            "pipeline ms",
+            "derivatives ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
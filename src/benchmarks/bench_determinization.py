@@ -0,0 +1,30 @@
+"""Subset construction on regexes with an exponential determinization."""
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    for n in range(1, 13):
+        # The n-th symbol from the end is an a: the DFA has 2^(n+1) states
+        regex = "(a+b)*.a" + ".(a+b)" * n
+        automaton = REParser().create_automaton(regex)
+        elapsed = best_time(automaton.to_deterministic, repeat=1)
+        deterministic = automaton.to_deterministic()
+        rows.append((
+            n,
+            len(automaton.states),
+            len(deterministic.states),
+            f"{elapsed * 1e3:.1f}",
+            f"{elapsed / len(deterministic.states) * 1e6:.1f}",
+        ))
+
+    print_table(
+        ("n", "nfa states", "dfa states", "ms", "us/dfa state"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Hopcroft-Karp equivalence against minimizing both automata."""
+from automata.utils import (
+    deterministic_automata_isomorphism,
+    distinguishing_string,
+)
+from benchmarks._common import best_time, print_table
+from benchmarks.bench_minimization import random_dfa
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    for n_states in (1000, 10000, 100000, 250000):
+        # Different seeds give automata that almost surely differ
+        automaton = random_dfa(n_states, "abcd")
+        same = random_dfa(n_states, "abcd")
+        other = random_dfa(n_states, "abcd", seed=1)
+        for automaton_ in (automaton, same, other):
+            automaton_.get_state_index()
+
+        equivalent = best_time(
+            lambda: distinguishing_string(automaton, same),
+            repeat=1,
+        )
+        different = best_time(
+            lambda: distinguishing_string(automaton, other),
+            repeat=1,
+        )
+        if n_states <= 10000:
+            minimize = best_time(
+                lambda: deterministic_automata_isomorphism(
+                    automaton.to_minimized(),
+                    same.to_minimized(),
+                ),
+                repeat=1,
+            )
+            minimize_ms = f"{minimize * 1e3:.0f}"
+        else:
+            minimize_ms = "-"
+
+        rows.append((
+            len(automaton.transitions),
+            f"{equivalent * 1e3:.0f}",
+            f"{different * 1e3:.1f}",
+            minimize_ms,
+        ))
+
+    print_table(
+        (
+            "transitions",
+            "equivalent ms",
+            "different ms",
+            "minimize + isomorphism ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Per-symbol cost of FiniteAutomatonEvaluator against automaton size."""
+from typing import List, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import (
+    BitsetFiniteAutomatonEvaluator,
+    FiniteAutomatonEvaluator,
+)
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def ring_automaton(n_states: int) -> FiniteAutomaton:
+    """
+    Create a ring of states with a reset symbol.
+
+    Only one state is active at a time, so the work per symbol should not
+    depend on the number of states.
+
+    """
+    states = [
+        State(f"q{i}", is_final=(i == n_states - 1))
+        for i in range(n_states)
+    ]
+    transitions = []
+    for i, state in enumerate(states):
+        transitions.append(Transition(state, "a", states[(i + 1) % n_states]))
+        transitions.append(Transition(state, "b", states[0]))
+
+    return FiniteAutomaton(
+        initial_state=states[0],
+        states=states,
+        symbols="ab",
+        transitions=transitions,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    string = "aab" * 2000
+    rows = []
+    for n_states in (10, 100, 1000, 10000, 100000):
+        evaluator = FiniteAutomatonEvaluator(ring_automaton(n_states))
+        evaluator.accepts("a")  # Build the index outside the timing
+        elapsed = best_time(lambda: evaluator.accepts(string))
+        rows.append((
+            n_states,
+            2 * n_states,
+            f"{elapsed / len(string) * 1e6:.3f}",
+        ))
+
+    print_table(("states", "transitions", "us/symbol"), rows)
+    print()
+
+    # Thompson automata are full of lambda chains
+    digit = "(0+1+2+3+4+5+6+7+8+9)"
+    string = "0123456789" * 300
+    thompson_rows: List[Tuple[int, int, str, str]] = []
+    for n_terms in (1, 4, 16):
+        regex = "+".join([f"{digit}*.,.{digit}*"] * n_terms)
+        automaton = REParser().create_automaton(regex)
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        elapsed = best_time(lambda: evaluator.accepts(string))
+        bitset_evaluator = BitsetFiniteAutomatonEvaluator(automaton)
+        bitset_elapsed = best_time(lambda: bitset_evaluator.accepts(string))
+        thompson_rows.append((
+            len(automaton.states),
+            len(automaton.transitions),
+            f"{elapsed / len(string) * 1e6:.3f}",
+            f"{bitset_elapsed / len(string) * 1e6:.3f}",
+        ))
+
+    print_table(
+        ("thompson states", "transitions", "us/symbol", "bitset us/symbol"),
+        thompson_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
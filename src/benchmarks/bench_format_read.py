@@ -0,0 +1,37 @@
+"""Parse throughput of AutomataFormat for large automaton files."""
+import os
+import tempfile
+
+from automata.utils import AutomataFormat
+from benchmarks._common import best_time, print_table
+from benchmarks.bench_minimization import random_dfa
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "automaton.txt")
+        for n_states in (1000, 10000, 100000):
+            description = AutomataFormat.write(random_dfa(n_states, "abc"))
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(description)
+            megabytes = os.path.getsize(path) / 1e6
+
+            def read_file() -> None:
+                with open(path, encoding="utf-8") as file:
+                    AutomataFormat.read_file(file)
+
+            read = best_time(lambda: AutomataFormat.read(description))
+            rows.append((
+                n_states,
+                f"{megabytes:.2f}",
+                f"{megabytes / read:.1f}",
+                f"{megabytes / best_time(read_file):.1f}",
+            ))
+
+    print_table(("states", "MB", "read MB/s", "read_file MB/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
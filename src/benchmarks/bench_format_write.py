@@ -0,0 +1,102 @@
+"""Peak memory and time of the string and streaming writers."""
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.utils import AutomataFormat, write_dot, write_dot_file
+from benchmarks._common import print_table
+from benchmarks.bench_minimization import random_dfa
+
+
+def digit_ring(n_states: int) -> FiniteAutomaton:
+    """Ring of states where nine digits advance and 9 goes back to start."""
+    states = [State(f"q{i}", is_final=(i % 7 == 0)) for i in range(n_states)]
+    transitions = [
+        Transition(
+            state,
+            digit,
+            states[0] if digit == "9" else states[(i + 1) % n_states],
+        )
+        for i, state in enumerate(states)
+        for digit in "0123456789"
+    ]
+    return FiniteAutomaton.from_trusted(
+        initial_state=states[0],
+        states=states,
+        symbols="0123456789",
+        transitions=transitions,
+    )
+
+
+def measure(function: Callable[[], object]) -> Tuple[float, float]:
+    """Return the peak of allocated memory in MB and the time in ms."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6, elapsed * 1e3
+
+
+def run_writers(
+    automaton: FiniteAutomaton,
+    path: str,
+) -> List[Tuple[str, str, str, str]]:
+    """Measure every writer on an automaton."""
+    def to_file(text: Callable[[], str]) -> Callable[[], None]:
+        def write() -> None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text())
+        return write
+
+    def stream(writer: Callable[..., None], **kwargs: bool) -> Callable[[], None]:
+        def write() -> None:
+            with open(path, "w", encoding="utf-8") as file:
+                writer(automaton, file, **kwargs)
+        return write
+
+    cases = [
+        ("write", to_file(lambda: AutomataFormat.write(automaton))),
+        ("write_file", stream(AutomataFormat.write_file)),
+        ("write_dot", to_file(lambda: write_dot(automaton))),
+        ("write_dot_file", stream(write_dot_file)),
+        (
+            "write_dot_file collapsed",
+            stream(write_dot_file, collapse_parallel=True),
+        ),
+    ]
+    rows = []
+    for name, function in cases:
+        peak, elapsed = measure(function)
+        rows.append((
+            name,
+            f"{os.path.getsize(path) / 1e6:.1f}",
+            f"{peak:.1f}",
+            f"{elapsed:.0f}",
+        ))
+
+    return rows
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out")
+        for name, automaton in (
+            ("random", random_dfa(100000, "abcd")),
+            ("digit ring", digit_ring(40000)),
+        ):
+            # The state index is cached, so it is built before measuring
+            automaton.get_state_index()
+            rows += [(name, *row) for row in run_writers(automaton, path)]
+
+    print_table(("automaton", "writer", "output MB", "peak MB", "ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Thompson against Glushkov construction in REParser."""
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    num = "(0+1+2+3+4+5+6+7+8+9)"
+    regexes = {
+        "number": f"({num}.{num}*.,.{num}*)+{num}*",
+        "nth from end": "(a+b)*.a" + ".(a+b)" * 10,
+        "star chain": ".".join(["(a+b.c)*"] * 50),
+    }
+    strings = {
+        "number": "1234567890,0987654321" * 50,
+        "nth from end": "ab" * 500,
+        "star chain": "abc" * 300,
+    }
+
+    rows = []
+    for name, regex in regexes.items():
+        for backend in ("thompson", "glushkov"):
+            automaton = REParser().create_automaton(regex, backend=backend)
+            build = best_time(
+                lambda: REParser().create_automaton(regex, backend=backend),
+            )
+            determinize = best_time(automaton.to_deterministic, repeat=1)
+            evaluator = FiniteAutomatonEvaluator(automaton)
+            evaluate = best_time(lambda: evaluator.accepts(strings[name]))
+            rows.append((
+                name,
+                backend,
+                len(automaton.states),
+                len(automaton.transitions),
+                f"{build * 1e3:.1f}",
+                f"{determinize * 1e3:.1f}",
+                f"{evaluate * 1e3:.1f}",
+            ))
+
+    print_table(
+        (
+            "regex",
+            "backend",
+            "states",
+            "transitions",
+            "build ms",
+            "determinize ms",
+            "evaluate ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
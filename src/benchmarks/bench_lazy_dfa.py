@@ -0,0 +1,55 @@
+"""Lazy DFA evaluation against NFA simulation."""
+import random
+
+from automata.automaton_evaluator import (
+    BitsetFiniteAutomatonEvaluator,
+    LazyDFAEvaluator,
+)
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = random.Random(0)
+    string = "".join(rng.choice("ab") for _ in range(20000))
+
+    rows = []
+    for n in (2, 6, 10, 14):
+        # The deterministic automaton has 2^(n+1) states
+        regex = "(a+b)*.a" + ".(a+b)" * n
+        automaton = REParser().create_automaton(regex)
+
+        bitset = BitsetFiniteAutomatonEvaluator(automaton)
+        bitset_time = best_time(lambda: bitset.accepts(string))
+
+        for cache_size in (100, 100000):
+            lazy = LazyDFAEvaluator(automaton, cache_size=cache_size)
+            lazy_time = best_time(lambda: lazy.accepts(string))
+            total = lazy.hits + lazy.misses
+            rows.append((
+                n,
+                cache_size,
+                f"{bitset_time / len(string) * 1e6:.2f}",
+                f"{lazy_time / len(string) * 1e6:.2f}",
+                f"{lazy.hits / total:.3f}",
+                lazy.flushes,
+                lazy.fallback,
+            ))
+
+    print_table(
+        (
+            "n",
+            "cache",
+            "bitset us/sym",
+            "lazy us/sym",
+            "hit ratio",
+            "flushes",
+            "fallback",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Scaling of the minimization engines with the number of states."""
+import random
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from benchmarks._common import best_time, print_table
+
+
+def random_dfa(n_states: int, symbols: str, seed: int = 0) -> FiniteAutomaton:
+    """
+    Create a random complete deterministic automaton.
+
+    Every state has a twin with the same behaviour, so the minimal
+    automaton has half the states.
+
+    """
+    rng = random.Random(seed)
+    half = n_states // 2
+    finals = [rng.random() < 0.5 for _ in range(half)]
+    states = [
+        State(f"q{i}", is_final=finals[i % half])
+        for i in range(2 * half)
+    ]
+    targets = [[rng.randrange(half) for _ in symbols] for _ in range(half)]
+    transitions = [
+        Transition(
+            state,
+            symbol,
+            states[targets[i % half][j] + half * rng.randrange(2)],
+        )
+        for i, state in enumerate(states)
+        for j, symbol in enumerate(symbols)
+    ]
+
+    return FiniteAutomaton(
+        initial_state=states[0],
+        states=states,
+        symbols=symbols,
+        transitions=transitions,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    for n_states in (10**2, 10**3, 10**4, 10**5):
+        automaton = random_dfa(n_states, "ab")
+        hopcroft = best_time(
+            lambda: automaton.to_minimized("hopcroft"),
+            repeat=1,
+        )
+        if n_states <= 10**3:
+            moore = best_time(
+                lambda: automaton.to_minimized("moore"),
+                repeat=1,
+            )
+            moore_ms = f"{moore * 1e3:.1f}"
+        else:
+            moore_ms = "-"
+
+        minimized = automaton.to_minimized("hopcroft")
+        rows.append((
+            n_states,
+            len(minimized.states),
+            f"{hopcroft * 1e3:.1f}",
+            moore_ms,
+        ))
+
+    print_table(("states", "minimal", "hopcroft ms", "moore ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
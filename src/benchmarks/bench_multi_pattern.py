@@ -0,0 +1,99 @@
+"""One multi-pattern pass against evaluating every pattern separately."""
+import random
+from typing import List, Tuple
+
+from automata.multi_pattern import MultiPatternMatcher
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = random.Random(0)
+    alphabet = "abcdefgh"
+
+    def random_word(length: int) -> str:
+        return "".join(rng.choice(alphabet) for _ in range(length))
+
+    tokens = [random_word(rng.randint(3, 6)) for _ in range(2000)]
+
+    rows = []
+    for n_patterns in (10, 100, 1000):
+        # Fixed words, some with a repeated tail
+        patterns = [
+            ".".join(random_word(3)) + f".{rng.choice(alphabet)}*"
+            for _ in range(n_patterns)
+        ]
+        matcher = MultiPatternMatcher(patterns)
+        # The first pass also builds the states of the lazy automaton
+        cold_time = best_time(
+            lambda: [matcher.match(token) for token in tokens],
+            repeat=1,
+        )
+        matcher_time = best_time(
+            lambda: [matcher.match(token) for token in tokens],
+        )
+
+        if n_patterns <= 100:
+            compiled = [
+                REParser().create_automaton(p).to_deterministic().compile()
+                for p in patterns
+            ]
+
+            def one_by_one() -> None:
+                for token in tokens:
+                    for automaton in compiled:
+                        try:
+                            automaton.accepts(token)
+                        except ValueError:
+                            pass
+
+            separate_ms = f"{best_time(one_by_one) * 1e3:.1f}"
+        else:
+            separate_ms = "-"
+
+        rows.append((
+            n_patterns,
+            len(tokens),
+            f"{cold_time * 1e3:.1f}",
+            f"{matcher_time * 1e3:.1f}",
+            separate_ms,
+        ))
+
+    print_table(
+        (
+            "patterns",
+            "tokens",
+            "multi cold ms",
+            "multi warm ms",
+            "one by one ms",
+        ),
+        rows,
+    )
+    print()
+
+    # The n-th symbol from the end: deterministic automata of 2^k states,
+    # so the lazy cache thrashes and falls back to bitset simulation
+    patterns = ["a" + ".(a+b)" * k for k in range(6, 15)]
+    text = "".join(rng.choice("ab") for _ in range(20000))
+    cache_rows: List[Tuple[int, int, str, int, bool]] = []
+    for cache_size in (1000, 10000, 100000):
+        matcher = MultiPatternMatcher(patterns, cache_size=cache_size)
+        scan_time = best_time(lambda: list(matcher.scan(text)), repeat=1)
+        dfa = matcher._unanchored
+        cache_rows.append((
+            cache_size,
+            len(text),
+            f"{scan_time * 1e3:.0f}",
+            dfa.flushes,
+            dfa.fallback,
+        ))
+
+    print_table(
+        ("cache size", "text", "scan ms", "flushes", "fallback"),
+        cache_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Construction time of REParser against the length of the regex."""
+from automata.re_parser import REParser
+from automata.re_parser_interfaces import AbstractREParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows = []
+    for n_terms in (50, 100, 1000, 5000, 10000):
+        regex = ".".join(["(a+b.c)*"] * n_terms)
+        builder = best_time(
+            lambda: REParser().create_automaton(regex),
+            repeat=1,
+        )
+        if n_terms <= 100:
+            step_by_step = best_time(
+                lambda: AbstractREParser.create_automaton(REParser(), regex),
+                repeat=1,
+            )
+            step_ms = f"{step_by_step * 1e3:.0f}"
+        else:
+            step_ms = "-"
+
+        rows.append((
+            len(regex),
+            f"{builder * 1e3:.0f}",
+            f"{builder / len(regex) * 1e6:.1f}",
+            step_ms,
+        ))
+
+    print_table(
+        ("regex chars", "builder ms", "us/char", "step by step ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Evaluation and determinization of Thompson automata without lambdas."""
+import random
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    random.seed(0)
+    string = "".join(random.choice("ab") for _ in range(2000))
+    regexes = {
+        "nth from end": "(a+b)*.a" + ".(a+b)" * 8,
+        "nested stars": "((a*.b*)*.(a+λ)*)*.b" * 8,
+        "alternatives": "+".join(
+            "(a+b)*." + ".".join("ab"[(i >> j) & 1] for j in range(6))
+            for i in range(16)
+        ),
+    }
+
+    evaluator = FiniteAutomatonEvaluator
+    rows = []
+    for name, regex in regexes.items():
+        automaton = REParser().create_automaton(regex)
+        result = automaton.remove_lambdas()
+        assert (
+            FiniteAutomatonEvaluator(automaton).accepts(string)
+            == FiniteAutomatonEvaluator(result).accepts(string)
+        )
+
+        def determinize_thompson() -> None:
+            REParser().create_automaton(regex).to_deterministic()
+
+        def determinize_removed() -> None:
+            REParser().create_automaton(regex).remove_lambdas(
+            ).to_deterministic()
+
+        rows.append((
+            name,
+            f"{len(automaton.states)}/{len(automaton.transitions)}",
+            f"{len(result.states)}/{len(result.transitions)}",
+            f"{best_time(automaton.remove_lambdas) * 1e3:.2f}",
+            f"{best_time(lambda: evaluator(automaton).accepts(string)) * 1e3:.1f}",
+            f"{best_time(lambda: evaluator(result).accepts(string)) * 1e3:.1f}",
+            f"{best_time(determinize_thompson, repeat=1) * 1e3:.1f}",
+            f"{best_time(determinize_removed, repeat=1) * 1e3:.1f}",
+        ))
+
+    print_table(
+        (
+            "regex",
+            "thompson states/transitions",
+            "without lambdas",
+            "remove ms",
+            "accepts ms",
+            "accepts without lambdas ms",
+            "determinize ms",
+            "remove + determinize ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Substring search against running the automaton from every offset."""
+import random
+from typing import List, Tuple
+
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+
+def main() -> None:
+    """Run the benchmark."""
+    automaton = REParser().create_automaton("a.b.(a+b)*.c")
+    compiled = automaton.to_deterministic().compile()
+    searcher = automaton.get_searcher()
+    rng = random.Random(0)
+
+    def from_every_offset(text: str) -> int:
+        codes = compiled.encode(text, strict=False)
+        table, finals, dead = compiled.table, compiled.finals, compiled.dead
+        n_symbols = len(compiled.symbols)
+        found = 0
+        for start in range(len(codes)):
+            state = compiled.initial
+            for code in codes[start:]:
+                if code >= n_symbols:
+                    break
+                state = table[state * n_symbols + code]
+                if state < 0 or dead[state]:
+                    break
+                if finals[state]:
+                    found += 1
+                    break
+        return found
+
+    rows = []
+    for length in (10**3, 10**4, 10**5, 10**6):
+        text = "".join(rng.choice("abcx") for _ in range(length))
+        search_time = best_time(lambda: list(searcher.finditer(text)))
+        if length <= 10**5:
+            naive_time = best_time(lambda: from_every_offset(text), repeat=1)
+            naive_ms = f"{naive_time * 1e3:.1f}"
+        else:
+            naive_ms = "-"
+
+        rows.append((
+            length,
+            len(list(searcher.finditer(text))),
+            f"{search_time * 1e3:.1f}",
+            naive_ms,
+        ))
+
+    print_table(("text", "matches", "finditer ms", "every offset ms"), rows)
+    print()
+
+    # Every forward run reaches the end of the text, waiting for a b
+    pathological = REParser().create_automaton("a+a*.b")
+    pathological_rows: List[Tuple[int, str]] = []
+    for length in (10**3, 10**4, 10**5):
+        text = "a" * length
+        pathological_rows.append((
+            length,
+            f"{best_time(lambda: list(pathological.finditer(text))) * 1e3:.1f}",
+        ))
+
+    print_table(("a+a*.b over a^n", "finditer ms"), pathological_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Streaming evaluation of large files with constant memory."""
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+
+from automata.automaton_evaluator import LazyDFAEvaluator
+from automata.re_parser import REParser
+from automata.streaming import accepts_stream
+from benchmarks._common import print_table
+
+
+def _run(evaluator: LazyDFAEvaluator, path: str, kind: str) -> float:
+    with open(path, "rb") as file:
+        start = time.perf_counter()
+        if kind == "mmap":
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                accepts_stream(evaluator, m)
+        else:
+            accepts_stream(evaluator, file)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    automaton = REParser().create_automaton("(a+b)*.a.(a+b).(a+b)")
+    evaluator = LazyDFAEvaluator(automaton)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mb in (1, 4, 8):
+            path = os.path.join(directory, f"input{size_mb}.txt")
+            with open(path, "wb") as file:
+                file.write(b"abbab" * (size_mb * 1024 * 1024 // 5))
+
+            for kind in ("file", "mmap"):
+                # Time without tracing, then measure the peak memory
+                elapsed = _run(evaluator, path, kind)
+                tracemalloc.start()
+                _run(evaluator, path, kind)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                rows.append((
+                    size_mb,
+                    kind,
+                    f"{size_mb / elapsed:.2f}",
+                    f"{peak / 1024:.0f}",
+                ))
+
+    print_table(("input MB", "source", "MB/s", "peak KiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""States removed by trim and its effect on the conversions."""
+from typing import Callable, Dict, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser import REParser
+from benchmarks._common import best_time, print_table
+
+Conversion = Callable[[FiniteAutomaton, bool], FiniteAutomaton]
+
+
+def with_dead_branch(
+    automaton: FiniteAutomaton,
+    dead: FiniteAutomaton,
+) -> FiniteAutomaton:
+    """Union of an automaton and a copy of another without final states."""
+    copies = {s: State(f"d{s.name}") for s in dead.states}
+    initial = State("start")
+    return FiniteAutomaton(
+        initial_state=initial,
+        states=(initial, *automaton.states, *copies.values()),
+        symbols=tuple(dict.fromkeys((*automaton.symbols, *dead.symbols))),
+        transitions=(
+            Transition(initial, None, automaton.initial_state),
+            Transition(initial, None, copies[dead.initial_state]),
+            *automaton.transitions,
+            *(
+                Transition(
+                    copies[t.initial_state],
+                    t.symbol,
+                    copies[t.final_state],
+                )
+                for t in dead.transitions
+            ),
+        ),
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = REParser()
+    nth = "(a+b)*.a" + ".(a+b)" * 9
+    nth_dfa = parser.create_dfa(nth)
+
+    def minimize(automaton: FiniteAutomaton, trim: bool) -> FiniteAutomaton:
+        return automaton.to_minimized(trim=trim)
+
+    def determinize(automaton: FiniteAutomaton, trim: bool) -> FiniteAutomaton:
+        return automaton.to_deterministic(trim=trim)
+
+    cases: Dict[str, Tuple[FiniteAutomaton, str, Conversion]] = {
+        # Most pairs of the product can no longer reach a final pair
+        "product": (
+            nth_dfa.intersect(
+                parser.create_dfa("a.a.(a+b)*.b.b"),
+                minimize=False,
+            ),
+            "minimize",
+            minimize,
+        ),
+        "empty product": (
+            nth_dfa.intersect(parser.create_dfa("b*"), minimize=False),
+            "minimize",
+            minimize,
+        ),
+        # A rule whose final states were disabled
+        "dead branch": (
+            with_dead_branch(
+                parser.create_automaton("a.b*"),
+                parser.create_automaton(nth),
+            ),
+            "determinize",
+            determinize,
+        ),
+    }
+
+    rows = []
+    for name, (automaton, conversion_name, conversion) in cases.items():
+        trimmed = automaton.trim()
+        assert trimmed.trim_stats is not None
+        plain = best_time(lambda: conversion(automaton, False), repeat=1)
+        with_trim = best_time(lambda: conversion(automaton, True), repeat=1)
+        rows.append((
+            name,
+            len(automaton.states),
+            trimmed.trim_stats.unreachable + trimmed.trim_stats.dead,
+            f"{best_time(automaton.trim) * 1e3:.1f}",
+            conversion_name,
+            f"{plain * 1e3:.1f}",
+            f"{with_trim * 1e3:.1f}",
+        ))
+
+    print_table(
+        (
+            "automaton",
+            "states",
+            "removed",
+            "trim ms",
+            "conversion",
+            "ms",
+            "with trim=True ms",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()